@@ -0,0 +1,78 @@
+"""Benchmark parsing commit messages with `proman.manager.commit.CommitManager`.
+
+Parses 1,000 synthetic messages of the dev commit types in the project's own metadata,
+one by one with `create_from_msg` and at once with `create_from_msgs`,
+checks that both give the same commits, and times repeated syntax lookups.
+
+Usage: `python benchmarks/bench_commit_parse.py [NUM_MESSAGES]` from the `.control` directory.
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pyserials as ps
+
+from proman.manager.commit import CommitManager
+
+_METADATA_PATH = Path(__file__).resolve().parents[2] / ".data" / ".metadata.json"
+
+
+class FakeManager:
+    """Manager stand-in, providing only the metadata."""
+
+    def __init__(self, data: dict):
+        self.data = ps.NestedDict(data)
+        self.jinja_env_vars = {}
+        return
+
+
+def messages(dev_commits: list[dict], num_messages: int) -> list[str]:
+    rng = random.Random(0)
+    out = []
+    for idx in range(num_messages):
+        commit = rng.choice(dev_commits)
+        scope = commit.get("scope")
+        if isinstance(scope, str):
+            scope = [scope]
+        scope_str = f"({', '.join(scope)})" if scope else ""
+        out.append(f"{commit['type']}{scope_str}: change number {idx}\n\nBody of commit {idx}.")
+    return out
+
+
+def _summary(commits) -> list[tuple]:
+    return [
+        (commit.type, commit.scope, commit.description, commit.body, commit.dev_id)
+        for commit in commits
+    ]
+
+
+def main(num_messages: int) -> None:
+    data = json.loads(_METADATA_PATH.read_text())
+    msgs = messages(list(data["commit"]["dev"].values()), num_messages)
+    manager = CommitManager(FakeManager(data))
+    start = time.perf_counter()
+    single = [manager.create_from_msg(msg) for msg in msgs]
+    time_single = time.perf_counter() - start
+    start = time.perf_counter()
+    bulk = manager.create_from_msgs(msgs)
+    time_bulk = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(num_messages):
+        manager.msg_parser  # noqa: B018
+    time_lookup = time.perf_counter() - start
+    print(
+        f"{num_messages} messages: create_from_msg {time_single:.3f} s, "
+        f"create_from_msgs {time_bulk:.3f} s, identical: {_summary(single) == _summary(bulk)}, "
+        f"dev commits: {sum(commit.dev_id is not None for commit in bulk)}; "
+        f"{num_messages} parser lookups: {time_lookup * 1000:.2f} ms"
+    )
+    return
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
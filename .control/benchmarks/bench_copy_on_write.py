@@ -0,0 +1,88 @@
+"""Benchmark peak memory of the updated metadata in cached control center runs.
+
+Compares deep-copying the previous metadata (and deep-copying the snapshots
+that were compared between the branch and updated managers)
+against layering a `proman.util.cow.CopyOnWriteDict` over it
+(and comparing the digests of the snapshots instead), on synthetic data.
+Each mode runs in a separate process, so their peak RSS can be compared.
+
+Usage: `python benchmarks/bench_copy_on_write.py [NUM_KEYS]` from the `.control` directory.
+"""
+
+import copy
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pyserials as ps
+
+from proman.util import hash_tree
+from proman.util.cow import CopyOnWriteDict
+
+
+def generate(num_keys: int) -> dict:
+    return {
+        f"k{i}": {
+            "name": f"value {i} " * 5,
+            "list": list(range(10)),
+            "sub": {"a": str(i), "b": i * 1.5},
+        }
+        for i in range(num_keys)
+    }
+
+
+def metadata(num_keys: int) -> ps.NestedDict:
+    """Metadata with ten packages, changelogs, contributors, and variables."""
+    return ps.NestedDict(
+        {
+            **{f"pypkg_{i}": generate(num_keys) for i in range(10)},
+            "changelogs": [generate(num_keys // 40) for _ in range(200)],
+            "contributor": generate(num_keys * 5 // 2),
+            "variable": generate(num_keys // 4),
+            "project": {"file": {}, "file_digest": {}},
+        }
+    )
+
+
+def run(mode: str, num_keys: int) -> None:
+    data_before = metadata(num_keys)
+    rss_loaded = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "deepcopy":
+        data = ps.NestedDict(copy.deepcopy(data_before()))
+        snapshot = copy.deepcopy
+    else:
+        data = CopyOnWriteDict(data_before)
+        snapshot = hash_tree.digest
+    snapshots = [
+        snapshot(manager_data[key])
+        for manager_data in (data_before, data)
+        for key in ("variable", "contributor", "changelogs")
+    ]
+    data["project.file"] = {"path": "content"}
+    data["project.file_digest"] = {"path": "digest"}
+    elapsed = time.perf_counter() - start
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"{mode:<13}: {elapsed:5.2f} s, peak RSS {rss_peak / 1024:6.0f} MB "
+        f"(+{(rss_peak - rss_loaded) / 1024:.0f} MB over the loaded metadata), "
+        f"{len(snapshots)} snapshots"
+    )
+    return
+
+
+def main(num_keys: int) -> None:
+    for mode in ("deepcopy", "copy-on-write"):
+        subprocess.run([sys.executable, __file__, str(num_keys), mode], check=True)
+    return
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        run(mode=sys.argv[2], num_keys=int(sys.argv[1]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,110 @@
+"""Benchmark template resolution of control center data.
+
+Compares `NestedDict.fill` (with the memoized JSONPath parser)
+against `proman.data_resolver.DataResolver` on synthetic data,
+and checks that both give the same result.
+Each timing is the best of five alternating runs, excluding the copying of the input data.
+
+Usage: `python benchmarks/bench_data_resolver.py [NUM_KEYS ...]` from the `.control` directory.
+"""
+
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import pyserials as ps
+
+from proman import const
+from proman.data_resolver import DataResolver
+from proman.util import jsonpath
+
+
+def make(data: dict) -> ps.NestedDict:
+    return ps.NestedDict(
+        data,
+        code_context={},
+        code_context_partial={
+            "get_prefix": lambda get, prefix: [get(key) for key in data if key.startswith(prefix)]
+        },
+        relative_template_keys=const.RELATIVE_TEMPLATE_KEYS,
+        relative_key_key="__key__",
+    )
+
+
+def random_refs(num_keys: int) -> dict:
+    """Keys referencing up to three random earlier keys; every fifth key is a literal."""
+    rng = random.Random(0)
+    data = {"root": {"v0": "base"}}
+    for i in range(1, num_keys):
+        refs = rng.sample(range(i), min(i, 3))
+        data["root"][f"v{i}"] = (
+            "-".join(f"${{{{ root.v{j} }}}}$" for j in refs) if i % 5 else f"x{i}"
+        )
+    return data
+
+
+def grouped(num_keys: int) -> dict:
+    """Groups of 50 keys, each referencing the same key in the previous group."""
+    return {
+        f"g{group}": {
+            f"k{key}": f"${{{{ g{group - 1}.k{key} }}}}$/{group}" if group else f"v{key}"
+            for key in range(50)
+        }
+        for group in range(num_keys // 50)
+    }
+
+
+def run_fill(data: dict) -> tuple[float, ps.NestedDict]:
+    nested_dict = make(copy.deepcopy(data))
+    start = time.perf_counter()
+    with jsonpath.memoized_parser():
+        nested_dict.fill()
+    return time.perf_counter() - start, nested_dict
+
+
+def run_resolver(data: dict) -> tuple[float, ps.NestedDict]:
+    resolver = DataResolver()
+    nested_dict = make(copy.deepcopy(data))
+    start = time.perf_counter()
+    resolver.resolve(nested_dict)
+    return time.perf_counter() - start, nested_dict
+
+
+def hooks(num_keys: int) -> dict:
+    """Like `random_refs`, but every tenth key is a code block referencing an earlier key."""
+    data = random_refs(num_keys)
+    for i in range(10, num_keys, 10):
+        data["root"][f"v{i}"] = f"#{{{{ return get('root.v{i - 3}') + '!' }}}}#"
+    return data
+
+
+def main(sizes: list[int], repeats: int = 5) -> None:
+    # Warm up both paths (imports, logger setup) before timing.
+    run_fill(grouped(50))
+    run_resolver(grouped(50))
+    for num_keys in sizes:
+        for name, generator in (("random refs", random_refs), ("grouped", grouped), ("hooks", hooks)):
+            data = generator(num_keys)
+            times_fill = []
+            times_resolver = []
+            # Alternate the two runs, and take the best of each, to cancel out drift.
+            for _ in range(repeats):
+                time_fill, reference = run_fill(data)
+                time_resolver, resolved = run_resolver(data)
+                times_fill.append(time_fill)
+                times_resolver.append(time_resolver)
+            time_fill = min(times_fill)
+            time_resolver = min(times_resolver)
+            print(
+                f"{num_keys:>6} keys, {name:<11}: fill() {time_fill:6.2f} s, "
+                f"resolver {time_resolver:6.2f} s, identical: {reference() == resolved()}"
+            )
+    return
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [500, 5000])
@@ -0,0 +1,127 @@
+"""Benchmark classification of changed files in the change detector.
+
+Compares `proman.script.change_detector._FiletypeClassifier`
+against checking the filetype patterns one by one (in the order of each list)
+on 100,000 synthetic paths plus all pattern paths, and checks that both give the same result.
+It also compares looking up the dynamic file paths in a list and a set.
+
+Usage: `python benchmarks/bench_filetype_classifier.py [NUM_PATHS]` from the `.control` directory.
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from proman.dtype import RepoFileType
+from proman.script.change_detector import _FiletypeClassifier
+
+PATHS_ABS = [
+    (RepoFileType.CONFIG, "Metadata", ".github/.repodynamics/metadata.json"),
+    (RepoFileType.CONFIG, "Git Ignore", ".gitignore"),
+    (RepoFileType.CONFIG, "Citation", "CITATION.cff"),
+    (RepoFileType.PKG_CONFIG, "Typing Marker", "pkg/src/mypkg/py.typed"),
+    (RepoFileType.PKG_CONFIG, "PyProject", "pkg/pyproject.toml"),
+    (RepoFileType.TEST_CONFIG, "PyProject", "pkg/tests/pyproject.toml"),
+]
+PATHS_START = [
+    (RepoFileType.CC, "Custom Hook", ".control/config/hook/"),
+    (RepoFileType.PKG_SOURCE, None, "pkg/src/"),
+    (RepoFileType.PKG_CONFIG, None, "pkg/"),
+    (RepoFileType.TEST_SOURCE, None, "pkg/tests/src/"),
+    (RepoFileType.TEST_CONFIG, None, "pkg/tests/"),
+    (RepoFileType.WEB_SOURCE, None, "docs/website/"),
+    (RepoFileType.WEB_CONFIG, None, "docs/"),
+    (RepoFileType.THEME, "–", ".control/theme/"),
+]
+PATHS_REGEX = [
+    (RepoFileType.CC, "Source", re.compile(r"^\.control/[^/]+\.(?i:y?aml)$")),
+    (
+        RepoFileType.ISSUE_FORM,
+        None,
+        re.compile(r"^\.github/ISSUE_TEMPLATE/(?!config\.ya?ml$)[^/]+\.(?i:y?aml)$"),
+    ),
+    (RepoFileType.ISSUE_TEMPLATE, None, re.compile(r"^\.github/ISSUE_TEMPLATE/[^/]+\.(?i:md)$")),
+    (
+        RepoFileType.PULL_TEMPLATE,
+        "default",
+        re.compile(r"^(?:|\.github/|docs/)pull_request_template(?:\.(txt|md|rst))?$"),
+    ),
+    (RepoFileType.CONFIG, "Code Owners", re.compile(r"^(?:|\.github/|docs/)CODEOWNERS$")),
+    (RepoFileType.CONFIG, "License", re.compile(r"^LICENSE(?:\.(txt|md|rst))?$")),
+    (
+        RepoFileType.README,
+        "main",
+        re.compile(r"^(?:|\.github/|docs/)README(?:\.(txt|md|rst|html))?$"),
+    ),
+    (RepoFileType.README, "–", re.compile(r"/README(?i:\.(txt|md|rst|html))?$")),
+    (
+        RepoFileType.HEALTH,
+        None,
+        re.compile(r"^(?:|\.github/|docs/)(?:(?i:CONTRIBUTING)|SECURITY)(?i:\.(txt|md|rst))?$"),
+    ),
+    (RepoFileType.WORKFLOW, None, re.compile(r"^\.github/workflows/[^/]+\.(?i:y?aml)$")),
+]
+DIRNAMES = [
+    "pkg", "src", "mypkg", "tests", "docs", "website", ".github", "ISSUE_TEMPLATE", "workflows",
+    ".control", "config", "hook", "theme", "sub", "a",
+]
+FILENAMES = [
+    "README.md", "readme.rst", "x.py", "c.yaml", "config.yml", "LICENSE", "CODEOWNERS",
+    "pyproject.toml", "py.typed", "CONTRIBUTING.md", "SECURITY.rst", "pull_request_template.md",
+    "z.txt", "metadata.json",
+]
+
+
+def classify_sequential(path: str) -> tuple[RepoFileType, str | None]:
+    for filetype, subtype, abs_path in PATHS_ABS:
+        if path == abs_path:
+            return filetype, subtype
+    for filetype, subtype, pattern in PATHS_REGEX:
+        if pattern.search(path):
+            return filetype, subtype
+    for filetype, subtype, start_path in PATHS_START:
+        if path.startswith(start_path):
+            return filetype, subtype
+    return RepoFileType.OTHER, "–"
+
+
+def main(num_paths: int) -> None:
+    rng = random.Random(0)
+    paths = [
+        "/".join([*rng.choices(DIRNAMES, k=rng.randint(0, 5)), rng.choice(FILENAMES)])
+        for _ in range(num_paths)
+    ]
+    paths += [path for _, _, path in PATHS_ABS] + [f"{path}x.py" for _, _, path in PATHS_START]
+    start = time.perf_counter()
+    expected = [classify_sequential(path) for path in paths]
+    time_sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    classifier = _FiletypeClassifier(PATHS_ABS, PATHS_START, PATHS_REGEX)
+    result = [classifier(path) for path in paths]
+    time_classifier = time.perf_counter() - start
+    print(
+        f"classify {len(paths)} paths: sequential {time_sequential:.3f} s, "
+        f"classifier {time_classifier:.3f} s, identical: {expected == result}"
+    )
+    dynamic_files = [f"gen/file{idx}.txt" for idx in range(20_000)]
+    queries = paths[:2000]
+    start = time.perf_counter()
+    sum(path in dynamic_files for path in queries)
+    time_list = time.perf_counter() - start
+    dynamic_files_set = set(dynamic_files)
+    start = time.perf_counter()
+    sum(path in dynamic_files_set for path in queries)
+    time_set = time.perf_counter() - start
+    print(
+        f"look up {len(queries)} paths in {len(dynamic_files)} dynamic files: "
+        f"list {time_list:.3f} s, set {time_set:.5f} s"
+    )
+    return
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
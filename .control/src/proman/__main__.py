@@ -265,6 +265,18 @@ def _parse_args() -> argparse.Namespace:
         help=f"Ignore the metadata.json file and start from scratch.",
         action=f"store_true",
     )
+    subparser_cca.add_argument(
+        "-i",
+        "--incremental",
+        help=f"Skip data generation when control center inputs are unchanged since the last run.",
+        action=f"store_true",
+    )
+    subparser_cca.add_argument(
+        "-o",
+        "--offline",
+        help=f"Only use cached data for extension tags in control center configurations.",
+        action=f"store_true",
+    )
     subparser_cca.set_defaults(endpoint="cca.run_cli")
     subparser_lint = subparsers_main.add_parser(
         "lint",
@@ -283,6 +295,13 @@ def _parse_args() -> argparse.Namespace:
         "--to-ref",
         help=f"Run on files changed until the given git ref. This must be accompanied by --from-ref.",
     )
+    subparser_lint.add_argument(
+        "-w",
+        "--max-workers",
+        help=f"Maximum number of hooks to run concurrently, among hooks that do not modify files.",
+        type=int,
+        default=1,
+    )
     subparser_lint_mutually_exclusive_hook = subparser_lint.add_mutually_exclusive_group()
     subparser_lint_mutually_exclusive_hook.add_argument(
         "-i",
@@ -0,0 +1,257 @@
+"""Local cache for data retrieved from web APIs."""
+
+from __future__ import annotations as _annotations
+
+import datetime as _datetime
+import os as _os
+import tempfile as _tempfile
+from pathlib import Path as _Path
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import mdit as _mdit
+import pyserials as _ps
+from loggerman import logger as _logger
+
+if _TYPE_CHECKING:
+    from typing import Any
+
+
+class CacheManager:
+    """Sharded, size-bounded cache with per-type retention times.
+
+    Each cache type (e.g., `user`, `doi`) is stored in a separate YAML file (shard)
+    in the cache directory, and only shards with new or removed entries
+    are written on `save`.
+    Entries older than the retention time of their type are evicted when loaded or retrieved,
+    and when a type holds more than `max_entries` entries,
+    the least recently used ones are evicted.
+    Entries are kept in recency order within each shard,
+    so the LRU order persists between runs.
+
+    Parameters
+    ----------
+    retention_time
+        Retention time of each cache type.
+        A zero duration means entries of that type never expire.
+    path
+        Path to the cache directory.
+        If not provided, the cache is only kept in memory.
+    max_entries
+        Maximum number of entries per cache type.
+        A value of zero means no limit.
+    legacy_path
+        Path to a single-file cache from older versions.
+        If it exists, its entries are migrated to the sharded cache.
+    """
+
+    def __init__(
+        self,
+        retention_time: dict[str, _datetime.timedelta],
+        path: str | _Path | None = None,
+        max_entries: int = 0,
+        legacy_path: str | _Path | None = None,
+    ):
+        self._path = _Path(path).resolve() if path else None
+        self._retention_time = retention_time
+        self._max_entries = max_entries
+        self._cache: dict[str, dict[str, dict]] = {}
+        self._dirty: set[str] = set()
+        self._stats: dict[str, dict[str, int]] = {}
+        if not self._path:
+            _logger.warning(
+                "Cache Initialization",
+                "No path provided for control center cache. Initialized an in-memory cache.",
+            )
+            return
+        if self._path.is_dir():
+            for shard_path in sorted(self._path.glob("*.yaml")):
+                self._load_shard(typ=shard_path.stem, shard=self._read_file(shard_path))
+        if legacy_path and not self._cache:
+            legacy_path = _Path(legacy_path).resolve()
+            if legacy_path.is_file():
+                for typ, shard in (self._read_file(legacy_path) or {}).items():
+                    self._load_shard(typ=typ, shard=shard)
+                self._dirty.update(self._cache)
+        _logger.success(
+            "Cache Initialization",
+            _mdit.inline_container(
+                f"Loaded {sum(len(shard) for shard in self._cache.values())} entries "
+                f"of {len(self._cache)} types from control center cache at ",
+                _mdit.element.code_span(str(self._path)),
+                ".",
+            ),
+        )
+        return
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Number of hits, misses, and evictions (due to expiration or size limit) per cache type."""
+        return self._stats
+
+    def get(self, typ: str, key: str) -> Any:
+        """Retrieve an entry from the cache.
+
+        Returns
+        -------
+        The cached data, or `None` if the entry does not exist or has expired.
+        """
+        log_title = _mdit.inline_container(
+            "Cache Retrieval for ", _mdit.element.code_span(f"{typ}.{key}")
+        )
+        if typ not in self._retention_time:
+            _logger.warning(
+                log_title,
+                _mdit.inline_container(
+                    "Retention time not defined for cache type ",
+                    _mdit.element.code_span(typ),
+                    ". Skipped cache retrieval.",
+                ),
+            )
+            return None
+        stats = self._type_stats(typ)
+        shard = self._cache.get(typ, {})
+        item = shard.get(key)
+        if not item:
+            stats["misses"] += 1
+            _logger.info(log_title, "Item not found.")
+            return None
+        if self._is_expired(typ, item["timestamp"]):
+            self._evict(typ, key, reason="expired")
+            stats["misses"] += 1
+            _logger.info(
+                log_title,
+                f"Item expired.\n- Timestamp: {item['timestamp']}\n- Retention Time: {self._retention_time[typ]}",
+            )
+            return None
+        # Move to the end to mark as most recently used,
+        # and mark the shard as modified so the new order is saved for eviction in later runs.
+        if next(reversed(shard)) != key:
+            shard[key] = shard.pop(key)
+            self._dirty.add(typ)
+        stats["hits"] += 1
+        _logger.info(
+            log_title,
+            "Item found.",
+            _mdit.element.code_block(_ps.write.to_yaml_string(item["data"]), language="yaml"),
+        )
+        return item["data"]
+
+    def set(self, typ: str, key: str, value: dict | list | str | float | bool) -> None:
+        """Add or update an entry in the cache."""
+        shard = self._cache.setdefault(typ, {})
+        shard.pop(key, None)
+        shard[key] = {
+            "timestamp": _datetime.datetime.now(tz=_datetime.UTC).isoformat(),
+            "data": value,
+        }
+        self._dirty.add(typ)
+        self._enforce_size(typ)
+        _logger.info(
+            _mdit.inline_container("Cache Set for ", _mdit.element.code_span(f"{typ}.{key}")),
+            _mdit.element.code_block(_ps.write.to_yaml_string(value), language="yaml"),
+        )
+        return
+
+    def save(self) -> None:
+        """Write all modified cache types to their shard files."""
+        log_title = "Cache Save"
+        if not self._path:
+            _logger.warning(
+                log_title, "No path provided for control center cache. Skipped saving cache."
+            )
+            return
+        if not self._dirty:
+            _logger.info(log_title, "No changes to save.")
+            return
+        self._path.mkdir(parents=True, exist_ok=True)
+        for typ in sorted(self._dirty):
+            shard_path = self._path / f"{typ}.yaml"
+            shard = self._cache.get(typ)
+            if not shard:
+                shard_path.unlink(missing_ok=True)
+                continue
+            fd, temp_path = _tempfile.mkstemp(dir=self._path, prefix=f".{typ}.", suffix=".tmp")
+            _os.close(fd)
+            _ps.write.to_yaml_file(data=shard, path=temp_path)
+            _os.replace(temp_path, shard_path)
+        _logger.success(
+            log_title,
+            _mdit.inline_container(
+                f"Saved {len(self._dirty)} modified cache types (",
+                ", ".join(sorted(self._dirty)),
+                ") to ",
+                _mdit.element.code_span(str(self._path)),
+                ".",
+            ),
+        )
+        self._dirty.clear()
+        return
+
+    def data(self) -> dict[str, dict[str, Any]]:
+        """Get all cached data (without timestamps) per cache type."""
+        return {
+            typ: {key: item["data"] for key, item in shard.items()}
+            for typ, shard in self._cache.items()
+        }
+
+    def _load_shard(self, typ: str, shard: dict | None) -> None:
+        if not isinstance(shard, dict):
+            return
+        if typ not in self._retention_time:
+            _logger.warning(
+                "Cache Initialization",
+                _mdit.inline_container(
+                    "Retention time not defined for cache type ",
+                    _mdit.element.code_span(typ),
+                    ". Discarded its entries.",
+                ),
+            )
+            self._cache[typ] = {}
+            self._dirty.add(typ)
+            return
+        self._cache[typ] = {
+            key: item for key, item in shard.items()
+            if isinstance(item, dict) and "timestamp" in item and "data" in item
+        }
+        for key, item in list(self._cache[typ].items()):
+            if self._is_expired(typ, item["timestamp"]):
+                self._evict(typ, key, reason="expired")
+        self._enforce_size(typ)
+        return
+
+    def _read_file(self, path: _Path) -> dict | None:
+        try:
+            return _ps.read.yaml_from_file(path=path)
+        except _ps.exception.read.PySerialsReadException:
+            _logger.warning(
+                "Cache Initialization",
+                _mdit.inline_container(
+                    "Failed to read the cache file at ",
+                    _mdit.element.code_span(str(path)),
+                    ". Discarded its entries.",
+                ),
+                _logger.traceback(),
+            )
+            return None
+
+    def _enforce_size(self, typ: str) -> None:
+        shard = self._cache[typ]
+        while self._max_entries and len(shard) > self._max_entries:
+            self._evict(typ, next(iter(shard)), reason="evicted")
+        return
+
+    def _evict(self, typ: str, key: str, reason: str) -> None:
+        del self._cache[typ][key]
+        self._type_stats(typ)[reason] += 1
+        self._dirty.add(typ)
+        return
+
+    def _type_stats(self, typ: str) -> dict[str, int]:
+        return self._stats.setdefault(typ, {"hits": 0, "misses": 0, "expired": 0, "evicted": 0})
+
+    def _is_expired(self, typ: str, timestamp: str) -> bool:
+        time_delta = self._retention_time.get(typ)
+        if not time_delta:
+            return False
+        exp_date = _datetime.datetime.fromisoformat(timestamp).astimezone(_datetime.UTC) + time_delta
+        return exp_date <= _datetime.datetime.now(tz=_datetime.UTC)
@@ -0,0 +1,234 @@
+"""Fetch and cache external data of extension tags in control center configurations."""
+
+from __future__ import annotations as _annotations
+
+import datetime as _datetime
+from concurrent import futures as _futures
+from pathlib import Path as _Path
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import mdit as _mdit
+import pylinks as _pylinks
+import pyserials as _ps
+import ruamel.yaml as _yaml
+from loggerman import logger as _logger
+from pylinks.exception.api import WebAPIError as _WebAPIError
+
+if _TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class ExtensionFetcher:
+    """Fetcher for external data referenced by extension tags (e.g., `!ext`).
+
+    All URLs can be prefetched concurrently before the configuration files are parsed,
+    so that YAML construction does not block on each download.
+    Raw payloads are stored in an HTTP cache file
+    together with their `ETag` and `Last-Modified` validators.
+    Entries younger than the TTL are used as is;
+    older entries are revalidated with a conditional request,
+    so unchanged payloads are not downloaded again.
+
+    Parameters
+    ----------
+    tag_name
+        Name of the extension tag, including the leading `!`.
+    cache_path
+        Path to the HTTP cache file.
+        If not provided, payloads are only cached in memory.
+    ttl
+        Time after which cached payloads are revalidated.
+        A zero duration means cached payloads never expire.
+    offline
+        Only use cached payloads, regardless of their age,
+        and never send any requests.
+    max_workers
+        Maximum number of concurrent downloads.
+    """
+
+    def __init__(
+        self,
+        tag_name: str = "!ext",
+        cache_path: str | _Path | None = None,
+        ttl: _datetime.timedelta = _datetime.timedelta(),
+        offline: bool = False,
+        max_workers: int = 8,
+    ):
+        self._tag_name = tag_name
+        self._path = _Path(cache_path) if cache_path else None
+        self._ttl = ttl
+        self._offline = offline
+        self._max_workers = max_workers
+        self._yaml = _yaml.YAML(typ="safe")
+        self._cache: dict[str, dict] = self._read_cache()
+        self._results: dict[str, str | _WebAPIError | None] = {}
+        self._stats = {"cached": 0, "not_modified": 0, "downloaded": 0, "failed": 0, "unavailable": 0}
+        return
+
+    @property
+    def offline(self) -> bool:
+        """Whether only cached payloads are used."""
+        return self._offline
+
+    def scan(self, content: str) -> list[str]:
+        """Find all extension tag values in a YAML string.
+
+        The string is only composed into a node graph, without constructing any data,
+        so that tags are found exactly as the loader sees them.
+        Invalid YAML strings are ignored here; they are reported when loaded.
+        """
+        if self._tag_name not in content:
+            return []
+        try:
+            root = self._yaml.compose(content)
+        except _yaml.YAMLError:
+            return []
+        tag_values = []
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _yaml.MappingNode):
+                for key, value in node.value:
+                    stack.extend((key, value))
+            elif isinstance(node, _yaml.SequenceNode):
+                stack.extend(node.value)
+            elif node.tag == self._tag_name and node.value:
+                tag_values.append(node.value)
+        return tag_values
+
+    def prefetch(self, tag_values: Iterable[str]) -> None:
+        """Fetch all URLs of the given extension tag values concurrently.
+
+        YAML payloads are scanned for nested extension tags,
+        which are then fetched in the next round.
+        Errors are not raised here, but when the payload is requested via `get`,
+        so that they are reported for the tag that caused them.
+        """
+        urls = self._new_urls(tag_values)
+        if not urls:
+            return
+        with _futures.ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="proman-ext-fetch"
+        ) as executor:
+            while urls:
+                fetched = list(zip(urls, executor.map(self._fetch_safe, urls)))
+                nested = []
+                for url, (result, status) in fetched:
+                    self._results[url] = result
+                    self._stats[status] += 1
+                    if isinstance(result, str) and _is_yaml(url):
+                        nested.extend(self.scan(result))
+                urls = self._new_urls(nested)
+        _logger.info(
+            "External Data Prefetch",
+            _mdit.element.unordered_list(
+                [f"{key.replace('_', ' ').capitalize()}: {value}" for key, value in self._stats.items()]
+            ),
+        )
+        return
+
+    def get(self, url: str) -> str | None:
+        """Get the payload of a URL.
+
+        Parameters
+        ----------
+        url
+            URL to get the payload from.
+
+        Returns
+        -------
+        The payload of the URL,
+        or `None` if in offline mode and no cached payload is available.
+
+        Raises
+        ------
+        pylinks.exception.api.WebAPIError
+            If the download fails.
+        """
+        if url not in self._results:
+            self._results[url], status = self._fetch_safe(url)
+            self._stats[status] += 1
+        result = self._results[url]
+        if isinstance(result, _WebAPIError):
+            raise result
+        return result
+
+    def save(self) -> None:
+        """Write the HTTP cache file."""
+        if not self._path:
+            return
+        _ps.write.to_yaml_file(data=self._cache, path=self._path, make_dirs=True)
+        return
+
+    def _new_urls(self, tag_values: Iterable[str]) -> list[str]:
+        urls = []
+        for tag_value in tag_values:
+            url = tag_value.split(" ", 1)[0]
+            if url and url not in self._results and url not in urls:
+                urls.append(url)
+        return urls
+
+    def _fetch_safe(self, url: str) -> tuple[str | _WebAPIError | None, str]:
+        try:
+            return self._fetch(url)
+        except _WebAPIError as e:
+            return e, "failed"
+
+    def _fetch(self, url: str) -> tuple[str | None, str]:
+        """Fetch a URL, using the cache whenever possible.
+
+        This is run on worker threads, and thus must not log.
+
+        Returns
+        -------
+        The payload (or `None` if unavailable in offline mode),
+        and the status of the fetch, i.e., a key of `self._stats`.
+        """
+        entry = self._cache.get(url)
+        now = _datetime.datetime.now(tz=_datetime.UTC)
+        if entry and (
+            self._offline
+            or not self._ttl
+            or _datetime.datetime.fromisoformat(entry["timestamp"]) + self._ttl > now
+        ):
+            return entry["content"], "cached"
+        if self._offline:
+            return None, "unavailable"
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        response = _pylinks.http.request(url=url, verb="GET", headers=headers or None)
+        if response.status_code == 304 and entry:
+            entry["timestamp"] = now.isoformat()
+            return entry["content"], "not_modified"
+        self._cache[url] = {
+            "timestamp": now.isoformat(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content": response.text,
+        }
+        return response.text, "downloaded"
+
+    def _read_cache(self) -> dict[str, dict]:
+        if not self._path or not self._path.is_file():
+            return {}
+        try:
+            cache = _ps.read.yaml_from_file(path=self._path)
+        except _ps.exception.read.PySerialsReadException:
+            _logger.warning(
+                "External Data Cache",
+                _mdit.inline_container(
+                    "Failed to read the cache file at ",
+                    _mdit.element.code_span(str(self._path)),
+                    "; initialized a new cache.",
+                ),
+            )
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+
+def _is_yaml(url: str) -> bool:
+    return url.split(".")[-1].lower() in ("yaml", "yml")
@@ -0,0 +1,375 @@
+"""Resolve templates in control center data, checking code blocks for reference cycles first."""
+
+from __future__ import annotations as _annotations
+
+import functools as _functools
+import json as _json
+import re as _re
+import time as _time
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from loggerman import logger as _logger
+
+from proman import const as _const
+from proman import exception
+from proman.util import jsonpath as _jsonpath_util
+
+if _TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+    from pyserials.nested_dict import NestedDict
+
+
+_PATTERN_CODE = _re.compile(r"#\{\{(.*?)\}\}#", _re.DOTALL)
+_PATTERN_LIST = _re.compile(r"\$\[\[(.*?)\]\]\$", _re.DOTALL)
+_PATTERN_UNPACK = _re.compile(r"\*\{\{(.*?)\}\}\*", _re.DOTALL)
+_PATTERN_GETTER = _re.compile(r"(?<![\w.])(get|get_prefix)\(\s*(['\"])(.+?)\2")
+_PATTERN_TEMPLATE = _re.compile(r"\$\{\{|\$\[\[|#\{\{|\*\{\{")
+_NON_STATIC_CHARS = set("{}$#*?@()'\"")
+_END = object()
+
+
+class DataResolver:
+    """Template resolver that checks code blocks for reference cycles up front.
+
+    The templater fills all keys in a single pass,
+    caching each looked up reference, so that each code block (e.g., inline hooks)
+    only runs once, and only when a key referencing it is filled.
+    However, it only detects a reference cycle once the whole cycle has been walked,
+    including code blocks that may be expensive to run.
+    Therefore, before filling, all `${{ ... }}$`, `$[[ ... ]]$`, `*{{ ... }}*`
+    references and literal `get(...)` calls in code blocks
+    are extracted into a dependency graph,
+    starting from keys with code blocks and following only their (transitive) dependencies,
+    and the graph is checked for cycles,
+    so they are reported with the full reference chain before any code block runs.
+    Data without code blocks is filled without walking it or building a graph at all.
+
+    Keys under relative template keys (i.e., `__temp__`) are not part of the graph,
+    since their values depend on where they are referenced from.
+    References that cannot be determined statically
+    (e.g., nested templates or JSONPath filters) are left to the templater,
+    which resolves them on demand.
+
+    Parameters
+    ----------
+    relative_template_keys
+        Keys whose values are relative templates.
+    """
+
+    def __init__(self, relative_template_keys: list[str] | None = None):
+        self._template_keys = set(
+            _const.RELATIVE_TEMPLATE_KEYS if relative_template_keys is None else relative_template_keys
+        )
+        self._data: NestedDict | None = None
+        self._units: dict[tuple[str, ...], bool] = {}
+        self._code_units: set[tuple[str, ...]] = set()
+        self._unit_trie: dict = {}
+        self._templates: dict[tuple[str, ...], list[tuple[tuple, str]]] = {}
+        return
+
+    def resolve(self, data: NestedDict) -> None:
+        """Resolve all templates in the data in place.
+
+        Raises
+        ------
+        proman.exception.PromanTemplateCycleError
+            If a cycle is found between keys with code blocks and their dependencies.
+        """
+        start = _time.perf_counter()
+        self._data = data
+        if self._has_code():
+            self._collect()
+            graph = self._graph()
+            order = self._topological_order(graph)
+            _logger.info(
+                "Template Dependency Graph",
+                f"Checked {len(self._code_units)} keys with code blocks, "
+                f"depending on {len(order) - len(self._code_units)} other templated keys "
+                f"through {sum(len(deps) for deps in graph.values())} dependencies, "
+                f"in {_time.perf_counter() - start:.3f} s.",
+            )
+        else:
+            _logger.info(
+                "Template Dependency Graph",
+                "Found no code blocks; skipped the cycle check.",
+            )
+        with _jsonpath_util.memoized_parser():
+            data.fill()
+        return
+
+    def _has_code(self) -> bool:
+        """Check whether any key or value in the data may contain a code block."""
+        # Serializing the data is much faster than walking it in Python;
+        # false positives (e.g., in escaped strings) only cost the full walk.
+        return "#{{" in _json.dumps(self._data(), skipkeys=True, default=str)
+
+    def _collect(self) -> None:
+        """Find all templated keys and their references."""
+        stack: list[tuple[tuple, Any]] = [((), self._data())]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                for key, subvalue in value.items():
+                    if key in self._template_keys:
+                        continue
+                    if isinstance(key, str) and _is_template(key):
+                        self._add_unit(path=path, leaf_path=path, template=key)
+                    stack.append(((*path, key), subvalue))
+            elif isinstance(value, list):
+                stack.extend(((*path, idx), elem) for idx, elem in enumerate(value))
+            elif isinstance(value, str) and _is_template(value):
+                self._add_unit(path=path, leaf_path=path, template=value)
+        return
+
+    def _add_unit(self, path: tuple, leaf_path: tuple, template: str) -> None:
+        unit = self._unit_path(path)
+        if not unit:
+            return
+        is_leaf = unit == leaf_path and not any(key in self._template_keys for key in unit)
+        self._units[unit] = self._units.get(unit, True) and is_leaf
+        if _PATTERN_CODE.search(template):
+            self._code_units.add(unit)
+        node = self._unit_trie
+        for key in unit:
+            node = node.setdefault(key, {})
+        node[_END] = unit
+        self._templates.setdefault(unit, []).append((leaf_path, template))
+        return
+
+    def _add_refs(
+        self,
+        template: str,
+        base: tuple,
+        refs: set[tuple],
+        prefixes: set[str],
+        visited: set[tuple],
+    ) -> None:
+        for ref_str, is_prefix in _extract_references(template):
+            if is_prefix:
+                prefixes.add(ref_str)
+                continue
+            ref = _to_path(ref_str, base)
+            if not ref:
+                continue
+            if self._template_keys.isdisjoint(ref):
+                refs.add(ref)
+                continue
+            # Relative templates are resolved relative to the referencing key;
+            # follow them to find what they depend on.
+            if ref in visited:
+                continue
+            visited.add(ref)
+            for template_ in _iter_templates(self._get(ref)):
+                self._add_refs(
+                    template=template_, base=base, refs=refs, prefixes=prefixes, visited=visited
+                )
+        return
+
+    def _graph(self) -> dict[tuple, set[tuple]]:
+        """Create the dependency graph between keys with code blocks and their dependencies."""
+        subtree_cache: dict[int, list[tuple]] = {}
+        deps_cache: dict[tuple, list[tuple]] = {}
+        graph = {}
+        root_keys = list(self._data().keys())
+        stack = list(self._code_units)
+        while stack:
+            unit = stack.pop()
+            if unit in graph:
+                continue
+            refs = set()
+            prefixes = set()
+            for leaf_path, template in self._templates[unit]:
+                self._add_refs(
+                    template=template, base=leaf_path, refs=refs, prefixes=prefixes, visited=set()
+                )
+            for prefix in prefixes:
+                refs.update((key,) for key in root_keys if key.startswith(prefix))
+            deps = set()
+            for ref in refs:
+                ref_deps = deps_cache.get(ref)
+                if ref_deps is None:
+                    ref_deps = deps_cache[ref] = self._dependencies(ref, subtree_cache)
+                deps.update(ref_deps)
+            deps.discard(unit)
+            graph[unit] = deps
+            stack.extend(dep for dep in deps if dep not in graph)
+        return graph
+
+    def _dependencies(self, ref: tuple, subtree_cache: dict[int, list[tuple]]) -> list[tuple]:
+        deps = []
+        node = self._unit_trie
+        for idx, key in enumerate(ref):
+            node = node.get(key)
+            if node is None:
+                return deps
+            if _END in node and (idx == len(ref) - 1 or self._units[node[_END]]):
+                # Only templates that are whole values can be resolved
+                # before a reference into them can be looked up.
+                deps.append(node[_END])
+        deps.extend(_subtree_units(node, subtree_cache))
+        return deps
+
+    def _topological_order(self, graph: dict[tuple, set[tuple]]) -> list[tuple]:
+        """Sort templated keys so that each key comes after all its dependencies.
+
+        Raises
+        ------
+        proman.exception.PromanTemplateCycleError
+            If a cycle is found between keys whose values are templates.
+        """
+        order = []
+        state: dict[tuple, int] = {}  # 1: in progress, 2: done
+        for root in graph:
+            if root in state:
+                continue
+            state[root] = 1
+            stack = [(root, iter(sorted(graph[root], key=str)))]
+            while stack:
+                unit, deps = stack[-1]
+                for dep in deps:
+                    dep_state = state.get(dep)
+                    if dep_state == 2:
+                        continue
+                    if dep_state == 1:
+                        cycle = [elem[0] for elem in stack]
+                        cycle = cycle[cycle.index(dep):]
+                        if all(self._units[elem] for elem in cycle):
+                            raise exception.PromanTemplateCycleError(
+                                cycle=[".".join(map(str, elem)) for elem in cycle],
+                                data=self._data(),
+                            )
+                        # Cycles through container keys may be false positives
+                        # due to coarse graph nodes; the templater will detect real ones.
+                        continue
+                    state[dep] = 1
+                    stack.append((dep, iter(sorted(graph[dep], key=str))))
+                    break
+                else:
+                    state[unit] = 2
+                    order.append(unit)
+                    stack.pop()
+        return order
+
+    def _unit_path(self, path: tuple) -> tuple:
+        """Get the path of the nearest key that can be filled by `NestedDict.fill`."""
+        unit = []
+        for key in path:
+            if not isinstance(key, str) or "." in key or _is_template(key):
+                break
+            unit.append(key)
+        return tuple(unit)
+
+    def _get(self, path: tuple) -> Any:
+        value = self._data()
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        return value
+
+
+def _is_template(value: str) -> bool:
+    return _PATTERN_TEMPLATE.search(value) is not None
+
+
+# Start markers of the patterns in `_extract_references`,
+# so that patterns whose marker is not in a template are skipped.
+_PATTERNS_REFERENCE = [
+    *(
+        (
+            "$" + "{" * (2 + level),
+            _re.compile(
+                r"\$" + r"\{" * (2 + level) + " (.*?) " + r"\}" * (2 + level) + r"\$", _re.DOTALL
+            ),
+        )
+        for level in range(4)
+    ),
+    ("$[[", _PATTERN_LIST),
+    ("*{{", _PATTERN_UNPACK),
+]
+
+
+def _extract_references(template: str) -> Iterator[tuple[str, bool]]:
+    """Extract all statically determinable references from a template string.
+
+    Yields
+    ------
+    Tuples of the reference and a boolean indicating
+    whether it is a prefix for top-level keys (from `get_prefix`)
+    instead of a path.
+    """
+    for marker, pattern in _PATTERNS_REFERENCE:
+        if marker not in template:
+            continue
+        for match in pattern.finditer(template):
+            ref = match.group(1).strip()
+            if ref and not _NON_STATIC_CHARS.intersection(ref.split("[", 1)[0]):
+                yield ref, False
+    for code in _PATTERN_CODE.findall(template):
+        for func_name, _, ref in _PATTERN_GETTER.findall(code):
+            yield ref, func_name == "get_prefix"
+    return
+
+
+def _to_path(ref: str, base: tuple) -> tuple:
+    """Convert a (relative) JSONPath reference to a path tuple.
+
+    The path is cut at the first segment that is not a plain key
+    (e.g., indices, wildcards, and filters),
+    so that it points to the enclosing value.
+    """
+    num_periods, segments = _parse_reference(ref)
+    if not num_periods:
+        return segments
+    if not segments or segments == ("__key__",) or num_periods > len(base):
+        return ()
+    return (*base[: len(base) - num_periods], *segments)
+
+
+@_functools.cache
+def _parse_reference(ref: str) -> tuple[int, tuple]:
+    """Split a JSONPath reference into its number of leading periods and its plain keys."""
+    ref = ref.removeprefix("$.")
+    stripped = ref.lstrip(".")
+    segments = []
+    for segment in stripped.split("."):
+        name = segment.split("[", 1)[0]
+        if not name or _NON_STATIC_CHARS.intersection(name):
+            break
+        segments.append(name)
+        if name != segment:
+            break
+    return len(ref) - len(stripped), tuple(segments)
+
+
+def _iter_templates(value: Any) -> Iterator[str]:
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+            stack.extend(key for key in value if isinstance(key, str))
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and _is_template(value):
+            yield value
+    return
+
+
+def _subtree_units(node: dict, cache: dict[int, list[tuple]]) -> list[tuple]:
+    cached = cache.get(id(node))
+    if cached is not None:
+        return cached
+    units = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for key, child in current.items():
+            if key is _END:
+                units.append(child)
+            else:
+                stack.append(child)
+    cache[id(node)] = units
+    return units
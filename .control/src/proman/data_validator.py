@@ -1,5 +1,9 @@
 import copy
+import hashlib as _hashlib
+import os as _os
+import pickle as _pickle
 import re as _re
+from importlib import metadata as _importlib_metadata
 from pathlib import Path as _Path
 from typing import Literal as _Literal
 
@@ -17,6 +21,14 @@
 
 _schema_dir_path = _pkgdata.get_package_path_from_caller(top_level=True) / "schema"
 
+SCHEMA_CACHE_DIR_ENV_VAR = "PROMAN_SCHEMA_CACHE_DIR"
+"""Name of the environment variable pointing to the on-disk schema cache directory.
+
+When set, preprocessed schemas and registry resources are read from
+(and written to) a pickle file in this directory,
+keyed by a hash of all schema files.
+"""
+
 
 def get_schema(
     schema: _Literal[
@@ -38,27 +50,27 @@ def validate(
     before_substitution: bool = False,
     fill_defaults: bool = True,
 ) -> None:
-    """Validate data against a schema."""
-    schema_dict = get_schema(schema=schema)
-    _js.edit.required_last(schema_dict)
-    if schema == "main":
-        _add_custom_keys(schema_dict)
-    if before_substitution:
-        schema_dict = modify_schema(schema_dict)["anyOf"][0]
-    try:
-        _ps.validate.jsonschema(
-            data=data,
-            schema=schema_dict,
-            validator=_jsonschema.Draft202012Validator,
-            registry=_registry_before if before_substitution else _registry_after,
-            fill_defaults=fill_defaults,
-            iter_errors=True,
-        )
-    except _ps.exception.validate.PySerialsJsonSchemaValidationError as e:
+    """Validate data against a schema.
+
+    Compiled validators are memoized per schema variant
+    for the lifetime of the process,
+    so that each call only walks the data instance.
+    """
+    validator = _get_validator(
+        schema=schema, before_substitution=before_substitution, fill_defaults=fill_defaults
+    )
+    errors = list(validator.iter_errors(data))
+    if errors:
         raise exception.PromanSchemaValidationError(
             source=source,
             before_substitution=before_substitution,
-            cause=e,
+            cause=_ps.exception.validate.PySerialsJsonSchemaValidationError(
+                causes=errors,
+                data=data,
+                schema=validator.schema,
+                validator=validator,
+                registry=_registry_before if before_substitution else _registry_after,
+            ),
         ) from None
     if schema == "main" and not before_substitution:
         DataValidator(data=data, source=source).validate()
@@ -69,6 +81,63 @@ def validate(
     return
 
 
+def _get_validator(
+    schema: str, before_substitution: bool, fill_defaults: bool
+) -> _jsonschema.protocols.Validator:
+    """Get the compiled validator for a schema variant, compiling it on first use."""
+    key = (schema, before_substitution, fill_defaults)
+    validator = _validators.get(key)
+    if validator:
+        return validator
+    validator_class = _ValidatorWithDefaults if fill_defaults else _jsonschema.Draft202012Validator
+    validator = validator_class(
+        _get_preprocessed_schema(schema=schema, before_substitution=before_substitution),
+        registry=_registry_before if before_substitution else _registry_after,
+    )
+    _validators[key] = validator
+    return validator
+
+
+def _get_preprocessed_schema(schema: str, before_substitution: bool) -> dict:
+    """Get a schema with all modifications applied, preprocessing it on first use."""
+    key = f"{schema}/{int(before_substitution)}"
+    schema_dict = _schemas.get(key)
+    if schema_dict:
+        return schema_dict
+    schema_dict = get_schema(schema=schema)
+    _js.edit.required_last(schema_dict)
+    if schema == "main":
+        _add_custom_keys(schema_dict)
+    if before_substitution:
+        schema_dict = modify_schema(schema_dict)["anyOf"][0]
+    _schemas[key] = schema_dict
+    _write_disk_cache()
+    return schema_dict
+
+
+def _extend_with_default(
+    validator_class: type[_jsonschema.protocols.Validator],
+) -> type[_jsonschema.protocols.Validator]:
+    """Extend a validator class to fill in default values from the schema.
+
+    Defaults are deep-copied, since the compiled schemas are shared between calls,
+    and filled-in values may be mutated later on.
+    """
+    validate_properties = validator_class.VALIDATORS["properties"]
+
+    def set_defaults(validator, properties, instance, schema):
+        if isinstance(instance, dict):  # The entire dict instance may be templated
+            for property_, subschema in properties.items():
+                if "default" in subschema and property_ not in instance:
+                    instance[property_] = copy.deepcopy(subschema["default"])
+        yield from validate_properties(validator, properties, instance, schema)
+
+    return _jsonschema.validators.extend(validator_class, {"properties": set_defaults})
+
+
+_ValidatorWithDefaults = _extend_with_default(_jsonschema.Draft202012Validator)
+
+
 class DataValidator:
     def __init__(self, data: dict, source: _Literal["source", "compiled"] = "compiled"):
         self._data = _ps.nested_dict.NestedDict(data)
@@ -578,4 +647,97 @@ def retrieve_url(uri: str) -> str:
     return _ps.write.to_json_string(_ps.read.from_file(path=uri, toml_as_dict=True), sort_keys=False)
 
 
-_registry_before, _registry_after = _make_registry()
\ No newline at end of file
+_SPECIFICATIONS = {
+    spec.name: spec
+    for spec in (
+        _referencing_jsonschema.DRAFT202012,
+        _referencing_jsonschema.DRAFT201909,
+        _referencing_jsonschema.DRAFT7,
+        _referencing_jsonschema.DRAFT6,
+        _referencing_jsonschema.DRAFT4,
+        _referencing_jsonschema.DRAFT3,
+    )
+}
+
+
+def _disk_cache_filepath() -> _Path | None:
+    """Get the path to the on-disk schema cache file, if enabled.
+
+    The filename contains a hash of all schema files,
+    this module, and the versions of packages providing external schemas,
+    so that any change invalidates the cache.
+    """
+    cache_dir = _os.environ.get(SCHEMA_CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    hasher = _hashlib.sha256(_Path(__file__).read_bytes())
+    for schema_filepath in sorted(_schema_dir_path.glob("**/*.yaml")):
+        hasher.update(schema_filepath.relative_to(_schema_dir_path).as_posix().encode())
+        hasher.update(schema_filepath.read_bytes())
+    for package_name in ("jsonschemata", "mdit"):
+        hasher.update(_importlib_metadata.version(package_name).encode())
+    return _Path(cache_dir) / f"proman-schema-{hasher.hexdigest()[:32]}.pkl"
+
+
+def _serialize_registry(registry: _referencing.Registry) -> list[list]:
+    return [
+        [uri, registry[uri]._specification.name, registry[uri].contents] for uri in registry
+    ]
+
+
+def _deserialize_registry(resources: list[list]) -> _referencing.Registry:
+    return _referencing.Registry(retrieve=retrieve_url).with_resources(
+        [
+            (uri, _SPECIFICATIONS[spec_name].create_resource(contents))
+            for uri, spec_name, contents in resources
+        ]
+    ).crawl()
+
+
+def _read_disk_cache() -> tuple[_referencing.Registry, _referencing.Registry, dict] | None:
+    if not _disk_cache_filepath_:
+        return None
+    try:
+        cache = _pickle.loads(_disk_cache_filepath_.read_bytes())
+        return (
+            _deserialize_registry(cache["registry_before"]),
+            _deserialize_registry(cache["registry_after"]),
+            cache["schemas"],
+        )
+    except (OSError, _pickle.UnpicklingError, EOFError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_disk_cache() -> None:
+    if not _disk_cache_filepath_:
+        return
+    try:
+        content = _pickle.dumps(
+            {
+                "registry_before": _serialize_registry(_registry_before),
+                "registry_after": _serialize_registry(_registry_after),
+                "schemas": _schemas,
+            }
+        )
+    except (KeyError, TypeError, _pickle.PicklingError):
+        # Resources with unknown specifications cannot be cached
+        return
+    try:
+        _disk_cache_filepath_.parent.mkdir(parents=True, exist_ok=True)
+        temp_filepath = _disk_cache_filepath_.with_suffix(f".{_os.getpid()}.tmp")
+        temp_filepath.write_bytes(content)
+        temp_filepath.replace(_disk_cache_filepath_)
+    except OSError:
+        return
+    return
+
+
+_validators: dict[tuple[str, bool, bool], _jsonschema.protocols.Validator] = {}
+_disk_cache_filepath_ = _disk_cache_filepath()
+_disk_cache = _read_disk_cache()
+if _disk_cache:
+    _registry_before, _registry_after, _schemas = _disk_cache
+else:
+    _schemas: dict[str, dict] = {}
+    _registry_before, _registry_after = _make_registry()
+    _write_disk_cache()
\ No newline at end of file
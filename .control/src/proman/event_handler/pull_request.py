@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import re
-import time
 from typing import TYPE_CHECKING
 
 from github_contexts import github as _gh_context
@@ -18,8 +17,12 @@
 )
 from proman.event_handler.pull_request_target import PullRequestTargetEventHandler
 from proman.exception import PromanError
+from proman.script import change_detector
+from proman.util.remote_ref import RemoteRefWaiter
 
 if TYPE_CHECKING:
+    from gittidy import Git
+
     from proman.dstruct import (
         Commit,
         IssueForm,
@@ -55,6 +58,7 @@ def __init__(self, **kwargs):
         self._commits: list[Commit] = []
         self._base_version: Version = None
         self._head_version: Version = None
+        self._ref_waiter = RemoteRefWaiter()
         return
 
     @property
@@ -118,6 +122,7 @@ def _run_sync_other(self):
         return
 
     def _run_synchronize_dev(self):
+        changes = change_detector.run_change_detection(self, branch_manager=self.head_manager)
         tasklist = self.update_tasklist_and_contributors_from_commits()
         if not self.issue_form.commit.action:
             target_version = self.manager.release.next_local_version(self.base_version)
@@ -228,7 +233,12 @@ def _run_synchronize_dev(self):
             website_build=changes["web"],
             package_lint=changes["pkg"],
             test_lint=changes["test"],
-            package_test=changes["pkg"] or changes["test"],
+            package_test=(
+                changes["pkg"] or changes["test"]
+                if changes["test_pyargs"] is None
+                else bool(changes["test_pyargs"])
+            ),
+            package_test_pyargs=changes["test_pyargs"],
             package_publish_testpypi=publish_testpypi,
         )
         return
@@ -408,8 +418,12 @@ def _run_merge_dev_to_release(self):
 
         self._git_head.push()
         latest_hash = self._git_head.commit_hash_normal()
-        # Wait 30 s to make sure the push to head is registered
-        time.sleep(30)
+        if not self._wait_for_pull_head(sha=latest_hash):
+            logger.error(
+                "Pull request head was not updated on GitHub after the push. Please merge manually."
+            )
+            self._failed = True
+            return
 
         merge_response = self._merge_pull(conv_type=primary_commit.conv_type, sha=latest_hash)
         if not merge_response:
@@ -430,14 +444,12 @@ def _run_merge_dev_to_release(self):
             )
             return
 
-        for i in range(100):
-            self._git_base.pull()
-            if self._git_base.commit_hash_normal() == hash_latest:
-                break
-            time.sleep(5)
-        else:
+        if not self._wait_for_remote_branch(
+            git=self._git_base, branch=self.branch_base.name, sha=hash_latest
+        ):
             logger.error("Failed to pull changes from GitHub. Please pull manually.")
             raise PromanError()
+        self._git_base.pull()
 
         tag = self._tag_version(ver=next_ver, base=True)
         self._output_manager.set(
@@ -477,10 +489,17 @@ def _run_create_pre_from_implementation(self, status: IssueStatus):
             allow_empty=True,
         )
         self._git_base.push(target="origin", set_upstream=True)
-        # Wait 30 s to make sure the push of the new base branch is registered
-        time.sleep(30)
-        self._gh_api.pull_update(number=self.pull.number, base=pre_release_branch_name)
         hash_base = self._git_base.commit_hash_normal()
+        if not self._wait_for_remote_branch(
+            git=self._git_base, branch=pre_release_branch_name, sha=hash_base
+        ):
+            logger.error(
+                f"Pre-release branch '{pre_release_branch_name}' was not found on GitHub "
+                "after the push. Please change the base branch of the pull request manually."
+            )
+            self._failed = True
+            return
+        self._gh_api.pull_update(number=self.pull.number, base=pre_release_branch_name)
         changelog_manager = self.update_tasklist_and_contributors_from_commits(
             ver_dist=str(next_ver_pre),
             commit_type=self._primary_commit_type.conv_type,
@@ -491,24 +510,27 @@ def _run_create_pre_from_implementation(self, status: IssueStatus):
         self._write_pre_protocol(ver=str(next_ver_pre))
         # TODO: get DOI from Zenodo and add to citation file
         self._git_head.commit(message="auto: Update changelogs", stage="all")
-        latest_hash = self._git_head.push()
-        # Wait 30 s to make sure the push to head is registered
-        time.sleep(30)
+        self._git_head.push()
+        latest_hash = self._git_head.commit_hash_normal()
+        if not self._wait_for_pull_head(sha=latest_hash):
+            logger.error(
+                "Pull request head was not updated on GitHub after the push. Please merge manually."
+            )
+            self._failed = True
+            return
         merge_response = self._merge_pull(
             conv_type=self._primary_commit_type.conv_type, sha=latest_hash
         )
         if not merge_response:
             return
         hash_latest = merge_response["sha"]
-        for i in range(10):
-            self._git_base.pull()
-            if self._git_base.commit_hash_normal() == hash_latest:
-                break
-            time.sleep(5)
-        else:
+        if not self._wait_for_remote_branch(
+            git=self._git_base, branch=pre_release_branch_name, sha=hash_latest
+        ):
             logger.error("Failed to pull changes from GitHub. Please pull manually.")
             self._failed = True
             return
+        self._git_base.pull()
         tag = self._tag_version(ver=next_ver_pre, base=True)
         ccm_branch = controlman.from_json_file(repo_path=self._path_head)
 
@@ -617,6 +639,56 @@ def _merge_pull(self, conv_type: str, sha: str | None = None) -> dict | None:
             return None
         return response
 
+    def _wait_for_remote_branch(self, git: Git, branch: str, sha: str) -> bool:
+        """Wait until a branch on the remote points to a commit,
+        and report the total time spent waiting in the workflow summary.
+        """
+        found = self._ref_waiter.wait(
+            repo_path=git.repo_path,
+            ref=f"refs/heads/{branch}",
+            sha=sha,
+        )
+        self._report_wait(name=f"Branch '{branch}'", sha=sha, found=found)
+        return found
+
+    def _wait_for_pull_head(self, sha: str) -> bool:
+        """Wait until GitHub has updated the head commit of the pull request after a push,
+        so that merging it at that commit does not fail,
+        and report the total time spent waiting in the workflow summary.
+        """
+
+        def get_hash() -> str | None:
+            # Query the wrapped API directly, since the batched API memoizes the pull request.
+            try:
+                return self._gh_api.api.pull(self.pull.number)["head"]["sha"]
+            except WebAPIError:
+                return None
+
+        found = self._ref_waiter.wait_for(
+            ref=f"refs/pull/{self.pull.number}/head", sha=sha, get_hash=get_hash
+        )
+        self._report_wait(name=f"Pull request #{self.pull.number}", sha=sha, found=found)
+        return found
+
+    def _report_wait(self, name: str, sha: str, found: bool) -> None:
+        wait = self._ref_waiter.waits[-1]
+        log = logger.info if found else logger.warning
+        log(
+            "Remote Branch Sync",
+            f"{name} {'reached' if found else 'did not reach'} commit '{sha}' "
+            f"after {wait['elapsed']:.1f} s ({wait['attempts']} attempts).",
+        )
+        waits = self._ref_waiter.waits
+        self.reporter.update(
+            "wait",
+            status="pass" if all(wait["found"] for wait in waits) else "fail",
+            summary=(
+                f"Waited {self._ref_waiter.total_time:.1f} s "
+                f"for {len(waits)} remote update{'s' if len(waits) != 1 else ''}."
+            ),
+        )
+        return
+
     @logger.sectioner("Commits Update")
     def update_tasklist_and_contributors_from_commits(self) -> Tasklist:
         def extract_commit_body(
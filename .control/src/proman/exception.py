@@ -265,6 +265,38 @@ def __init__(
         return
 
 
+class PromanOfflineTagInConfigFileError(PromanInvalidConfigFileTagError):
+    """Exception raised when external data of a tag is not cached in offline mode."""
+
+    def __init__(
+        self,
+        filepath: Path,
+        data: str,
+        node: _yaml.ScalarNode,
+        url: str,
+    ):
+        problem = _mdit.inline_container(
+            "No cached data is available for ",
+            _mdit.element.code_span(url),
+            " defined in ",
+            _mdit.element.code_span(node.tag),
+            " tag at line ",
+            _mdit.element.code_span(str(node.start_mark.line + 1)),
+            ", and downloads are disabled in offline mode.",
+        )
+        _logger.critical(
+            "Offline Tag in Configuration File",
+            problem,
+        )
+        super().__init__(
+            filepath=filepath,
+            data=data,
+            problem=problem,
+            node=node,
+        )
+        return
+
+
 class PromanInvalidMetadataError(PromanDataReadError):
     """Exception raised when a control center metadata file contains invalid data."""
 
@@ -340,3 +372,28 @@ def __init__(
         self.before_substitution = before_substitution
         self.key = json_path
         return
+
+
+class PromanTemplateCycleError(PromanDataReadError):
+    """Exception raised when templates in control center configurations reference each other in a cycle."""
+
+    def __init__(self, cycle: list[str], data: dict | None = None):
+        intro = "Control center configurations contain circular template references."
+        problem = _mdit.inline_container(
+            "The template at ",
+            _mdit.element.code_span(f"$.{cycle[0]}"),
+            " depends on itself through the following chain of references: ",
+            " → ".join(f"$.{path}" for path in [*cycle, cycle[0]]),
+        )
+        _logger.critical(
+            "Template Cycle Error",
+            intro,
+            problem,
+        )
+        super().__init__(
+            intro=intro,
+            problem=problem,
+            data=data,
+        )
+        self.cycle = cycle
+        return
@@ -5,14 +5,23 @@
 
 import pyserials as _ps
 
+from proman import const as _const
+from proman import dtype as _dtype
+from proman.file_gen import digest as _digest
 from proman.file_gen.config import ConfigFileGenerator as _ConfigFileGenerator
 from proman.file_gen.forms import FormGenerator as _FormGenerator
 from proman.file_gen.python import PythonPackageFileGenerator as _PythonPackageFileGenerator
-from proman import const as _const
-from proman import dtype as _dtype
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from proman.file_gen.digest import FileStatCache
     from proman.manager import Manager
+    from proman.util.hash_tree import HashTree
+
+
+# Top-level metadata keys that are stored in separate files, and thus not written to the metadata file.
+_METADATA_EXCLUDED_KEYS = ("changelogs", "contributors", "variable")
 
 
 def generate(
@@ -20,6 +29,8 @@ def generate(
     manager: Manager,
     data_before: _ps.NestedDict,
     repo_path: _Path,
+    fingerprint: Callable[[], dict] | None = None,
+    stat_cache: FileStatCache | None = None,
 ) -> list[_dtype.DynamicFile]:
     generated_files = []
     form_files = _FormGenerator(
@@ -46,14 +57,27 @@ def generate(
     data_entry = {
         _dtype.DynamicFileType.CONFIG.value[0]: {"meta": data["control.metadata.path"]},
     }
+    digests = {}
+    digests_before = data_before.get("project.file_digest") or {}
     for generated_file in generated_files:
+        digest = (
+            _digest.content(generated_file.content) if generated_file.content is not None else None
+        )
         if generated_file.change is None:
-            generated_file = _compare_file(generated_file, repo_path=repo_path)
+            generated_file = _compare_file(
+                generated_file,
+                repo_path=repo_path,
+                digest=digest,
+                digest_before=digests_before.get(generated_file.path_before),
+                stat_cache=stat_cache,
+            )
         out.append(generated_file)
         if generated_file.change not in (
             _dtype.DynamicFileChangeType.DISABLED,
             _dtype.DynamicFileChangeType.REMOVED,
         ):
+            if digest:
+                digests[generated_file.path] = digest
             type_dict = data_entry.setdefault(generated_file.type.value[0], {})
             if generated_file.subtype[0] in type_dict:
                 raise RuntimeError(
@@ -61,11 +85,12 @@ def generate(
                 )
             type_dict[generated_file.subtype[0]] = generated_file.path
     data["project.file"] = data_entry
+    data["project.file_digest"] = digests
     metadata_file = _dtype.DynamicFile(
         type=_dtype.DynamicFileType.CONFIG,
         subtype=("meta", "Metadata"),
         content=_ps.write.to_json_string(
-            data={k: v for k, v in data().items() if k not in ("changelogs", "contributors", "variable")},
+            data={k: v for k, v in data().items() if k not in _METADATA_EXCLUDED_KEYS},
             sort_keys=True,
             indent=3
         ),
@@ -74,10 +99,90 @@ def generate(
     )
     metadata_full = _compare_file(metadata_file, repo_path=repo_path)
     out.append(metadata_full)
+    if fingerprint:
+        # Computed last, since it includes the generated metadata.
+        fingerprint_file = _dtype.DynamicFile(
+            type=_dtype.DynamicFileType.CONFIG,
+            subtype=("meta_fingerprint", "Metadata Fingerprint"),
+            content=_ps.write.to_json_string(data=fingerprint(), sort_keys=True, indent=3),
+            path=fingerprint_path(data["control.metadata.path"]),
+            path_before=(
+                fingerprint_path(data_before["control.metadata.path"])
+                if data_before["control.metadata.path"]
+                else None
+            ),
+        )
+        out.append(_compare_file(fingerprint_file, repo_path=repo_path))
     return out
 
 
-def _compare_file(file: _dtype.DynamicFile, repo_path: _Path) -> _dtype.DynamicFile:
+def fingerprint_path(metadata_path: str) -> str:
+    """Get the path to the control center fingerprint file, stored next to the metadata file."""
+    return str(_Path(metadata_path).with_suffix(".fingerprint.json"))
+
+
+def hash_tree_path(metadata_path: str) -> str:
+    """Get the path to the metadata hash tree file, stored next to the metadata file."""
+    return str(_Path(metadata_path).with_suffix(".merkle.json"))
+
+
+def hash_tree_file(
+    files: list[_dtype.DynamicFile],
+    hash_tree: HashTree,
+    data: _ps.NestedDict,
+    data_before: _ps.NestedDict,
+    repo_path: _Path,
+) -> _dtype.DynamicFile:
+    """Generate the metadata hash tree file.
+
+    The file contains the digests of all subtrees of the metadata
+    that are written to the metadata file,
+    along with the content digest of the metadata file itself,
+    which is used to verify that the hash tree is still valid for the stored metadata.
+
+    Parameters
+    ----------
+    files
+        Generated dynamic files, including the metadata file.
+    hash_tree
+        Hash tree of the complete metadata.
+    """
+    metadata_file = next(
+        file for file in files if file.type is _dtype.DynamicFileType.CONFIG and file.subtype[0] == "meta"
+    )
+    content = {
+        "metadata": _digest.content(metadata_file.content),
+        "tree": hash_tree.subset(exclude=_METADATA_EXCLUDED_KEYS),
+    }
+    file = _dtype.DynamicFile(
+        type=_dtype.DynamicFileType.CONFIG,
+        subtype=("meta_hash_tree", "Metadata Hash Tree"),
+        content=_ps.write.to_json_string(data=content, sort_keys=True, indent=1),
+        path=hash_tree_path(data["control.metadata.path"]),
+        path_before=(
+            hash_tree_path(data_before["control.metadata.path"])
+            if data_before["control.metadata.path"]
+            else None
+        ),
+    )
+    return _compare_file(file, repo_path=repo_path)
+
+
+def _compare_file(
+    file: _dtype.DynamicFile,
+    repo_path: _Path,
+    digest: str | None = None,
+    digest_before: str | None = None,
+    stat_cache: FileStatCache | None = None,
+) -> _dtype.DynamicFile:
+    """Determine the change type of a dynamic file.
+
+    When the content digest of the file is the same as the digest stored in the previous metadata,
+    and the stat cache confirms that the existing file still matches that digest,
+    the file is considered unchanged without reading it.
+    Otherwise, the existing file is read and compared,
+    and the result is recorded in the stat cache.
+    """
     path_before = file.path_before
     if path_before:
         path_before_abs = repo_path / path_before
@@ -97,10 +202,23 @@ def _compare_file(file: _dtype.DynamicFile, repo_path: _Path) -> _dtype.DynamicF
         typ = _dtype.DynamicFileChangeType.DISABLED
     elif not path_before_exists:
         typ = _dtype.DynamicFileChangeType.ADDED
+    elif (
+        stat_cache
+        and digest
+        and digest == digest_before
+        and stat_cache.verified(path_before_abs, digest)
+    ):
+        typ = (
+            _dtype.DynamicFileChangeType.UNCHANGED
+            if file.path == file.path_before
+            else _dtype.DynamicFileChangeType.MOVED
+        )
     else:
         with open(path_before_abs) as f:
             content_before = f.read()
         contents_identical = file.content.strip() == content_before.strip()
+        if stat_cache and digest:
+            stat_cache.record(path_before_abs, digest if contents_identical else None)
         paths_identical = file.path == file.path_before
         change_type = {
             (True, True): _dtype.DynamicFileChangeType.UNCHANGED,
@@ -272,7 +272,8 @@ def create_map(arg: dict) -> list[str]:
         def create_docker_compose():
             path_depth = len(docker_compose_path.split("/")) - 1
             path_to_root_from_compose_file = "../" * path_depth if path_depth else "."
-            config = docker_compose_data["config"]
+            # Copied, since the generated services must not be added to the metadata.
+            config = _copy.deepcopy(docker_compose_data["config"])
             services = config.setdefault("services", {})
             for container_id, container in devcontainers.items():
                 service_name = container["container"]["service"]
@@ -280,7 +281,7 @@ def create_docker_compose():
                     raise ValueError(
                         f"Service '{service_name}' for devcontainer '{container_id}' already exists in docker-compose file."
                     )
-                service = container.get("service", {})
+                service = _copy.deepcopy(container.get("service", {}))
                 # service["image"] = f"devcontainer_{container_id}"
                 service.setdefault("build", {}).update(
                     {
@@ -342,16 +343,19 @@ def create_docker_compose():
 
             # devcontainer.json
             devcontainer_json_path = f"{container['path']['root']}/devcontainer.json"
-            container["container"].setdefault("dockerComposeFile", []).append(
-                _os.path.relpath(docker_compose_path, _os.path.dirname(devcontainer_json_path))
-            )
+            devcontainer_json = container["container"] | {
+                "dockerComposeFile": [
+                    *container["container"].get("dockerComposeFile", []),
+                    _os.path.relpath(docker_compose_path, _os.path.dirname(devcontainer_json_path)),
+                ]
+            }
             out.append(
                 DynamicFile(
                     type=DynamicFileType.DEVCONTAINER_METADATA,
                     subtype=(container_id, container.get("name", container_id)),
                     content=_unit.create_dynamic_file(
                         file_type="json",
-                        content=container["container"],
+                        content=devcontainer_json,
                         **self._data["default"]["file_setting"]["json"],
                     ),
                     path=devcontainer_json_path,
@@ -0,0 +1,102 @@
+"""Content digests of files, and a local cache of verified file states."""
+
+from __future__ import annotations as _annotations
+
+import hashlib as _hashlib
+import time as _time
+from pathlib import Path as _Path
+
+import pyserials as _ps
+from loggerman import logger as _logger
+
+# Files modified more recently than this many nanoseconds are not recorded,
+# since a later modification within the timestamp resolution would go unnoticed.
+_RACY_INTERVAL_NS = 2_000_000_000
+
+
+def content(file_content: str) -> str:
+    """SHA-256 digest of a dynamic file's content, ignoring leading and trailing whitespace."""
+    return _hashlib.sha256(file_content.strip().encode()).hexdigest()
+
+
+class FileStatCache:
+    """Record of files whose content is known to match their stored digest.
+
+    For each file, the size and modification time are recorded
+    at the time its content was verified against the digest stored in the metadata.
+    As long as both are unchanged, the file can be assumed to still match the digest,
+    without reading it.
+
+    Parameters
+    ----------
+    path
+        Path to the cache file.
+        If not provided, the cache is only kept in memory.
+    """
+
+    def __init__(self, path: str | _Path | None = None):
+        self._path = _Path(path) if path else None
+        self._entries: dict[str, list[int]] = {}
+        self._modified = False
+        if self._path and self._path.is_file():
+            try:
+                entries = _ps.read.json_from_file(path=self._path)
+            except _ps.exception.read.PySerialsReadException:
+                _logger.warning(
+                    "File Stat Cache",
+                    f"Failed to read the cache file at '{self._path}'; initialized a new cache.",
+                )
+            else:
+                if isinstance(entries, dict):
+                    self._entries = entries
+        return
+
+    def verified(self, filepath: _Path, digest: str) -> bool:
+        """Check whether a file is known to match a digest, without reading it."""
+        entry = self._entries.get(str(filepath))
+        if not entry or entry[2] != digest:
+            return False
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return False
+        return entry[:2] == [stat.st_mtime_ns, stat.st_size]
+
+    def file(self, filepath: _Path) -> str:
+        """SHA-256 digest of a file's bytes, read only if not verified since its last change."""
+        entry = self._entries.get(str(filepath))
+        if entry:
+            stat = filepath.stat()
+            if entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+                return entry[2]
+        digest = _hashlib.sha256(filepath.read_bytes()).hexdigest()
+        self.record(filepath, digest)
+        return digest
+
+    def record(self, filepath: _Path, digest: str | None) -> None:
+        """Record that a file currently matches a digest,
+        or remove its record when `digest` is `None`.
+        """
+        key = str(filepath)
+        if digest is not None:
+            try:
+                stat = filepath.stat()
+            except OSError:
+                digest = None
+            else:
+                if _time.time_ns() - stat.st_mtime_ns >= _RACY_INTERVAL_NS:
+                    self._entries[key] = [stat.st_mtime_ns, stat.st_size, digest]
+                    self._modified = True
+                    return
+        if self._entries.pop(key, None):
+            self._modified = True
+        return
+
+    def save(self) -> None:
+        """Write the cache file, if modified."""
+        if not (self._path and self._modified):
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(_ps.write.to_json_string(data=self._entries, sort_keys=True))
+        self._modified = False
+        return
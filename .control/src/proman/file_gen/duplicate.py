@@ -0,0 +1,126 @@
+"""Synchronization of duplicate files defined by `copy_*` keys."""
+
+from __future__ import annotations as _annotations
+
+import os as _os
+import shutil as _shutil
+from pathlib import Path as _Path
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # Not available on Windows
+    _fcntl = None
+
+if _TYPE_CHECKING:
+    from typing import Literal
+
+    import pyserials as _ps
+
+    from proman.file_gen.digest import FileStatCache
+
+
+# `FICLONE` ioctl request code on Linux, cloning a file as a copy-on-write reflink.
+_FICLONE = 0x40049409
+
+
+def targets(data: _ps.NestedDict, repo_path: _Path) -> dict[_Path, tuple[_Path, str]]:
+    """Get all duplicate files defined in the metadata.
+
+    Returns
+    -------
+    Mapping of absolute destination paths
+    to the absolute source path and copy method of each duplicate.
+    """
+    out = {}
+    for key, duplicate in data.items():
+        if not key.startswith("copy_"):
+            continue
+        method = duplicate.get("method", "copy")
+        if "source" in duplicate:
+            for destination in duplicate["destinations"]:
+                out[repo_path / destination] = (repo_path / duplicate["source"], method)
+        else:
+            for source_glob in duplicate["sources"]:
+                for source in repo_path.glob(source_glob):
+                    for destination in duplicate["destinations"]:
+                        out[repo_path / destination / source.stem] = (source, method)
+    return out
+
+
+def sync(
+    data: _ps.NestedDict,
+    data_before: _ps.NestedDict,
+    repo_path: _Path,
+    stat_cache: FileStatCache,
+) -> dict[str, list[_Path]]:
+    """Synchronize duplicate files with their sources.
+
+    Destinations that are no longer defined are removed,
+    and only destinations whose content differs from their source are copied.
+    Contents are compared by their digests,
+    which are only recomputed for files changed since they were last digested.
+
+    Returns
+    -------
+    Destination paths that were removed, copied, and unchanged,
+    under `removed`, `copied`, and `unchanged` keys.
+    """
+    current = targets(data, repo_path)
+    out = {"removed": [], "copied": [], "unchanged": []}
+    for destination in targets(data_before, repo_path).keys() - current.keys():
+        if destination.is_file():
+            destination.unlink()
+            out["removed"].append(destination)
+    for destination, (source, method) in current.items():
+        if _in_sync(source, destination, method, stat_cache):
+            out["unchanged"].append(destination)
+            continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _copy(source, destination, method)
+        out["copied"].append(destination)
+    return out
+
+
+def _in_sync(source: _Path, destination: _Path, method: str, stat_cache: FileStatCache) -> bool:
+    if not destination.is_file():
+        return False
+    if _os.path.samefile(source, destination) or method == "hardlink":
+        # Hard links are in sync by definition, but copies must not be linked to the source.
+        return method == "hardlink" and _os.path.samefile(source, destination)
+    if source.stat().st_size != destination.stat().st_size:
+        return False
+    return stat_cache.file(source) == stat_cache.file(destination)
+
+
+def _copy(source: _Path, destination: _Path, method: Literal["copy", "hardlink"]) -> None:
+    """Copy a file, as a hard link or a copy-on-write reflink when possible.
+
+    With the `copy` method, a reflink is tried first, which is indistinguishable from a copy
+    but shares storage with the source until either file is modified.
+    The method falls back to a regular copy when not supported by the filesystem.
+    """
+    destination.unlink(missing_ok=True)
+    if method == "hardlink":
+        try:
+            _os.link(source, destination)
+            return
+        except OSError:
+            pass
+    elif _reflink(source, destination):
+        _shutil.copystat(source, destination)
+        return
+    _shutil.copy2(source, destination)
+    return
+
+
+def _reflink(source: _Path, destination: _Path) -> bool:
+    if _fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            _fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    return True
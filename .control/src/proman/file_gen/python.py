@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import copy
+import os as _os
 import re as _re
 import textwrap
+from concurrent import futures as _futures
 from pathlib import Path as _Path
 from typing import TYPE_CHECKING
 
@@ -13,9 +15,11 @@
 
 from proman.file_gen import unit as _unit
 from proman import const as _const
-from proman.dtype import DynamicFile, DynamicFileType
+from proman.dtype import DynamicFile, DynamicFileChangeType, DynamicFileType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
     from proman.manager import Manager
 
 
@@ -56,13 +60,13 @@ def generate(self, typ: str) -> list[DynamicFile]:
                 self._path_root_before / self._data_before[f"{typ}.path.source_rel"]
             )
             self._path_import_before = self._path_src_before / self._pkg_before["import_name"]
-        return (
-            self.pyproject()
-            + self.python_files()
-            + self.typing_marker()
-            + self.conda()
-            + self.entry()
-        )
+        return [
+            *self.pyproject(),
+            *self.python_files(),
+            *self.typing_marker(),
+            *self.conda(),
+            *self.entry(),
+        ]
 
     def is_disabled(self, key: str):
         return not any(key in source for source in [self._pkg, self._pkg_before])
@@ -147,7 +151,15 @@ def conda(self):
             out.append(file)
         return out
 
-    def python_files(self) -> list[DynamicFile]:
+    def python_files(self) -> Iterator[DynamicFile]:
+        """Generate dynamic files for all Python source files of the package.
+
+        Files are only read when they may change (i.e., due to renamed imports,
+        updated docstrings or header comments, or a moved import package),
+        which is done in parallel for large packages.
+        Only files with changed content (or location) carry their content;
+        all other files are yielded as unchanged files without content.
+        """
         mapping = {}
         # Generate import name mapping for dependencies
         core_dep_before = self._pkg_before.get("dependency", {}).get("core", {})
@@ -185,63 +197,60 @@ def python_files(self) -> list[DynamicFile]:
             import_name_before = pkg_before.get("import_name")
             if import_name_before and pkg["import_name"] != import_name_before:
                 mapping[import_name_before] = pkg["import_name"]
-        # Get all file glob matches
-        path_to_globs_map = {}
+        # Get all file glob matches, along with the updates needed for each file
+        path_to_updates_map = {}
         abs_path = self._path_repo / (self._path_import_before or self._path_import)
+        has_glob_matches = False
         for config_id, file_config in self._pkg.get("source_file", {}).items():
+            config_before = self._pkg_before.get("source_file", {}).get(config_id, {})
+            updates = [
+                (key, file_config[key], config_before.get(key))
+                for key in ("docstring", "header_comments")
+                if key in file_config and config_before.get(key) != file_config[key]
+            ]
             for filepath_match in abs_path.glob(file_config["glob"]):
-                path_to_globs_map.setdefault(filepath_match, []).append((config_id, file_config))
-        if not (mapping or path_to_globs_map):
-            return []
-        # Process each file
-        out = []
-        for filepath in abs_path.glob("**/*.py"):
-            file_content = filepath.read_text()
-            if mapping:
-                file_content = _pysyntax.modify.imports(code=file_content, mapping=mapping)
-            if filepath in path_to_globs_map:
-                for config_id, file_config in path_to_globs_map[filepath]:
-                    if "docstring" in file_config:
-                        docstring_before = (
-                            self._pkg_before.get("source_file", {})
-                            .get(config_id, {})
-                            .get("docstring")
-                        )
-                        if docstring_before != file_config["docstring"]:
-                            file_content = self._update_docstring(
-                                file_content,
-                                file_config["docstring"],
-                                docstring_before,
-                            )
-                    if "header_comments" in file_config:
-                        header_commens_before = (
-                            self._pkg_before.get("source_file", {})
-                            .get(config_id, {})
-                            .get("header_comments")
-                        )
-                        if header_commens_before != file_config["header_comments"]:
-                            file_content = self._update_header_comments(
-                                file_content,
-                                file_config["header_comments"],
-                                header_commens_before,
-                            )
-            subtype = filepath.relative_to(self._path_repo / self._path_src)
-            subtype_display = str(subtype.with_suffix("")).replace("/", ".")
-            fullpath_import_before = self._path_repo / (
-                self._path_import_before or self._path_import
+                has_glob_matches = True
+                path_to_updates_map.setdefault(filepath_match, []).extend(updates)
+        if not (mapping or has_glob_matches):
+            return
+        # Only files that need updates or may contain renamed imports are read and processed;
+        # candidates for import renaming are pre-filtered by a substring scan of the old import names.
+        import_path_before = self._path_import_before or self._path_import
+        import_path_rel_src = import_path_before.relative_to(self._path_src)
+        abs_path_prefix_len = len(str(abs_path)) + 1
+        files = []
+        tasks = []
+        for filepath in sorted(abs_path.glob("**/*.py")):
+            relpath = str(filepath)[abs_path_prefix_len:]
+            path = str(self._path_import / relpath)
+            path_before = str(import_path_before / relpath)
+            files.append((filepath, relpath, path, path_before))
+            updates = path_to_updates_map.get(filepath, [])
+            moved = path != path_before
+            if updates or moved or (mapping and _contains_any(filepath, mapping)):
+                tasks.append((filepath, mapping, updates, moved))
+        contents = dict(
+            zip(
+                (task[0] for task in tasks),
+                _map_in_processes(_process_python_file, tasks),
             )
-            out.append(
-                DynamicFile(
-                    type=DynamicFileType.PKG_SOURCE,
-                    subtype=(str(subtype), subtype_display),
-                    content=file_content,
-                    path=str(self._path_import / filepath.relative_to(fullpath_import_before)),
-                    path_before=str(filepath.relative_to(self._path_repo)),
-                )
+        )
+        for filepath, relpath, path, path_before in files:
+            subtype = import_path_rel_src / relpath
+            subtype_display = str(subtype.with_suffix("")).replace("/", ".")
+            file_content = contents.get(filepath)
+            yield DynamicFile(
+                type=DynamicFileType.PKG_SOURCE,
+                subtype=(str(subtype), subtype_display),
+                content=file_content,
+                path=path,
+                path_before=path_before,
+                change=DynamicFileChangeType.UNCHANGED if file_content is None else None,
             )
-        return out
+        return
 
-    def _update_docstring(self, file_content: str, template: dict, template_before: dict) -> str:
+    @staticmethod
+    def _update_docstring(file_content: str, template: dict, template_before: dict) -> str:
         def get_wrapped_docstring(templ: dict) -> str:
             max_line_length = templ.get("max_line_length")
             if not max_line_length:
@@ -251,11 +260,14 @@ def get_wrapped_docstring(templ: dict) -> str:
                 line_parts = textwrap.wrap(
                     line,
                     width=max_line_length,
-                    subsequent_indent=self._get_whitespace(line, leading=True),
+                    subsequent_indent=PythonPackageFileGenerator._get_whitespace(line, leading=True),
                 )
                 lines.append("") if not line_parts else lines.extend(line_parts)
             wrapped_docstring = "\n".join(lines)
-            return f"{wrapped_docstring}{self._get_whitespace(templ['content'], leading=False)}"
+            trailing_whitespace = PythonPackageFileGenerator._get_whitespace(
+                templ["content"], leading=False
+            )
+            return f"{wrapped_docstring}{trailing_whitespace}"
 
         docstring_text = get_wrapped_docstring(template)
         docstring_before = _pysyntax.parse.docstring(file_content)
@@ -275,9 +287,8 @@ def get_wrapped_docstring(templ: dict) -> str:
                 docstring_replacement = f"{docstring_replacement}{docstring_text}"
         return _pysyntax.modify.docstring(file_content, docstring_replacement)
 
-    def _update_header_comments(
-        self, file_content: str, template: dict, template_before: dict
-    ) -> str:
+    @staticmethod
+    def _update_header_comments(file_content: str, template: dict, template_before: dict) -> str:
         def get_wrapped_header_comments(templ: dict) -> str:
             max_line_length = templ.get("max_line_length")
             lines = []
@@ -293,7 +304,7 @@ def get_wrapped_header_comments(templ: dict) -> str:
                         lines.append("")
                     current_newlines = 0
                 if max_line_length:
-                    line_indent = self._get_whitespace(line, leading=True)
+                    line_indent = PythonPackageFileGenerator._get_whitespace(line, leading=True)
                     line_parts = textwrap.wrap(
                         line,
                         width=max_line_length,
@@ -742,3 +753,54 @@ def _prepend_and_append(core: list[str], data: dict):
     def _make_selector(data: dict):
         selector = data.get("selector")
         return f"  # [{selector}]" if selector else ""
+
+
+# Minimum number of files to process in parallel;
+# below this, the overhead of starting worker processes outweighs the gain.
+_PARALLEL_MIN_FILES = 256
+
+
+def _process_python_file(
+    filepath: _Path,
+    mapping: dict[str, str],
+    updates: list[tuple[str, dict, dict | None]],
+    keep: bool,
+) -> str | None:
+    """Apply import renames and docstring/header comments updates to a Python file.
+
+    Returns
+    -------
+    The new content of the file,
+    or `None` if the content is unchanged and `keep` is `False`.
+    """
+    content_before = filepath.read_text()
+    file_content = content_before
+    if any(import_name in file_content for import_name in mapping):
+        file_content = _pysyntax.modify.imports(code=file_content, mapping=mapping)
+    for key, template, template_before in updates:
+        updater = (
+            PythonPackageFileGenerator._update_docstring
+            if key == "docstring"
+            else PythonPackageFileGenerator._update_header_comments
+        )
+        file_content = updater(file_content, template, template_before)
+    if keep or file_content != content_before:
+        return file_content
+    return None
+
+
+def _contains_any(filepath: _Path, substrings: Iterable[str]) -> bool:
+    file_content = filepath.read_text()
+    return any(substring in file_content for substring in substrings)
+
+
+def _map_in_processes(func: Callable, tasks: Sequence[tuple]) -> list:
+    """Apply a function to argument tuples, using a process pool for large inputs."""
+    try:
+        cpu_count = len(_os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = _os.cpu_count() or 1
+    if len(tasks) < _PARALLEL_MIN_FILES or cpu_count < 2:
+        return [func(*task) for task in tasks]
+    with _futures.ProcessPoolExecutor(max_workers=cpu_count) as executor:
+        return list(executor.map(func, *zip(*tasks), chunksize=16))
@@ -98,12 +98,11 @@ def augment_cleanup_function(data: dict | None = None) -> dict:
 
     Returns
     -------
-    Shell command (as a list of lines) to define the cleanup function.
+    A copy of the cleanup function data, with log cleanup lines appended to its body.
     """
-    data = data or {}
-    data.setdefault("body", [])
-    if isinstance(data["body"], str):
-        data["body"] = data["body"].splitlines()
+    data = dict(data or {})
+    body = data.get("body", [])
+    data["body"] = body.splitlines() if isinstance(body, str) else list(body)
     log_cleanup_lines = [
         'if [ -n "${LOGFILE-}" ]; then',
         indent(log("Write logs to file '$LOGFILE'", "info"), 1),
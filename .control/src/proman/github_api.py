@@ -0,0 +1,377 @@
+"""Request coalescing for the GitHub API.
+
+Read queries issued during the same phase of a run are collected by a `GraphQLBatcher`
+and sent together in a single GraphQL document,
+where each query is an aliased top-level field.
+Responses are then fanned back out to the callers.
+`BatchedRepoAPI` wraps a `pylinks` repository API object,
+routing its common read queries through the batcher
+and memoizing their results until the next write request.
+"""
+
+from __future__ import annotations as _annotations
+
+import copy as _copy
+import json as _json
+import threading as _threading
+import urllib.parse as _urllib_parse
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from loggerman import logger as _logger
+from pylinks.exception.api import WebAPIError as _WebAPIError
+
+if _TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from pylinks.api.github import GitHub as GitHubBareAPI
+    from pylinks.api.github import Repo as GitHubRepoAPI
+
+
+# Maximum number of queries combined in a single GraphQL document.
+_MAX_FIELDS_PER_DOCUMENT = 50
+
+_LABEL_FIELDS = "pageInfo {hasNextPage} nodes {id name color description isDefault}"
+
+
+class GraphQLRequest:
+    """A pending query of a `GraphQLBatcher`."""
+
+    def __init__(self, batcher: GraphQLBatcher, field: str):
+        self._batcher = batcher
+        self.field = field
+        self.done = False
+        self.data: Any = None
+        self.errors: list[dict] = []
+        return
+
+    def result(self) -> Any:
+        """Get the response data of the query,
+        sending all pending queries of the batcher if not yet sent.
+
+        Returns
+        -------
+        The data of the queried field,
+        or `None` if the query failed (see `errors`).
+        """
+        if not self.done:
+            self._batcher.flush()
+        return self.data
+
+
+class GraphQLBatcher:
+    """Collect GraphQL queries and send them in batched documents.
+
+    Parameters
+    ----------
+    transport
+        Function sending a GraphQL document and returning the raw response,
+        i.e., a dictionary with `data` and/or `errors` keys.
+    max_fields
+        Maximum number of queries in a single document.
+    available
+        Whether the GraphQL API is available (e.g., it requires an access token).
+        If not, all queries fail immediately without sending any requests.
+    """
+
+    def __init__(
+        self,
+        transport: Callable[[str], dict],
+        max_fields: int = _MAX_FIELDS_PER_DOCUMENT,
+        available: bool = True,
+    ):
+        self._transport = transport
+        self._max_fields = max_fields
+        self._available = available
+        self._pending: dict[str, GraphQLRequest] = {}
+        self._lock = _threading.RLock()
+        self._stats = {"queries": 0, "requests": 0}
+        return
+
+    @classmethod
+    def from_api(cls, api: GitHubBareAPI, **kwargs) -> GraphQLBatcher:
+        """Create a batcher sending documents with a `pylinks` GitHub API object."""
+
+        def transport(document: str) -> dict:
+            return api.rest_query("graphql", verb="POST", json={"query": document})
+
+        return cls(transport=transport, available=api.authenticated, **kwargs)
+
+    @property
+    def available(self) -> bool:
+        """Whether the GraphQL API is available."""
+        return self._available
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Number of sent queries and the number of requests they were sent in."""
+        return self._stats
+
+    def add(self, field: str) -> GraphQLRequest:
+        """Add a query to the current batch.
+
+        Parameters
+        ----------
+        field
+            Top-level field of a GraphQL query,
+            e.g., `repositoryOwner(login: "octocat") {id}`.
+            Identical pending queries are only sent once.
+        """
+        if not self._available:
+            request = GraphQLRequest(batcher=self, field=field)
+            request.errors = [{"message": "GraphQL API is not available."}]
+            request.done = True
+            return request
+        with self._lock:
+            if field not in self._pending:
+                self._pending[field] = GraphQLRequest(batcher=self, field=field)
+            return self._pending[field]
+
+    def flush(self) -> None:
+        """Send all pending queries."""
+        with self._lock:
+            requests = list(self._pending.values())
+            self._pending.clear()
+            for batch_start in range(0, len(requests), self._max_fields):
+                self._send(requests[batch_start : batch_start + self._max_fields])
+        return
+
+    def _send(self, requests: list[GraphQLRequest]) -> None:
+        aliases = [f"q{idx}" for idx in range(len(requests))]
+        document = "query {" + " ".join(
+            f"{alias}: {request.field}" for alias, request in zip(aliases, requests)
+        ) + "}"
+        self._stats["requests"] += 1
+        self._stats["queries"] += len(requests)
+        try:
+            response = self._transport(document)
+        except _WebAPIError as e:
+            _logger.warning(
+                "GitHub GraphQL Batch",
+                f"Failed to send {len(requests)} batched queries.",
+                e.report.body["intro"].content,
+            )
+            response = {"errors": [{"message": str(e)}]}
+        data = response.get("data") or {}
+        alias_errors = {}
+        common_errors = []
+        for error in response.get("errors", []):
+            path = error.get("path")
+            # Validation errors reject the whole document; their paths start at the operation.
+            if path and path[0] in aliases:
+                alias_errors.setdefault(path[0], []).append(error)
+            else:
+                common_errors.append(error)
+        for alias, request in zip(aliases, requests):
+            request.data = data.get(alias)
+            request.errors = alias_errors.get(alias, []) + (
+                common_errors if request.data is None else []
+            )
+            request.done = True
+        _logger.info(
+            "GitHub GraphQL Batch",
+            f"Sent {len(requests)} queries in one request "
+            f"({self._stats['queries']} queries in {self._stats['requests']} requests so far).",
+        )
+        return
+
+
+class BatchedRepoAPI:
+    """Repository API with batched and memoized read queries.
+
+    Branches, labels, issue labels, and discussion categories are queried via GraphQL
+    through the given batcher, and returned in the same format as `pylinks`
+    (i.e., the REST API format), but only with the fields available in the GraphQL API:
+    branches have no `protection` details, and labels have no numeric `id`.
+    Use `api` for the full REST data.
+    When a GraphQL query fails or its results do not fit in one page,
+    the REST API is used instead.
+    Results of all read queries are memoized until any other method
+    (e.g., a write request) of the wrapped API is called.
+    All other attributes are delegated to the wrapped API.
+
+    Parameters
+    ----------
+    api
+        Wrapped repository API.
+    batcher
+        Batcher to send GraphQL queries with;
+        this should use the same access token as `api`.
+    """
+
+    def __init__(self, api: GitHubRepoAPI, batcher: GraphQLBatcher):
+        self._api = api
+        self._batcher = batcher
+        self._requests: dict[tuple, GraphQLRequest] = {}
+        self._results: dict[tuple, Any] = {}
+        return
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._api, name)
+        if not callable(attr):
+            return attr
+
+        def call_and_invalidate(*args, **kwargs):
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return call_and_invalidate
+
+    @property
+    def api(self) -> GitHubRepoAPI:
+        """Wrapped repository API, for read queries that need data only available in REST."""
+        return self._api
+
+    @property
+    def batcher(self) -> GraphQLBatcher:
+        return self._batcher
+
+    def prefetch(self, *resources: str) -> None:
+        """Add GraphQL queries for the given resources to the current batch.
+
+        Parameters
+        ----------
+        resources
+            Names of resources to prefetch;
+            any of `branches`, `labels`, and `discussion_categories`.
+        """
+        if not self._batcher.available:
+            return
+        for resource in resources:
+            if (resource,) not in self._results:
+                self._request(resource)
+        return
+
+    def invalidate(self) -> None:
+        """Discard all memoized results."""
+        self._requests.clear()
+        self._results.clear()
+        return
+
+    @property
+    def info(self) -> dict:
+        return self._memoized(("info",), lambda: self._api.info)
+
+    @property
+    def branches(self) -> list[dict]:
+        return self._memoized(("branches",), self._branches)
+
+    @property
+    def labels(self) -> list[dict]:
+        return self._memoized(("labels",), self._labels)
+
+    def discussion_categories(self) -> list[dict[str, str]]:
+        return self._memoized(("discussion_categories",), self._discussion_categories)
+
+    def issue_labels(self, number: int) -> list[dict]:
+        return self._memoized(("issue_labels", number), lambda: self._issue_labels(number))
+
+    def pull(self, number: int) -> dict:
+        return self._memoized(("pull", number), lambda: self._api.pull(number))
+
+    def pull_list(self, **kwargs) -> list[dict]:
+        return self._memoized(
+            ("pull_list", *sorted(kwargs.items())), lambda: self._api.pull_list(**kwargs)
+        )
+
+    def _memoized(self, key: tuple, getter: Callable[[], Any]) -> Any:
+        if key not in self._results:
+            self._results[key] = getter()
+        return _copy.deepcopy(self._results[key])
+
+    def _request(self, resource: str, *args) -> GraphQLRequest:
+        key = (resource, *args)
+        if key not in self._requests:
+            payload = {
+                "branches": lambda: (
+                    'refs(refPrefix: "refs/heads/", first: 100) {pageInfo {hasNextPage} '
+                    "nodes {name target {oid} rules(first: 1) {totalCount} branchProtectionRule {id}}}"
+                ),
+                "labels": lambda: f"labels(first: 100) {{{_LABEL_FIELDS}}}",
+                "discussion_categories": lambda: (
+                    "discussionCategories(first: 100) {edges {node {name, slug, id, emoji, "
+                    "emojiHTML, createdAt, updatedAt, isAnswerable, description}}}"
+                ),
+                "issue_labels": lambda: (
+                    f"issueOrPullRequest(number: {int(args[0])}) "
+                    f"{{... on Labelable {{labels(first: 100) {{{_LABEL_FIELDS}}}}}}}"
+                ),
+            }[resource]()
+            self._requests[key] = self._batcher.add(
+                f"repository(owner: {_json.dumps(self._api.username)}, "
+                f"name: {_json.dumps(self._api.name)}) {{{payload}}}"
+            )
+        return self._requests[key]
+
+    def _graphql(self, resource: str, *args) -> Any:
+        request = self._request(resource, *args)
+        data = request.result()
+        self._requests.pop((resource, *args), None)
+        if data is None and self._batcher.available:
+            _logger.warning(
+                "GitHub GraphQL Batch",
+                f"GraphQL query for '{resource}' failed; falling back to the REST API.",
+                _logger.pretty(request.errors),
+            )
+        return data
+
+    def _branches(self) -> list[dict]:
+        data = self._graphql("branches")
+        if not data or data["refs"]["pageInfo"]["hasNextPage"]:
+            return self._api.branches
+        branches = []
+        for ref in data["refs"]["nodes"]:
+            branches.append(
+                {
+                    "name": ref["name"],
+                    "commit": {
+                        "sha": ref["target"]["oid"],
+                        "url": self._rest_url(f"commits/{ref['target']['oid']}"),
+                    },
+                    "protected": bool(
+                        ref.get("branchProtectionRule") or ref.get("rules", {}).get("totalCount")
+                    ),
+                    "protection_url": self._rest_url(f"branches/{ref['name']}/protection"),
+                }
+            )
+        return branches
+
+    def _labels(self) -> list[dict]:
+        data = self._graphql("labels")
+        if not data or data["labels"]["pageInfo"]["hasNextPage"]:
+            return self._api.labels
+        return [self._process_label(label) for label in data["labels"]["nodes"]]
+
+    def _discussion_categories(self) -> list[dict[str, str]]:
+        data = self._graphql("discussion_categories")
+        if not data:
+            return self._api.discussion_categories()
+        return [entry["node"] for entry in data["discussionCategories"]["edges"]]
+
+    def _issue_labels(self, number: int) -> list[dict]:
+        data = self._graphql("issue_labels", number)
+        labels = ((data or {}).get("issueOrPullRequest") or {}).get("labels")
+        if not labels or labels["pageInfo"]["hasNextPage"]:
+            return self._api.issue_labels(number=number)
+        return [self._process_label(label) for label in labels["nodes"]]
+
+    def _process_label(self, label: dict) -> dict:
+        """Convert a GraphQL label to the REST API format.
+
+        The numeric ID of labels is not available in the GraphQL API,
+        and is thus not included.
+        """
+        return {
+            "node_id": label["id"],
+            "url": self._rest_url(f"labels/{_urllib_parse.quote(label['name'])}"),
+            "name": label["name"],
+            "description": label["description"],
+            "color": label["color"],
+            "default": label["isDefault"],
+        }
+
+    def _rest_url(self, path: str) -> str:
+        return f"https://api.github.com/repos/{self._api.username}/{self._api.name}/{path}"
+
@@ -12,13 +12,12 @@
 import pylinks
 import pyserials as ps
 from loggerman import logger
-from pycacheman.serializable import SerializableCacheManager
-
-
 from proman import exception
 from proman import data_validator as _data_validator
 from proman import const
+from proman.cache import CacheManager
 from proman.exception import PromanError
+from proman.github_api import BatchedRepoAPI, GraphQLBatcher
 
 # from proman.manager.announcement import AnnouncementManager
 from proman.manager.branch import BranchManager
@@ -35,7 +34,7 @@
 from proman.manager.variable import VariableManager
 from proman.report import Reporter
 from proman.token_manager import create as _create_token_manager
-from proman.util import date
+from proman.util import date, git_objects
 
 if TYPE_CHECKING:
     from typing import Any, Callable
@@ -43,7 +42,6 @@
     from github_contexts.github.payload.object import Issue, PullRequest
     from gittidy import Git
     from pylinks.api.github import GitHub as GitHubBareAPI
-    from pylinks.api.github import Repo as GitHubRepoAPI
     from pylinks.site.github import Repo as GitHubLink
     from pyserials.nested_dict import NestedDict
 
@@ -89,9 +87,14 @@ def create(
                 remotes=git_api.get_remotes(),
             )
         repo_owner, repo_name = repo_address
-    github_api_actions = github_api_bare.user(repo_owner).repo(repo_name)
-    github_api_admin = (
-        pylinks.api.github(token=token_manager.github_admin.get()).user(repo_owner).repo(repo_name)
+    github_api_actions = BatchedRepoAPI(
+        api=github_api_bare.user(repo_owner).repo(repo_name),
+        batcher=GraphQLBatcher.from_api(github_api_bare),
+    )
+    github_api_admin_bare = pylinks.api.github(token=token_manager.github_admin.get())
+    github_api_admin = BatchedRepoAPI(
+        api=github_api_admin_bare.user(repo_owner).repo(repo_name),
+        batcher=GraphQLBatcher.from_api(github_api_admin_bare),
     )
     github_link = pylinks.site.github.user(repo_owner).repo(repo_name)
 
@@ -158,7 +161,10 @@ def update(
     manager: Manager,
     project_metadata: NestedDict,
 ) -> Manager:
-    """Create a new Manager instance with updated project metadata."""
+    """Create a new Manager instance with updated project metadata.
+
+    The new instance shares the APIs and the cache of the given manager.
+    """
     return Manager(
         project_metadata=project_metadata,
         token_manager=manager.token,
@@ -171,6 +177,7 @@ def update(
         jinja_env_vars=manager.jinja_env_vars,
         github_context=manager.gh_context,
         main_manager=manager.main,
+        cache_manager=manager.cache,
     )
 
 
@@ -194,16 +201,18 @@ def load_metadata(
     reporter
         Reporter instance to report the status of the operation.
     """
-    filepath = get_metadata_filepath(repo=repo, ref=ref)
     git_api = create_git_api(repo_path=repo) if isinstance(repo, str | Path) else repo
+    filepath = get_metadata_filepath(repo=git_api, ref=ref)
     reporter = reporter or Reporter()
     log_title = "Metadata Load"
-    if ref:
+    # Without a reference, all files are read from the working tree,
+    # even though `ref` is then set to the current commit hash for logging.
+    load_ref = ref
+    if load_ref:
         log_ref = ref
-        data_str = git_api.file_at_ref(
-            ref=ref,
-            path=filepath,
-        )
+        data_str = git_objects.reader(git_api.repo_path).text(ref=ref, path=filepath)
+        if data_str is None:
+            raise exception.PromanError()
         try:
             project_metadata = ps.read.json_from_string(data=data_str)
         except ps.exception.read.PySerialsReadException as e:
@@ -231,7 +240,12 @@ def load_metadata(
     for key in ("changelogs", "contributor", "variable"):
         key_path = git_api.repo_path / project_metadata[f"control.{key}.path"]
         try:
-            key_data = ps.read.json_from_file(key_path)
+            if load_ref:
+                key_data = ps.read.json_from_string(
+                    data=git_objects.reader(git_api.repo_path).text(ref=ref, path=key_path) or ""
+                )
+            else:
+                key_data = ps.read.json_from_file(key_path)
         except ps.exception.read.PySerialsReadException as e:
             raise exception.PromanInvalidMetadataError(
                 cause=e, filepath=key_path
@@ -277,7 +291,9 @@ def get_metadata_filepath(repo: Git, ref: str | None = None) -> Path:
     """Get the path to the main metadata file."""
     linker_path = repo.repo_path / const.METADATA_LINKER_PATH
     if ref:
-        metadata_filepath = repo.file_at_ref(ref=ref, path=linker_path).strip()
+        metadata_filepath = (
+            git_objects.reader(repo.repo_path).text(ref=ref, path=const.METADATA_LINKER_PATH) or ""
+        ).strip()
         if not metadata_filepath:
             raise exception.PromanError()
         metadata_filepath = repo.repo_path / metadata_filepath
@@ -301,14 +317,15 @@ def __init__(
         project_metadata: NestedDict,
         token_manager: TokenManager,
         git_api: Git,
-        github_api_actions: GitHubRepoAPI,
-        github_api_admin: GitHubRepoAPI,
+        github_api_actions: BatchedRepoAPI,
+        github_api_admin: BatchedRepoAPI,
         github_api_bare: GitHubBareAPI,
         github_link: GitHubLink,
         reporter: Reporter,
         jinja_env_vars: dict,
         github_context: GitHubContext | None = None,
         main_manager: Manager | None = None,
+        cache_manager: CacheManager | None = None,
     ):
         self._meta = project_metadata
         self._token_manager = token_manager
@@ -322,11 +339,17 @@ def __init__(
         self._github_context = github_context
         self._main_manager = main_manager or self
         self._get_data_function = self._meta.get
-        cache_filepath = self._meta.get("control.cache.file")
-        self._cache_manager = SerializableCacheManager(
-            path=(self.git.repo_path / cache_filepath) if cache_filepath else None,
-            retention_time={k: datetime.timedelta(hours=v) for k, v in self._meta.get("control.cache.retention_hours", {}).items()},
-        )
+        if cache_manager:
+            self._cache_manager = cache_manager
+        else:
+            cache_filepath = self._meta.get("control.cache.file")
+            cache_filepath = (self.git.repo_path / cache_filepath) if cache_filepath else None
+            self._cache_manager = CacheManager(
+                path=cache_filepath.with_suffix("") if cache_filepath else None,
+                retention_time={k: datetime.timedelta(hours=v) for k, v in self._meta.get("control.cache.retention_hours", {}).items()},
+                max_entries=self._meta.get("control.cache.max_entries", 1000),
+                legacy_path=cache_filepath,
+            )
         self._branch_manager = BranchManager(self)
         self._changelog_manager = ChangelogsManager(self)
         self._commit_manager = CommitManager(self)
@@ -359,6 +382,8 @@ def control_center(
         future_versions: dict[str, str] | None = None,
         control_center_path: str | None = None,
         clean_state: bool = False,
+        incremental: bool = False,
+        offline: bool = False,
     ):
         if not control_center_path:
             control_center_path = self.data.get("control.source.path")
@@ -372,6 +397,8 @@ def control_center(
             cc_path=control_center_path,
             future_versions=future_versions,
             clean_state=clean_state,
+            incremental=incremental,
+            offline=offline,
         )
 
     @property
@@ -399,11 +426,11 @@ def gh_api_bare(self) -> GitHubBareAPI:
         return self._gh_api_bare
 
     @property
-    def gh_api_actions(self) -> GitHubRepoAPI:
+    def gh_api_actions(self) -> BatchedRepoAPI:
         return self._gh_api_actions
 
     @property
-    def gh_api_admin(self) -> GitHubRepoAPI:
+    def gh_api_admin(self) -> BatchedRepoAPI:
         return self._gh_api_admin
 
     @property
@@ -427,7 +454,7 @@ def commit(self) -> CommitManager:
         return self._commit_manager
 
     @property
-    def cache(self) -> SerializableCacheManager:
+    def cache(self) -> CacheManager:
         return self._cache_manager
 
     @property
@@ -1,6 +1,5 @@
 from __future__ import annotations as _annotations
 
-import copy
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 import pyserials as ps
@@ -9,7 +8,7 @@
 
 from proman.dstruct import Version, VersionTag
 from proman.dtype import LabelType
-from proman.util import date
+from proman.util import date, hash_tree
 
 if _TYPE_CHECKING:
     from typing import Sequence, Callable
@@ -25,7 +24,7 @@ def __init__(self, manager: Manager):
         self._manager = manager
         self._filepath = self._manager.git.repo_path / self._manager.data[f"control.changelogs.path"]
         self._changelog = self._manager.data["changelogs"]
-        self._read = copy.deepcopy(self._changelog)
+        self._read = hash_tree.digest(self._changelog)
         if self._changelog[0].get("phase") != "dev":
             self._current = {"phase": "dev"}
             self._changelog.insert(0, self._current)
@@ -341,7 +340,7 @@ def finalize(self, pre: bool):
         return self.current
 
     def write_file(self):
-        if self._changelog == self._read:
+        if hash_tree.digest(self._changelog) == self._read:
             return False
         self._filepath.write_text(
             ps.write.to_json_string(self._changelog, sort_keys=True, indent=3).strip() + "\n",
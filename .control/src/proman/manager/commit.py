@@ -1,5 +1,6 @@
 from __future__ import annotations as _annotations
 
+import re as _re
 from functools import partial
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
@@ -9,95 +10,68 @@
 
 from proman.dstruct import Commit
 from proman.dtype import ReleaseAction
+from proman.util import hash_tree as _hash_tree
 
 if _TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from gittidy import Git
 
     from proman.manager import Manager
 
 
+# Parsers, writers, and dev-commit indices of commit configurations, by their digests.
+_SYNTAX_CACHE: dict[str, tuple] = {}
+
+
 class CommitManager:
     def __init__(self, manager: Manager):
         self._manager = manager
+        # Commit configurations of the last syntax lookup (also keeping their IDs from reuse),
+        # and their syntax.
+        self._syntax_data: tuple[dict, dict] | None = None
+        self._syntax_value: tuple | None = None
         return
 
     @property
     def msg_parser(self) -> conventional_commits.ConventionalCommitParser:
         """Parser for commit messages."""
-        return conventional_commits.create_parser(
-            type_regex=self._manager.data["commit.config.regex.validator.type"],
-            scope_regex=self._manager.data["commit.config.regex.validator.scope"],
-            description_regex=self._manager.data["commit.config.regex.validator.description"],
-            scope_start_separator_regex=self._manager.data[
-                "commit.config.regex.separator.scope_start"
-            ],
-            scope_end_separator_regex=self._manager.data["commit.config.regex.separator.scope_end"],
-            scope_items_separator_regex=self._manager.data[
-                "commit.config.regex.separator.scope_items"
-            ],
-            description_separator_regex=self._manager.data[
-                "commit.config.regex.separator.description"
-            ],
-            body_separator_regex=self._manager.data["commit.config.regex.separator.body"],
-            footer_separator_regex=self._manager.data["commit.config.regex.separator.footer"],
-        )
+        return self._syntax()[0]
 
     @property
     def msg_writer(self) -> conventional_commits.ConventionalCommitWriter:
-        return partial(
-            conventional_commits.create,
-            scope_start=self._manager.data["commit.config.scope_start"],
-            scope_separator=self._manager.data["commit.config.scope_separator"],
-            scope_end=self._manager.data["commit.config.scope_end"],
-            description_separator=self._manager.data["commit.config.description_separator"],
-            body_separator=self._manager.data["commit.config.body_separator"],
-            footer_separator=self._manager.data["commit.config.footer_separator"],
-            type_regex=self._manager.data["commit.config.regex.validator.type"],
-            scope_regex=self._manager.data["commit.config.regex.validator.scope"],
-            description_regex=self._manager.data["commit.config.regex.validator.description"],
-        )
+        return self._syntax()[1]
 
     def create_from_msg(self, message: str) -> Commit:
-        def get_dev_id(conv_msg: ConventionalCommitMessage):
-            def get_scope(data: dict):
-                scope = data.get("scope", tuple())
-                return {scope} if isinstance(scope, str) else set(scope)
-
-            for commit_id, commit_data in self._manager.data["commit.dev"].items():
-                if commit_data["type"] == conv_msg.type and get_scope(commit_data) == set(
-                    msg.scope
-                ):
-                    return commit_id
-            return None
-
-        try:
-            msg = self.msg_parser.parse(message)
+        parser, writer, dev_index = self._syntax()
+        commit, msg = self._parse(message, parser, writer, dev_index)
+        if msg:
             _logger.info(
                 "Commit Parse", "Plain message:", repr(message), "Parsed message:", repr(msg)
             )
-            return Commit(
-                writer=self.msg_writer,
-                type=msg.type,
-                scope=msg.scope,
-                description=msg.description,
-                body=msg.body,
-                footer=msg.footer,
-                dev_id=get_dev_id(msg),
-            )
-        except Exception as e:
-            _logger.warning(
-                "Commit Message Processing",
-                f"Failed to parse commit message: {e}",
-                message,
-            )
-            parts = message.split("\n", 1)
-            description = parts[0]
-            body = parts[1] if len(parts) > 1 else ""
-            return Commit(
-                writer=self.msg_writer,
-                description=description,
-                body=body,
-            )
+        return commit
+
+    def create_from_msgs(self, messages: Sequence[str]) -> list[Commit]:
+        """Create commits from a sequence of commit messages.
+
+        This gives the same result as calling `create_from_msg` for each message,
+        but only looks up the parser once, and logs a single summary
+        instead of an entry for each message.
+        """
+        parser, writer, dev_index = self._syntax()
+        commits = []
+        parsed = []
+        for message in messages:
+            commit, msg = self._parse(message, parser, writer, dev_index)
+            commits.append(commit)
+            if msg:
+                parsed.append(f"- {msg.summary}")
+        _logger.info(
+            "Commit Parse",
+            f"Parsed {len(parsed)} of {len(commits)} commit messages:",
+            "\n".join(parsed),
+        )
+        return commits
 
     def create_auto(self, id: str, env_vars: dict | None = None) -> Commit:
         # Skipping workflow runs: https://docs.github.com/en/actions/managing-workflow-runs-and-deployments/managing-workflow-runs/skipping-workflow-runs
@@ -147,7 +121,7 @@ def from_git(
         """
         git = git or self._manager.git
         commits = git.get_commits(revision_range)
-        return [self.create_from_msg(commit["msg"]) for commit in commits]
+        return self.create_from_msgs([commit["msg"] for commit in commits])
 
     def from_pull_request(
         self,
@@ -177,10 +151,110 @@ def make_user(user: dict):
             count=len(self.from_git(revision_range=revision_range, git=head_manager.git)),
             sort="last",
         )
-        for commit_data in commits_data:
-            commit = self.create_from_msg(commit_data["commit"]["message"])
+        parsed_commits = self.create_from_msgs(
+            [commit_data["commit"]["message"] for commit_data in commits_data]
+        )
+        for commit, commit_data in zip(parsed_commits, commits_data, strict=True):
             commit.authors = [make_user(author) for author in commit_data["commit"]["authors"]]
             if not commit_data["commit"]["authoredByCommitter"]:
                 commit.committer = make_user(commit_data["commit"]["committer"])
             commits.append(commit)
         return commits
+
+    def _syntax(
+        self,
+    ) -> tuple[
+        conventional_commits.ConventionalCommitParser,
+        conventional_commits.ConventionalCommitWriter,
+        dict[tuple[str, frozenset[str]], str],
+    ]:
+        """Get the parser, writer, and dev-commit index of the current commit configurations.
+
+        They are cached by a digest of the `commit.config` subtree
+        and the types and scopes of `commit.dev`,
+        so regular expressions are only compiled once per configuration,
+        and are shared by all managers with the same configuration.
+        Each manager also keeps the last result along with the configuration objects,
+        so the digest is only computed again when they are replaced.
+        The index maps the type and scope set of each dev commit to its ID.
+        """
+        config = self._manager.data["commit.config"]
+        dev = self._manager.data["commit.dev"]
+        if self._syntax_data and self._syntax_data[0] is config and self._syntax_data[1] is dev:
+            return self._syntax_value
+        dev_commits = [
+            (commit_id, commit_data["type"], commit_data.get("scope", ()))
+            for commit_id, commit_data in dev.items()
+        ]
+        key = _hash_tree.digest([config, dev_commits])
+        if key not in _SYNTAX_CACHE:
+            _SYNTAX_CACHE[key] = self._create_syntax(config, dev_commits)
+        self._syntax_data = (config, dev)
+        self._syntax_value = _SYNTAX_CACHE[key]
+        return self._syntax_value
+
+    @staticmethod
+    def _create_syntax(config: dict, dev_commits: list[tuple]) -> tuple:
+        regex = config["regex"]
+        parser = conventional_commits.create_parser(
+            type_regex=regex["validator"]["type"],
+            scope_regex=regex["validator"]["scope"],
+            description_regex=regex["validator"]["description"],
+            scope_start_separator_regex=regex["separator"]["scope_start"],
+            scope_end_separator_regex=regex["separator"]["scope_end"],
+            scope_items_separator_regex=regex["separator"]["scope_items"],
+            description_separator_regex=regex["separator"]["description"],
+            body_separator_regex=regex["separator"]["body"],
+            footer_separator_regex=regex["separator"]["footer"],
+        )
+        writer = partial(
+            conventional_commits.create,
+            scope_start=config["scope_start"],
+            scope_separator=config["scope_separator"],
+            scope_end=config["scope_end"],
+            description_separator=config["description_separator"],
+            body_separator=config["body_separator"],
+            footer_separator=config["footer_separator"],
+            type_regex=_re.compile(regex["validator"]["type"]),
+            scope_regex=_re.compile(regex["validator"]["scope"]),
+            description_regex=_re.compile(regex["validator"]["description"]),
+        )
+        dev_index = {}
+        for commit_id, commit_type, scope in dev_commits:
+            scope = frozenset({scope} if isinstance(scope, str) else scope)
+            # The first matching dev commit takes precedence.
+            dev_index.setdefault((commit_type, scope), commit_id)
+        return parser, writer, dev_index
+
+    @staticmethod
+    def _parse(
+        message: str,
+        parser: conventional_commits.ConventionalCommitParser,
+        writer: conventional_commits.ConventionalCommitWriter,
+        dev_index: dict[tuple[str, frozenset[str]], str],
+    ) -> tuple[Commit, ConventionalCommitMessage | None]:
+        """Parse a commit message, returning the commit and the parsed message,
+        or `None` instead of the parsed message if parsing failed.
+        """
+        try:
+            msg = parser.parse(message)
+            commit = Commit(
+                writer=writer,
+                type=msg.type,
+                scope=msg.scope,
+                description=msg.description,
+                body=msg.body,
+                footer=msg.footer,
+                dev_id=dev_index.get((msg.type, frozenset(msg.scope))),
+            )
+        except Exception as e:
+            _logger.warning(
+                "Commit Message Processing",
+                f"Failed to parse commit message: {e}",
+                message,
+            )
+            parts = message.split("\n", 1)
+            description = parts[0]
+            body = parts[1] if len(parts) > 1 else ""
+            return Commit(writer=writer, description=description, body=body), None
+        return commit, msg
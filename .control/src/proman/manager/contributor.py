@@ -1,11 +1,12 @@
 from __future__ import annotations as _annotations
 
-import copy
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 import pyserials as ps
 from loggerman import logger
 
+from proman.util import hash_tree
+
 if _TYPE_CHECKING:
     from proman.dstruct import User
     from proman.manager import Manager
@@ -17,7 +18,7 @@ def __init__(self, manager: Manager):
         self._filepath = self._manager.git.repo_path / self._manager.data[f"control.contributor.path"]
         contributors = self._manager.data["contributor"]
         super().__init__(contributors)
-        self._read = copy.deepcopy(contributors)
+        self._read = hash_tree.digest(contributors)
         return
 
     def add(self, user: User) -> dict:
@@ -36,7 +37,7 @@ def commit_changes(self, amend: bool = False) -> str | None:
         return self._manager.git.commit(message=str(commit.conv_msg), amend=amend)
 
     def write_file(self) -> bool:
-        if self.as_dict == self._read:
+        if hash_tree.digest(self.as_dict) == self._read:
             return False
         self._filepath.write_text(
             ps.write.to_json_string(self.as_dict, sort_keys=True, indent=3).strip() + "\n",
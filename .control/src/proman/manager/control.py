@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import copy
-import functools as _functools
-import shutil as _shutil
-import stat as _stat
+import contextlib as _contextlib
+import datetime as _datetime
+import hashlib as _hashlib
+import json as _json
+import threading as _threading
+import time as _time
+from concurrent import futures as _futures
 from pathlib import Path as _Path
 from typing import TYPE_CHECKING
 
@@ -11,23 +14,30 @@
 import mdit as _mdit
 import pylinks
 import pyserials as _ps
+import ruamel.yaml as _yaml
 from loggerman import logger as _logger
 from pylinks.exception.api import WebAPIError as _WebAPIError
 
+from proman import const, exception
 from proman import data_validator as _data_validator
 from proman import file_gen as _file_gen
+from proman.data_extension import ExtensionFetcher
 from proman.data_generator import DataGenerator
 from proman.data_generator_inline import InlineDataGenerator
-from proman import const
-from proman.dtype import DynamicDir, DynamicDirType, DynamicFileChangeType, DynamicFile
-from proman import exception
+from proman.data_resolver import DataResolver
+from proman.dtype import DynamicDir, DynamicDirType, DynamicFile, DynamicFileChangeType
+from proman.file_gen import digest as _file_digest
+from proman.file_gen import duplicate as _duplicate
+from proman.file_gen.digest import FileStatCache as _FileStatCache
+from proman.util import hash_tree as _hash_tree
+from proman.util import jsonpath as _jsonpath_util
+from proman.util.cow import CopyOnWriteDict as _CopyOnWriteDict
+from proman.util.transaction import FileTransaction as _FileTransaction
 
 if TYPE_CHECKING:
-    import ruamel.yaml
     from versionman.pep440_semver import PEP440SemVer
 
     from proman.manager import Manager
-    from pycacheman.serializable import SerializableCacheManager
 
 
 class ControlCenterManager:
@@ -37,6 +47,9 @@ def __init__(
         cc_path: _Path,
         future_versions: dict[str, str | PEP440SemVer] | None = None,
         clean_state: bool = False,
+        incremental: bool = False,
+        offline: bool = False,
+        max_load_workers: int = 8,
     ):
         self._manager = manager
         self._git = self._manager.git
@@ -46,8 +59,20 @@ def __init__(
         self._github_token = self._manager.token.github.get()
         self._github_api = self._manager.gh_api_bare
         self._future_vers = future_versions or {}
+        self._incremental = incremental and not clean_state
+        self._max_load_workers = max_load_workers
 
         self._path_root = self._git.repo_path
+        cache_dir = self._manager.data.get("control.cache.dir")
+        self._ext_fetcher = ExtensionFetcher(
+            tag_name=self._manager.data["control.extension_tag"],
+            cache_path=self._path_root / cache_dir / "extension.yaml" if cache_dir else None,
+            ttl=_datetime.timedelta(hours=self._manager.data.get("control.cache.retention_hours.extension", 0)),
+            offline=offline,
+        )
+        self._file_stat_cache = _FileStatCache(
+            path=self._path_root / cache_dir / "file_stat.json" if cache_dir else None
+        )
 
         self._data_raw: _ps.NestedDict | None = None
         self._data: _ps.NestedDict | None = None
@@ -55,100 +80,156 @@ def __init__(
         self._dirs: list[DynamicDir] = []
         self._dirs_to_apply: list[tuple[str, str, DynamicFileChangeType]] = []
         self._changes: list[tuple[str, DynamicFileChangeType]] = []
+        self._hash_tree: _hash_tree.HashTree | None = None
+        self._hash_tree_before: _hash_tree.HashTree | None = None
+        self._input_digests: dict[str, dict[str, str]] = {"file": {}, "extension": {}}
+        self._stages: dict[str, tuple[str, float]] = {}
         return
 
     def load(self) -> _ps.NestedDict:
-        def _load_file(filepath: _Path):
-            file_content = filepath.read_text().strip()
-            if not file_content:
-                _logger.notice(
-                    "Empty Configuration File",
-                    _mdit.inline_container(
-                        "The control center configuration file at ",
-                        _mdit.element.code_span(str(filepath)),
-                        " is empty.",
-                    ),
-                )
-                return
-            try:
-                data = _ps.read.yaml_from_file(
-                    path=filepath,
-                    safe=True,
-                    constructors={
-                        self._manager.data["control.extension_tag"]: self._create_external_tag_constructor(
-                            tag_name=self._manager.data["control.extension_tag"],
-                            cache_manager=self._manager.cache,
-                            filepath=filepath,
-                            file_content=file_content,
-                        )
-                    },
-                )
-            except _ps.exception.read.PySerialsInvalidDataError as e:
-                raise exception.PromanInvalidConfigFileDataError(cause=e) from None
-            if not self._data_raw:
-                self._data_raw = data
-                return
-            try:
-                log = _ps.update.recursive_update(
-                    source=self._data_raw,
-                    addon=data,
-                )
-            except _ps.exception.update.PySerialsUpdateRecursiveDataError as e:
-                raise exception.PromanDuplicateConfigFileDataError(
-                    filepath=filepath, cause=e
-                ) from None
-            # log_admonitions = []
-            # for key, title in (
-            #     ("added", "Added"),
-            #     ("list_appended", "Appended List"),
-            #     ("skipped", "Skipped"),
-            # ):
-            #     if not log[key]:
-            #         continue
-            #     key_list = _mdit.element.unordered_list(
-            #         [_mdit.element.code_span(item) for item in sorted(log[key])]
-            #     )
-            #     log_admonitions.append(
-            #         _mdit.element.admonition(
-            #             title=f"{title} Keys",
-            #             body=key_list,
-            #             dropdown=True,
-            #         )
-            #     )
-            _logger.success(
-                "Loaded Configurations",
-                _logger.data_block({k: [str(v) for v in value] for k, value in log.items()}),
-                # _mdit.block_container(*log_admonitions),
-            )
-            return
-
+        """Load and merge all control center configuration files.
+
+        Files are read and parsed concurrently on a thread pool,
+        while merging is done on the main thread in sorted path order,
+        so that the result and any duplicate-key errors are deterministic.
+        Each file is merged as soon as it and all files before it are parsed.
+        Before parsing, all extension tags in all files are collected,
+        and their external data are fetched concurrently.
+
+        The loaded data are the input of `generate_data`,
+        which modifies them in place instead of working on a copy.
+        """
         if self._data_raw:
             return self._data_raw
-        with _logger.sectioning("Config Files Load"):
+        with self._stage("Config Files Load"):
             self._data_raw = {}
             if self._path_cc.is_file():
-                with _logger.sectioning(
-                        _mdit.element.code_span(str(self._path_cc))
-                    ):
-                        _load_file(filepath=self._path_cc)
+                filepaths = [self._path_cc]
             else:
-                for path in sorted(self._path_cc.rglob("*"), key=lambda p: (p.parts, p)):
-                    if path.is_file() and path.suffix.lower() in (".yaml", ".yml"):
-                        with _logger.sectioning(
-                            _mdit.element.code_span(str(path.relative_to(self._path_cc)))
-                        ):
-                            _load_file(filepath=path)
-        with _logger.sectioning("Post-Load Data Validation"):
+                filepaths = [
+                    path for path in sorted(self._path_cc.rglob("*"), key=lambda p: (p.parts, p))
+                    if path.is_file() and path.suffix.lower() in (".yaml", ".yml")
+                ]
+            contents = [filepath.read_text() for filepath in filepaths]
+            self._ext_fetcher.prefetch(
+                tag_value for content in contents for tag_value in self._ext_fetcher.scan(content)
+            )
+            with _jsonpath_util.memoized_parser(), _futures.ThreadPoolExecutor(
+                max_workers=min(self._max_load_workers, len(filepaths)) or 1,
+                thread_name_prefix="proman-cc-load",
+            ) as executor:
+                parsed = [
+                    executor.submit(self._parse_file, filepath, content)
+                    for filepath, content in zip(filepaths, contents, strict=False)
+                ]
+                for filepath, future in zip(filepaths, parsed, strict=False):
+                    with _logger.sectioning(
+                        _mdit.element.code_span(
+                            str(filepath if filepath == self._path_cc else filepath.relative_to(self._path_cc))
+                        )
+                    ):
+                        try:
+                            data = future.result()
+                        except _ps.exception.read.PySerialsInvalidDataError as e:
+                            for remaining in parsed:
+                                remaining.cancel()
+                            raise exception.PromanInvalidConfigFileDataError(cause=e) from None
+                        self._merge_file(filepath=filepath, data=data)
+            self._ext_fetcher.save()
+        with self._stage("Post-Load Data Validation"):
             _data_validator.validate(data=self._data_raw, source="source", before_substitution=True)
         return self._data_raw
 
+    def _parse_file(self, filepath: _Path, file_content_raw: str) -> dict | None:
+        """Parse a single configuration file.
+
+        This is run on worker threads, and thus must not log or modify shared data,
+        other than recording input digests.
+
+        Files that do not contain the extension tag are parsed with a shared,
+        C-accelerated safe loader, instead of creating a new loader
+        with the custom constructor for each file.
+        """
+        file_content = file_content_raw.strip()
+        self._input_digests["file"][str(filepath.relative_to(self._path_root))] = _digest(file_content)
+        if not file_content:
+            return None
+        tag_name = self._manager.data["control.extension_tag"]
+        if tag_name not in file_content:
+            try:
+                return _safe_yaml_loader().load(file_content_raw)
+            except _yaml.YAMLError as e:
+                raise _ps.exception.read.PySerialsInvalidDataError(
+                    source_type="file",
+                    filepath=filepath.resolve(),
+                    data_type="yaml",
+                    data=file_content_raw,
+                    cause=e,
+                ) from None
+        return _ps.read.yaml_from_file(
+            path=filepath,
+            safe=True,
+            constructors={
+                tag_name: self._create_external_tag_constructor(
+                    tag_name=tag_name,
+                    fetcher=self._ext_fetcher,
+                    filepath=filepath,
+                    file_content=file_content,
+                    digests=self._input_digests["extension"],
+                )
+            },
+        )
+
+    def _merge_file(self, filepath: _Path, data: dict | None) -> None:
+        if data is None:
+            _logger.notice(
+                "Empty Configuration File",
+                _mdit.inline_container(
+                    "The control center configuration file at ",
+                    _mdit.element.code_span(str(filepath)),
+                    " is empty.",
+                ),
+            )
+            return
+        if not self._data_raw:
+            self._data_raw = data
+            return
+        try:
+            log = _ps.update.recursive_update(
+                source=self._data_raw,
+                addon=data,
+            )
+        except _ps.exception.update.PySerialsUpdateRecursiveDataError as e:
+            raise exception.PromanDuplicateConfigFileDataError(
+                filepath=filepath, cause=e
+            ) from None
+        _logger.success(
+            "Loaded Configurations",
+            _logger.data_block({k: [str(v) for v in value] for k, value in log.items()}),
+        )
+        return
+
     def generate_data(self) -> _ps.NestedDict:
         if self._data:
             return self._data
         self.load()
-        data = copy.deepcopy(self._data_raw)
+        if self._incremental and self._fingerprint_matches():
+            for stage in (
+                "Dynamic Data Generation",
+                "Post-Generation Data Validation",
+                "Template Resolution",
+                "Final Data Validation",
+            ):
+                self._stages[stage] = ("skipped", 0.0)
+            # Only `project.file` and `project.file_digest` are updated afterwards
+            # (by file generation), so all other data are shared with the previous metadata.
+            self._data = _CopyOnWriteDict(self._data_before)
+            self._manager.cache.save()
+            return self._data
+        data = self._data_raw
         code_context_call = {"manager": self._manager}
         code_context_call["hook"] = InlineDataGenerator(manager=self._manager)
+        resolver = DataResolver(relative_template_keys=const.RELATIVE_TEMPLATE_KEYS)
 
         def get_prefix(get, prefix: str):
             return [get(key) for key in data.keys() if key.startswith(prefix)]
@@ -170,28 +251,28 @@ def get_prefix(get, prefix: str):
             relative_key_key="__key__",
         )
 
-        with _logger.sectioning("Dynamic Data Generation"):
+        with self._stage("Dynamic Data Generation"):
             DataGenerator(
                 data=data,
                 manager=self._manager,
                 data_main=self._manager.main.data,
                 future_versions=self._future_vers,
             ).generate()
-        with _logger.sectioning("Post-Generation Data Validation"):
+        with self._stage("Post-Generation Data Validation"):
             # Validate again to fill default values that depend on generated data
             # Example: A key may be referencing `team.owner.email.url`, which has a default
             # value based on `team.owner.email.id`. But since `team.owner` is generated
             # dynamically, the default value for `team.owner.email.url` is not set in the initial validation.
             _data_validator.validate(data=data(), source="source", before_substitution=True)
-        with _logger.sectioning("Template Resolution"):
-            data.fill()
+        with self._stage("Template Resolution"):
+            resolver.resolve(data)
             _logger.success(
                 "Filled Data",
                 "All template variables have been successfully resolved.",
             )
         self._manager()  # Reset the getter function
         data = _ps.NestedDict(_ps.update.remove_keys(data(), const.RELATIVE_TEMPLATE_KEYS))
-        with _logger.sectioning("Final Data Validation"):
+        with self._stage("Final Data Validation"):
             _data_validator.validate(data=data(), source="source")
         self._data = data
         self._manager.cache.save()
@@ -201,21 +282,39 @@ def generate_files(self) -> list[DynamicFile]:
         if self._files:
             return self._files
         self.generate_data()
-        with _logger.sectioning("Dynamic File Generation"):
+        with self._stage("Dynamic File Generation"):
             self._files = _file_gen.generate(
                 manager=self._manager,
                 data=self._data,
                 data_before=self._data_before,
                 repo_path=self._path_root,
+                fingerprint=(
+                    (lambda: self.fingerprint(generated=True)) if self._incremental else None
+                ),
+                stat_cache=self._file_stat_cache,
             )
+            self._hash_tree = _hash_tree.HashTree.from_data(self._data())
+            self._files.append(
+                _file_gen.hash_tree_file(
+                    files=self._files,
+                    hash_tree=self._hash_tree,
+                    data=self._data,
+                    data_before=self._data_before,
+                    repo_path=self._path_root,
+                )
+            )
+            self._file_stat_cache.save()
         return self._files
 
     def compare(self):
         if self._changes and self._files and self._dirs:
             return self._changes, self._files, self._dirs
         files = self.generate_files()
-        metadata_changes = _ps.compare.items(
-            source=self._data(), target=self._data_before(), path=""
+        metadata_changes = _hash_tree.compare(
+            source=self._data(),
+            target=self._data_before(),
+            source_tree=self._hash_tree,
+            target_tree=self._load_hash_tree_before(),
         )
         all_paths = []
         for change_type in ("removed", "added", "modified"):
@@ -231,27 +330,62 @@ def report(self) -> ControlCenterReporter:
             metadata=self._changes,
             files=self._files,
             dirs=self._dirs,
+            stages=self._stages,
+            cache=self._manager.cache.stats,
         )
 
+    def fingerprint(self, generated: bool = False) -> dict:
+        """Compute the fingerprint of all control center inputs.
+
+        The fingerprint is a SHA-256 digest over the contents of all loaded
+        control center files, all external (`!ext`) payloads, the cached API data,
+        the git tag and branch state, the given future versions,
+        the version of proman itself, and the outputs of runs that are also inputs,
+        i.e., the variables and the metadata of the main branch.
+
+        Parameters
+        ----------
+        generated
+            Whether to take the outputs from the metadata generated by this run,
+            instead of the previous metadata.
+            This gives the fingerprint to store for the next run,
+            where the generated metadata is the previous metadata.
+
+        Returns
+        -------
+        A dictionary with the overall digest under `fingerprint`,
+        and the digest of each input category under `components`.
+        """
+        self.load()
+        components = self._fingerprint_components(
+            data=self.generate_data() if generated else self._data_before
+        )
+        return {"fingerprint": _digest(components), "components": components}
+
     def apply_changes(self) -> None:
         """Apply changes to dynamic repository files."""
         generated_files = self.generate_files()
         self._compare_dirs()
+        cache_dir = self._manager.data.get("control.cache.dir") or ".local/cache"
+        transaction = _FileTransaction(
+            journal_dir=self._path_root / cache_dir / "transaction",
+            max_workers=self._max_load_workers,
+        )
         logs = {}
         for dir_path, dir_path_before, status in self._dirs_to_apply:
             dir_path_abs = self._path_root / dir_path if dir_path else None
             dir_path_before_abs = self._path_root / dir_path_before if dir_path_before else None
             if status is DynamicFileChangeType.REMOVED:
                 logs.setdefault(f"{status.value.title} Directories", []).append(dir_path_before_abs)
-                _shutil.rmtree(dir_path_before_abs)
+                transaction.remove(dir_path_before_abs)
             elif status is DynamicFileChangeType.MOVED:
                 logs.setdefault(f"{status.value.title} Directories", []).append(
                     f"{dir_path_before_abs} -> {dir_path_abs}"
                 )
-                _shutil.move(dir_path_before_abs, dir_path_abs)
+                transaction.move(dir_path_before_abs, dir_path_abs)
             elif status is DynamicFileChangeType.ADDED:
                 logs.setdefault(f"{status.value.title} Directories", []).append(dir_path_abs)
-                dir_path_abs.mkdir(parents=True, exist_ok=True)
+                transaction.mkdir(dir_path_abs)
         for generated_file in generated_files:
             filepath_abs = self._path_root / generated_file.path if generated_file.path else None
             filepath_before_abs = (
@@ -265,7 +399,7 @@ def apply_changes(self) -> None:
                 logs.setdefault(f"{generated_file.change.value.title} Files", []).append(
                     filepath_before_abs
                 )
-                filepath_before_abs.unlink(missing_ok=True)
+                transaction.remove(filepath_before_abs)
             if generated_file.change in (
                 DynamicFileChangeType.ADDED,
                 DynamicFileChangeType.MODIFIED,
@@ -277,14 +411,17 @@ def apply_changes(self) -> None:
                     if generated_file.change in (DynamicFileChangeType.MOVED_MODIFIED, DynamicFileChangeType.MOVED)
                     else filepath_abs
                 )
-                filepath_abs.parent.mkdir(parents=True, exist_ok=True)
-                with open(filepath_abs, "w") as f:
-                    f.write(f"{generated_file.content.strip()}\n")
-                if generated_file.executable:
-                    filepath_abs.chmod(
-                        filepath_abs.stat().st_mode | _stat.S_IXUSR | _stat.S_IXGRP | _stat.S_IXOTH
-                    )
-        self._apply_duplicates()
+                transaction.write(
+                    filepath_abs,
+                    f"{generated_file.content.strip()}\n",
+                    executable=generated_file.executable,
+                )
+        result = transaction.commit()
+        if result["unchanged"]:
+            logs["Skipped Files (Identical Content)"] = result["unchanged"]
+        for status, paths in self._apply_duplicates().items():
+            if paths and status != "unchanged":
+                logs[f"{status.title()} Duplicate Files"] = paths
         log_lines = []
         for title, files in sorted(logs.items()):
             log_lines.extend([title, "-" * len(title)])
@@ -293,39 +430,19 @@ def apply_changes(self) -> None:
         _logger.info("Applied Changes", "\n".join(log_lines))
         return
 
-    def _apply_duplicates(self):
-        for key, duplicate in self._data_before.items():
-            if not key.startswith("copy_"):
-                continue
-            if "source" in duplicate:
-                for destination in duplicate["destinations"]:
-                    self._path_root.joinpath(destination).unlink(missing_ok=True)
-            else:
-                for source_glob in duplicate["sources"]:
-                    for source in self._path_root.glob(source_glob):
-                        for destination in duplicate["destinations"]:
-                            self._path_root.joinpath(destination).joinpath(
-                                _Path(source).stem
-                            ).unlink(missing_ok=True)
-        for key, duplicate in self._data.items():
-            if not key.startswith("copy_"):
-                continue
-            if "source" in duplicate:
-                for destination in duplicate["destinations"]:
-                    _shutil.copy2(
-                        self._path_root.joinpath(duplicate["source"]),
-                        self._path_root.joinpath(destination),
-                    )
-            else:
-                for source_glob in duplicate["sources"]:
-                    for source in self._path_root.glob(source_glob):
-                        for destination in duplicate["destinations"]:
-                            destination_path = self._path_root.joinpath(destination).joinpath(
-                                _Path(source).stem
-                            )
-                            destination_path.parent.mkdir(parents=True, exist_ok=True)
-                            _shutil.copy2(self._path_root.joinpath(source), destination_path)
-        return
+    def _apply_duplicates(self) -> dict[str, list[_Path]]:
+        cache_dir = self._manager.data.get("control.cache.dir")
+        stat_cache = _FileStatCache(
+            path=self._path_root / cache_dir / "duplicate_stat.json" if cache_dir else None
+        )
+        result = _duplicate.sync(
+            data=self._data,
+            data_before=self._data_before,
+            repo_path=self._path_root,
+            stat_cache=stat_cache,
+        )
+        stat_cache.save()
+        return result
 
     def _compare_dirs(self):
         def compare_source(main_key: str, root_path: str, root_path_before: str):
@@ -455,14 +572,133 @@ def _compare_dir_paths(self, path, path_before) -> DynamicFileChangeType:
             status = DynamicFileChangeType.UNCHANGED if path_exists else DynamicFileChangeType.ADDED
         return status
 
+    @_contextlib.contextmanager
+    def _stage(self, title: str):
+        start = _time.perf_counter()
+        with _logger.sectioning(title):
+            yield
+        self._stages[title] = ("executed", _time.perf_counter() - start)
+        return
+
+    def _fingerprint_matches(self) -> bool:
+        """Check whether control center inputs are unchanged since the last run."""
+        log_title = "Incremental Run"
+        if not self._data_before:
+            _logger.info(log_title, "No previous metadata available; running all stages.")
+            return False
+        filepath = self._path_root / _file_gen.fingerprint_path(
+            self._data_before["control.metadata.path"]
+        )
+        if not filepath.is_file():
+            _logger.info(
+                log_title,
+                _mdit.inline_container(
+                    "No stored fingerprint found at ",
+                    _mdit.element.code_span(str(filepath)),
+                    "; running all stages.",
+                ),
+            )
+            return False
+        try:
+            stored = _ps.read.json_from_file(path=filepath)
+        except _ps.exception.read.PySerialsReadException:
+            _logger.warning(log_title, "Stored fingerprint is corrupted; running all stages.")
+            return False
+        current = self.fingerprint()
+        if stored.get("fingerprint") != current["fingerprint"]:
+            stored_components = stored.get("components", {})
+            changed = [
+                key for key, value in current["components"].items()
+                if stored_components.get(key) != value
+            ]
+            _logger.info(
+                log_title,
+                f"Control center inputs changed since the last run ({', '.join(changed)}); "
+                "running all stages.",
+            )
+            return False
+        _logger.success(
+            log_title,
+            "Control center inputs are unchanged since the last run "
+            f"(fingerprint {current['fingerprint'][:12]}); reusing the previous metadata.",
+        )
+        return True
+
+    def _load_hash_tree_before(self) -> _hash_tree.HashTree:
+        """Get the hash tree of the previous metadata.
+
+        Digests of the subtrees stored in the metadata file are read from the stored hash tree,
+        if it is valid for the current metadata file;
+        all other digests are computed from the data.
+        """
+        if self._hash_tree_before:
+            return self._hash_tree_before
+        log_title = "Metadata Hash Tree"
+        known = {}
+        if self._data_before:
+            metadata_path = self._path_root / self._data_before["control.metadata.path"]
+            filepath = self._path_root / _file_gen.hash_tree_path(
+                self._data_before["control.metadata.path"]
+            )
+            stored = {}
+            if filepath.is_file():
+                try:
+                    stored = _ps.read.json_from_file(path=filepath)
+                except _ps.exception.read.PySerialsReadException:
+                    _logger.warning(log_title, "Stored hash tree is corrupted; ignored it.")
+            stored_digest = stored.get("metadata") if isinstance(stored, dict) else None
+            if stored_digest and (
+                self._file_stat_cache.verified(metadata_path, stored_digest)
+                or (
+                    metadata_path.is_file()
+                    and _file_digest.content(metadata_path.read_text()) == stored_digest
+                )
+            ):
+                known = stored["tree"]
+                self._file_stat_cache.record(metadata_path, stored_digest)
+            else:
+                _logger.info(
+                    log_title,
+                    "No valid stored hash tree found for the previous metadata; computing it.",
+                )
+        self._hash_tree_before = _hash_tree.HashTree.from_data(self._data_before(), known=known)
+        return self._hash_tree_before
+
+    def _fingerprint_components(self, data: _ps.NestedDict) -> dict:
+        import proman
+
+        main_data = self._manager.main.data
+        if main_data is self._manager.data:
+            # On the main branch, the main metadata is the metadata rewritten by each run.
+            main_data = data
+        return {
+            "proman": proman.__version__,
+            "file": _digest(self._input_digests["file"]),
+            "extension": _digest(self._input_digests["extension"]),
+            "cache": _digest(self._manager.cache.data()),
+            "git": self._git_digest(),
+            "future_versions": _digest({k: str(v) for k, v in self._future_vers.items()}),
+            "variable": _digest(data.get("variable")),
+            "main": _digest(main_data()),
+        }
+
+    def _git_digest(self) -> str:
+        tags = self._git.run_command(
+            ["for-each-ref", "--format=%(refname) %(objectname)", "refs/tags"],
+            log_title="Git: List Tags",
+        ).out
+        curr_branch, other_branches = self._git.get_all_branch_names()
+        return _digest({"tags": tags, "branches": sorted([curr_branch, *other_branches])})
+
     @staticmethod
     def _create_external_tag_constructor(
         filepath: _Path,
         file_content: str,
+        fetcher: ExtensionFetcher,
         tag_name: str = "!ext",
-        cache_manager: SerializableCacheManager | None = None,
+        digests: dict[str, str] | None = None,
     ):
-        def load_external_data(loader: ruamel.yaml.SafeConstructor, node: ruamel.yaml.ScalarNode):
+        def load_external_data(loader: _yaml.SafeConstructor, node: _yaml.ScalarNode):
             tag_value = loader.construct_scalar(node)
             if not tag_value:
                 raise exception.PromanEmptyTagInConfigFileError(
@@ -470,18 +706,10 @@ def load_external_data(loader: ruamel.yaml.SafeConstructor, node: ruamel.yaml.Sc
                     data=file_content,
                     node=node,
                 )
-            if cache_manager:
-                cached_data = cache_manager.get(typ="extension", key=tag_value)
-                if cached_data:
-                    return cached_data
             url, *jsonpath_expr = tag_value.split(" ", 1)
             file_ext = url.split(".")[-1].lower()
             try:
-                data_raw_whole = pylinks.http.request(
-                    url=url,
-                    verb="GET",
-                    response_type="str",
-                )
+                data_raw_whole = fetcher.get(url)
             except _WebAPIError as e:
                 raise exception.PromanUnreachableTagInConfigFileError(
                     filepath=filepath,
@@ -490,6 +718,13 @@ def load_external_data(loader: ruamel.yaml.SafeConstructor, node: ruamel.yaml.Sc
                     url=url,
                     cause=e,
                 ) from None
+            if data_raw_whole is None:
+                raise exception.PromanOfflineTagInConfigFileError(
+                    filepath=filepath,
+                    data=file_content,
+                    node=node,
+                    url=url,
+                )
             if file_ext == "json":
                 data = _ps.read.json_from_string(data=data_raw_whole, strict=False)
             elif file_ext in ("yaml", "yml"):
@@ -512,23 +747,49 @@ def load_external_data(loader: ruamel.yaml.SafeConstructor, node: ruamel.yaml.Sc
                     raise ValueError(
                         f"No match found for JSONPath '{jsonpath_expr}' in the JSON data from '{url}'"
                     )
-            if cache_manager:
-                cache_manager.set(typ="extension", key=tag_value, value=data)
+            if digests is not None:
+                digests[tag_value] = _digest(data)
             return data
 
         return load_external_data
 
 
+_thread_local = _threading.local()
+
+
+def _safe_yaml_loader() -> _yaml.YAML:
+    """Get a safe YAML loader for the current thread.
+
+    Loaders are stateful and thus not shared between threads.
+    With `ruamel.yaml.clib` installed (a dependency of `ruamel.yaml` on CPython),
+    parsing is done by the C-based parser.
+    """
+    loader = getattr(_thread_local, "yaml_loader", None)
+    if loader is None:
+        loader = _thread_local.yaml_loader = _yaml.YAML(typ="safe", pure=False)
+    return loader
+
+
+def _digest(data) -> str:
+    """Compute a SHA-256 digest of JSON-serializable data."""
+    serialized = data if isinstance(data, str) else _json.dumps(data, sort_keys=True, default=str)
+    return _hashlib.sha256(serialized.encode()).hexdigest()
+
+
 class ControlCenterReporter:
     def __init__(
         self,
         metadata: list[tuple[str, DynamicFileChangeType]],
         files: list[DynamicFile],
         dirs: list[DynamicDir],
+        stages: dict[str, tuple[str, float]] | None = None,
+        cache: dict[str, dict[str, int]] | None = None,
     ):
         self.metadata = metadata
         self.files = files
         self.dirs = dirs
+        self.stages = stages or {}
+        self.cache = cache or {}
         self.has_changed_metadata = bool(self.metadata)
         self.changed_files = [
             file
@@ -586,14 +847,67 @@ def report(self) -> _mdit.Document:
         return self._create_document(content=content, section=section)
 
     def _create_document(self, content, section: dict | None = None) -> _mdit.Document:
-        details_section = _mdit.document(
-            heading="Changes",
-            section=section,
-        )
+        sections = {}
+        if section:
+            sections["changes"] = _mdit.document(
+                heading="Changes",
+                section=section,
+            )
+        if self.stages:
+            sections["stages"] = self._report_stages()
+        if self.cache:
+            sections["cache"] = self._report_cache()
         return _mdit.document(
             heading="Control Center Report",
             body={"summary": content},
-            section={"changes": details_section} if section else None,
+            section=sections or None,
+        )
+
+    def _report_stages(self) -> _mdit.Document:
+        rows = [["Stage", "Status", "Duration"]]
+        for stage, (status, duration) in self.stages.items():
+            rows.append(
+                [
+                    stage,
+                    _htmp.element.span(
+                        "⏭️" if status == "skipped" else "✅", {"title": status.title()}
+                    ),
+                    "—" if status == "skipped" else f"{duration:.2f} s",
+                ]
+            )
+        table = _mdit.element.table(
+            rows,
+            caption="⏱️ Execution stages of the control center.",
+            align_table="center",
+            align_columns=["left", "center", "right"],
+            num_rows_header=1,
+            width_columns="auto",
+        )
+        return _mdit.document(
+            heading="Stages",
+            body={"table": table},
+        )
+
+    def _report_cache(self) -> _mdit.Document:
+        rows = [["Type", "Hits", "Misses", "Expired", "Evicted"]]
+        for typ, stats in sorted(self.cache.items()):
+            rows.append(
+                [
+                    _mdit.element.code_span(typ),
+                    *(str(stats[key]) for key in ("hits", "misses", "expired", "evicted")),
+                ]
+            )
+        table = _mdit.element.table(
+            rows,
+            caption="🗃️ Usage of the local API cache.",
+            align_table="center",
+            align_columns=["left", "right", "right", "right", "right"],
+            num_rows_header=1,
+            width_columns="auto",
+        )
+        return _mdit.document(
+            heading="Cache",
+            body={"table": table},
         )
 
     def _report_metadata(self):
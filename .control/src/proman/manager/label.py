@@ -13,29 +13,47 @@
     from proman.manager import Manager
 
 
+# Key of trie nodes marking the end of a group prefix, with the group ID as value;
+# it cannot collide with child nodes, whose keys are single characters.
+_TRIE_END = ""
+
+
 class LabelManager:
     def __init__(self, manager: Manager):
         self._manager = manager
-        self._label_name_to_obj: dict[str, Label] = {}
-        self._label_id_to_obj: dict[tuple[str, str], Label] = {}
+        self._index: dict | None = None
+        self._labels: dict[str, Label] = {}
         return
 
     def from_id(self, group_id: str, label_id: str) -> Label:
-        return self.id_to_obj_map[(group_id, label_id)]
+        name = self.index["id"].get(group_id, {}).get(label_id)
+        if name is None:
+            raise KeyError((group_id, label_id))
+        return self._label(name)
+
+    @property
+    def index(self) -> dict:
+        """Index of all repository labels, created from the label data on first access.
+
+        See `create_index` for its structure.
+        """
+        if self._index is None:
+            self._index = create_index(self._manager.data.get("label", {}))
+        return self._index
 
     @property
     def name_to_obj_map(self) -> dict[str, Label]:
         """All repository labels, as a dictionary mapping full label names to Label objects."""
-        if not self._label_name_to_obj:
-            self._label_name_to_obj, self._label_id_to_obj = self._initialize_label_data()
-        return self._label_name_to_obj
+        return {name: self._label(name) for name in self.index["label"]}
 
     @property
     def id_to_obj_map(self) -> dict[tuple[str, str], Label]:
         """All repository labels, as a dictionary mapping full label IDs to Label objects."""
-        if not self._label_id_to_obj:
-            self._label_name_to_obj, self._label_id_to_obj = self._initialize_label_data()
-        return self._label_id_to_obj
+        return {
+            (group_id, label_id): self._label(name)
+            for group_id, group_labels in self.index["id"].items()
+            for label_id, name in group_labels.items()
+        }
 
     def update_status_label_on_github(
         self, issue_nr: int, old_status_labels: list[Label], new_status_label: Label
@@ -93,45 +111,98 @@ def resolve_label(self, name: str) -> Label:
         name : str
             Name of the label.
         """
-        label = self.name_to_obj_map.get(name)
-        if label:
-            return label
+        if name in self.index["label"]:
+            return self._label(name)
+        group_id = self._match_group(name)
         logger.warning(
             "Label Resolution",
-            f"Could not find label '{name}' in label data.",
+            f"Could not find label '{name}' in label data"
+            + (f" (it has the prefix of label group '{group_id}')." if group_id else "."),
         )
         return Label(category=LabelType.UNKNOWN, name=name)
 
-    def _initialize_label_data(self) -> tuple[dict[str, Label], dict[tuple[str, str], Label]]:
-        name_to_obj = {}
-        id_to_obj = {}
-        for group_id, group_data in self._manager.data.get("label", {}).items():
-            if group_id == "single":
-                for label_id, label_data in group_data.items():
-                    label = Label(
-                        category=LabelType.CUSTOM_SINGLE,
-                        name=label_data["name"],
-                        group_id=group_id,
-                        id=label_id,
-                        description=label_data.get("description", ""),
-                        color=label_data.get("color", ""),
-                    )
-                    name_to_obj[label_data["name"]] = id_to_obj[(group_id, label_id)] = label
-            else:
-                for label_id, label_data in group_data.get("label", {}).items():
-                    label = Label(
-                        category=LabelType(group_id)
-                        if group_id in ("status", "version", "branch")
-                        else LabelType.CUSTOM_GROUP,
-                        name=label_data["name"],
-                        group_id=group_id,
-                        id=label_id,
-                        prefix=group_data["prefix"],
-                        suffix=label_data["suffix"],
-                        description=label_data.get(
-                            "description", group_data.get("description", "")
-                        ),
-                        color=label_data.get("color") or group_data.get("color", ""),
-                    )
-                    name_to_obj[label_data["name"]] = id_to_obj[(group_id, label_id)] = label
-        return name_to_obj, id_to_obj
+    def _label(self, name: str) -> Label:
+        """Get the label object of an indexed label name, creating it on first access."""
+        label = self._labels.get(name)
+        if not label:
+            kwargs = self.index["label"][name]
+            label = self._labels[name] = Label(
+                **kwargs | {"category": LabelType(kwargs["category"])}
+            )
+        return label
+
+    def _match_group(self, name: str) -> str | None:
+        """Get the ID of the group with the longest prefix matching a label name, if any."""
+        node = self.index["trie"]
+        group_id = None
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                break
+            group_id = node.get(_TRIE_END, group_id)
+        return group_id
+
+
+def create_index(label_data: dict) -> dict:
+    """Create an index of all labels in the label data (i.e., the `label` key of the metadata).
+
+    Returns
+    -------
+    Dictionary with the following keys:
+    - `label`: Mapping of full label names to the keyword arguments of their `Label` objects.
+    - `id`: Mapping of group IDs to mappings of label IDs to full label names.
+    - `group`: Mapping of group IDs to their prefix, separator, full prefix (`start`), and color.
+    - `trie`: Character trie of the full prefixes of all groups,
+      where nodes ending a prefix map `""` to the group ID.
+    """
+    labels = {}
+    ids = {}
+    groups = {}
+    trie = {}
+    for group_id, group_data in label_data.items():
+        if group_id == "single":
+            for label_id, label_data_ in group_data.items():
+                labels[label_data_["name"]] = {
+                    "category": LabelType.CUSTOM_SINGLE.value,
+                    "name": label_data_["name"],
+                    "group_id": group_id,
+                    "id": label_id,
+                    "description": label_data_.get("description", ""),
+                    "color": label_data_.get("color", ""),
+                }
+                ids.setdefault(group_id, {})[label_id] = label_data_["name"]
+            continue
+        category = (
+            LabelType(group_id)
+            if group_id in ("status", "version", "branch")
+            else LabelType.CUSTOM_GROUP
+        )
+        start = f"{group_data['prefix']}{group_data.get('separator', '')}"
+        groups[group_id] = {
+            "prefix": group_data["prefix"],
+            "separator": group_data.get("separator", ""),
+            "start": start,
+            "color": group_data.get("color", ""),
+        }
+        node = trie
+        for char in start:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = group_id
+        for label_id, label_data_ in group_data.get("label", {}).items():
+            labels[label_data_["name"]] = {
+                "category": category.value,
+                "name": label_data_["name"],
+                "group_id": group_id,
+                "id": label_id,
+                "prefix": group_data["prefix"],
+                "suffix": label_data_["suffix"],
+                "description": label_data_.get("description", group_data.get("description", "")),
+                "color": label_data_.get("color") or group_data.get("color", ""),
+            }
+            ids.setdefault(group_id, {})[label_id] = label_data_["name"]
+    return {
+        "label": labels,
+        "id": ids,
+        "group": groups,
+        "trie": trie,
+    }
@@ -52,6 +52,7 @@ def set(
         test_lint: bool = False,
         package_test: bool = False,
         package_test_source: Literal["github", "pypi", "testpypi"] = "github",
+        package_test_pyargs: list[str] | None = None,
         package_build: bool = False,
         binder_build: bool = False,
         binder_deploy: bool = False,
@@ -81,7 +82,7 @@ def set(
             for key, val in self._branch_manager.data.items():
                 if key.startswith("pypkg_") and "test" in val:
                     test_out = self._create_output_package_test(
-                        pkg_id=key, source=package_test_source
+                        pkg_id=key, source=package_test_source, pyargs=package_test_pyargs
                     )
                     self._out_test.append(test_out)
         if binder_build or binder_deploy:
@@ -515,6 +516,7 @@ def _create_output_package_test(
         self,
         pkg_id: str,
         source: Literal["github", "pypi", "testpypi", "anaconda"] = "github",
+        pyargs: list[str] | None = None,
         flatten_name: bool = False,
     ) -> dict:
         pkg = self._branch_manager.data[pkg_id]
@@ -552,6 +554,7 @@ def _create_output_package_test(
                 "ref": self._ref_name,
                 "conda_env": test["conda_env"],
                 "script": test["script"],
+                "pyargs": ps.write.to_json_string(pyargs) if pyargs else "",
                 "codecov": test.get("codecov", {}),
                 "artifact": self._create_workflow_artifact_config(job_config["artifact"], env_vars),
             }
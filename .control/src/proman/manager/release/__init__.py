@@ -3,12 +3,13 @@
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 from loggerman import logger
-from versionman.pep440_semver import PEP440SemVer, latest_version_from_tags
+from versionman.pep440_semver import PEP440SemVer
 
 from proman.dstruct import Version, VersionTag
 from proman.dtype import IssueStatus, ReleaseAction
 from proman.manager.release.binder import BinderReleaseManager
 from proman.manager.release.github import GitHubReleaseManager
+from proman.manager.release.version_index import VersionTagIndex
 from proman.manager.release.zenodo import ZenodoManager
 
 if _TYPE_CHECKING:
@@ -27,6 +28,7 @@ def __init__(self, manager: Manager):
         self._binder = BinderReleaseManager(manager=self._manager)
         self._github = GitHubReleaseManager(manager=self._manager)
         self._zenodo = ZenodoManager(manager=self._manager)
+        self._version_indices: dict[tuple, VersionTagIndex] = {}
         return
 
     @property
@@ -125,19 +127,11 @@ def latest_version(
 
         git = git or self._manager.git
         ver_tag_prefix = self._manager.data["tag.version.prefix"]
-        if branch:
-            git.stash()
-            curr_branch = git.current_branch_name()
-            branch_name = branch if isinstance(branch, str) else branch.name
-            git.checkout(branch=branch_name)
-        latest_version = latest_version_from_tags(
-            tags=git.get_tags(),
-            version_tag_prefix=ver_tag_prefix,
+        branch_name = branch if isinstance(branch, str) or not branch else branch.name
+        latest_version = self.version_index(git=git, tag_prefix=ver_tag_prefix).latest(
+            ref=branch_name or "HEAD",
             release_types=("dev",) if dev_only else ("final", "pre", "post", "dev"),
         )
-        if branch:
-            git.checkout(branch=curr_branch)
-            git.stash_pop()
         if not latest_version:
             if not dev_only:
                 logger.error(f"No matching version tags found with prefix '{ver_tag_prefix}'.")
@@ -150,6 +144,30 @@ def latest_version(
             date=git.commit_date_latest(),
         )
 
+    def version_index(
+        self, git: Git | None = None, tag_prefix: str | None = None
+    ) -> VersionTagIndex:
+        """Get the version tag index of a repository.
+
+        Parameters
+        ----------
+        git
+            Git API of the repository; defaults to the manager's repository.
+        tag_prefix
+            Prefix of version tags; defaults to `tag.version.prefix` in the metadata.
+        """
+        git = git or self._manager.git
+        tag_prefix = self._manager.data["tag.version.prefix"] if tag_prefix is None else tag_prefix
+        key = (git.repo_path, tag_prefix)
+        if key not in self._version_indices:
+            cache_dir = self._manager.data.get("control.cache.dir")
+            self._version_indices[key] = VersionTagIndex(
+                git=git,
+                tag_prefix=tag_prefix,
+                cache_path=git.repo_path / cache_dir / "version_tags.json" if cache_dir else None,
+            )
+        return self._version_indices[key]
+
     def tag_next_dev_version(
         self,
         issue_num: int | str,
@@ -0,0 +1,177 @@
+from __future__ import annotations as _annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import pyserials as ps
+from loggerman import logger
+from versionman.exception.pep440_semver import VersionManInvalidPEP440SemVerError
+from versionman.pep440_semver import PEP440SemVer
+
+if _TYPE_CHECKING:
+    from typing import Literal
+
+    from gittidy import Git
+
+
+# Version of the index cache format; caches with other versions are discarded.
+_CACHE_VERSION = 1
+
+# Commit hash and commit timestamp of each tag (peeling annotated tags), and the tag name,
+# in the output of `git for-each-ref`.
+_FOR_EACH_REF_FORMAT = (
+    "%(if)%(*objectname)"
+    "%(then)%(*objectname) %(*committerdate:unix)"
+    "%(else)%(objectname) %(committerdate:unix)"
+    "%(end) %(refname:strip=2)"
+)
+
+
+class VersionTagIndex:
+    """Index of all version tags in a repository, for resolving versions without checkouts.
+
+    The index is built from a single `git for-each-ref refs/tags` call,
+    recording the commit, commit date, and release type of each version tag.
+    It is cached in memory and in a file,
+    keyed by the state of all tag references (i.e., the `packed-refs` file
+    and loose references under `refs/tags`), and is only rebuilt when tags are changed.
+    Finding the latest version of any branch then takes a single `git tag --merged` call,
+    plus lookups in the index.
+
+    Parameters
+    ----------
+    git
+        Git API of the repository.
+    tag_prefix
+        Prefix of version tags.
+    cache_path
+        Path to the index cache file.
+        If not provided, the index is only cached in memory.
+    """
+
+    def __init__(self, git: Git, tag_prefix: str, cache_path: str | Path | None = None):
+        self._git = git
+        self._tag_prefix = tag_prefix
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._git_dir: Path | None = None
+        self._state: list | None = None
+        self._tags: dict[str, list] = {}
+        return
+
+    def latest(
+        self,
+        ref: str = "HEAD",
+        release_types: tuple[Literal["final", "pre", "post", "dev"], ...] = (
+            "final",
+            "pre",
+            "post",
+            "dev",
+        ),
+    ) -> PEP440SemVer | None:
+        """Get the latest version reachable from a reference, without checking it out.
+
+        This gives the same result as `versionman.pep440_semver.latest_version_from_tags`
+        with the tags of `gittidy.Git.get_tags` at the reference:
+        the greatest version (of the given release types) among the tags on the most recent commit
+        that has any such tags, where commits are ordered by their commit date.
+        """
+        tags = self._index()
+        merged = self._git.run_command(
+            ["tag", "--merged", ref],
+            log_title="Git: Get Tags on Branch",
+        ).out
+        commits: dict[str, list] = {}
+        for tag in (merged or "").splitlines():
+            info = tags.get(tag)
+            if info and info[2] in release_types:
+                commit, date, _ = info
+                commits.setdefault(commit, [date, []])[1].append(tag)
+        if not commits:
+            return None
+        _, latest_tags = max(commits.values(), key=lambda commit_info: commit_info[0])
+        return max(PEP440SemVer(tag.removeprefix(self._tag_prefix)) for tag in latest_tags)
+
+    def _index(self) -> dict[str, list]:
+        """Get the index, rebuilding it if tag references have changed.
+
+        Returns
+        -------
+        Mapping of version tag names to their commit hash, commit timestamp, and release type.
+        """
+        state = self._refs_state()
+        if state is not None and state == self._state:
+            return self._tags
+        cache = self._read_cache()
+        if state is not None and cache.get("state") == state:
+            self._state, self._tags = state, cache["tags"]
+            return self._tags
+        refs = self._git.run_command(
+            ["for-each-ref", f"--format={_FOR_EACH_REF_FORMAT}", "refs/tags"],
+            log_title="Git: Get Tag References",
+        ).out
+        tags = {}
+        for line in (refs or "").splitlines():
+            commit, commit_date, tag = line.split(" ", 2)
+            if not (commit_date and tag.startswith(self._tag_prefix)):
+                continue
+            try:
+                version = PEP440SemVer(tag.removeprefix(self._tag_prefix))
+            except VersionManInvalidPEP440SemVerError:
+                continue
+            tags[tag] = [commit, int(commit_date), version.release_type]
+        logger.info(
+            "Version Tag Index",
+            f"Indexed {len(tags)} version tags with prefix '{self._tag_prefix}'.",
+        )
+        self._state, self._tags = state, tags
+        if state is not None:
+            self._write_cache({"version": _CACHE_VERSION, "state": state, "tags": tags})
+        return tags
+
+    def _refs_state(self) -> list | None:
+        """Get the modification times and sizes of all files storing tag references,
+        or `None` if they are not stored in files (e.g., with the reftable backend).
+        """
+        if not self._git_dir:
+            git_dir = self._git.run_command(
+                ["rev-parse", "--git-common-dir"],
+                log_title="Git: Get Directory",
+            ).out.strip()
+            self._git_dir = (self._git.repo_path / git_dir).resolve()
+        if (self._git_dir / "reftable").is_dir():
+            return None
+        state = []
+        packed_refs = self._git_dir / "packed-refs"
+        if packed_refs.is_file():
+            stat = packed_refs.stat()
+            state.append(["packed-refs", stat.st_mtime_ns, stat.st_size])
+        tags_dir = self._git_dir / "refs" / "tags"
+        for dirpath, _, filenames in os.walk(tags_dir):
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                stat = path.stat()
+                state.append([str(path.relative_to(tags_dir)), stat.st_mtime_ns, stat.st_size])
+        return [self._tag_prefix, *sorted(state)]
+
+    def _read_cache(self) -> dict:
+        if not (self._cache_path and self._cache_path.is_file()):
+            return {}
+        try:
+            cache = ps.read.json_from_file(path=self._cache_path)
+        except ps.exception.read.PySerialsReadException:
+            logger.warning(
+                "Version Tag Index",
+                f"Failed to read the cache file at '{self._cache_path}'.",
+            )
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+        return cache
+
+    def _write_cache(self, cache: dict) -> None:
+        if not self._cache_path:
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_path.write_text(ps.write.to_json_string(data=cache))
+        return
@@ -168,7 +168,8 @@ def update_gh_pages(self) -> None:
 
     @logger.sectioner("Repository Labels Reset")
     def reset_labels(self):
-        current_labels = self._manager.gh_api_actions.labels
+        # Labels are read via REST, since their numeric IDs are not available in GraphQL.
+        current_labels = self._manager.gh_api_actions.api.labels
         for current_label in current_labels:
             self._manager.gh_api_actions.label_delete(current_label["name"])
         logger.success(
@@ -183,7 +184,7 @@ def reset_labels(self):
         logger.success(
             "Created Labels",
             "Following labels have been created:",
-            self._make_labels_table(self._manager.gh_api_actions.labels, "Created Labels"),
+            self._make_labels_table(self._manager.gh_api_actions.api.labels, "Created Labels"),
         )
         return
 
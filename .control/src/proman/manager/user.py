@@ -1,6 +1,10 @@
 from __future__ import annotations as _annotations
 
+import json
 import re
+import threading
+import time
+from concurrent import futures
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 from loggerman import logger
@@ -12,7 +16,7 @@
 from proman.manager.contributor import ContributorManager
 
 if _TYPE_CHECKING:
-    from typing import Literal, Sequence
+    from typing import Any, Callable, Literal, Sequence
 
     from github_contexts.github.payload.object.issue import Issue
     from github_contexts.github.payload.object.pull_request import PullRequest
@@ -187,75 +191,30 @@ def fill_entity(
         entity: dict,
     ) -> tuple[dict, dict | None]:
         """Fill all missing information in an `entity` object."""
+        return self.fill_entities(entities=[entity])[0]
 
-        def _get_github_user(username: str | None = None, user_id: str | None = None) -> dict:
-            def add_social(name, user, url):
-                socials[name] = {"id": user, "url": url}
-                return
+    def fill_entities(
+        self,
+        entities: Sequence[dict],
+    ) -> list[tuple[dict, dict | None]]:
+        """Fill all missing information in multiple `entity` objects at once.
 
-            user_info = {}
-            if user_id and self._manager.cache:
-                user_info = self._manager.cache.get("user", user_id)
-            if user_info:
-                return user_info
-            user = (
-                self._manager.gh_api_bare.user_from_id(user_id)
-                if user_id
-                else self._manager.gh_api_bare.user(username)
-            )
-            user_info = user.info
-            if user_info["blog"] and "://" not in user_info["blog"]:
-                user_info["blog"] = f"https://{user_info['blog']}"
-            social_accounts_info = user.social_accounts
-            socials = {}
-            user_info["socials"] = socials
-            for account in social_accounts_info:
-                for provider, base_pattern, id_pattern in (
-                    ("orcid", r"orcid.org/", r"([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)"),
-                    ("researchgate", r"researchgate.net/profile/", r"([a-zA-Z0-9_-]+)(.*)"),
-                    ("linkedin", r"linkedin.com/in/", r"([a-zA-Z0-9_-]+)(.*)"),
-                    ("twitter", r"twitter.com/", r"([a-zA-Z0-9_-]+)(.*)"),
-                    ("twitter", r"x.com/", r"([a-zA-Z0-9_-]+)(.*)"),
-                ):
-                    match = re.search(rf"{base_pattern}{id_pattern}", account["url"])
-                    if match:
-                        add_social(
-                            provider,
-                            match.group(1),
-                            f"https://{base_pattern}{match.group(1)}{match.group(2)}",
-                        )
-                        break
-                else:
-                    if account["provider"] != "generic":
-                        add_social(account["provider"], None, account["url"])
-                    else:
-                        generics = socials.setdefault("generics", [])
-                        generics.append(account["url"])
-                        logger.info("Unknown account", account["url"])
-            if self._manager.cache:
-                self._manager.cache.set("user", user_info["id"], user_info)
-            return user_info
-
-        def get_orcid_publications(orcid_id: str) -> list[dict]:
-            dois = []
-            if self._manager.cache:
-                dois = self._manager.cache.get("orcid", orcid_id)
-            if not dois:
-                dois = pylinks.api.orcid(orcid_id=orcid_id).doi
-                if self._manager.cache:
-                    self._manager.cache.set("orcid", orcid_id, dois)
-            publications = []
-            for doi in dois:
-                publication_data = {}
-                if self._manager.cache:
-                    publication_data = self._manager.cache.get("doi", doi)
-                if not publication_data:
-                    publication_data = pylinks.api.doi(doi=doi).curated
-                    if self._manager.cache:
-                        self._manager.cache.set("doi", doi, publication_data)
-                publications.append(publication_data)
-            return sorted(publications, key=lambda i: i["date_tuple"], reverse=True)
+        Instead of enriching each entity separately,
+        all uncached GitHub users are first retrieved together in batched GraphQL queries,
+        and all uncached ORCID and DOI records are then retrieved concurrently.
+        New data are written to the cache in one go at the end.
 
+        Parameters
+        ----------
+        entities
+            Entity objects to fill.
+            Each object is modified in place.
+
+        Returns
+        -------
+        For each entity, a tuple of the filled entity
+        and the corresponding GitHub user information, if any.
+        """
         def make_name(user: dict):
             username = user["login"]
             if not user.get("name"):
@@ -275,11 +234,14 @@ def make_name(user: dict):
                 return {"legal": user["name"]}
             return {"first": name_parts[0], "last": name_parts[1]}
 
-        gh_id = entity.get("github", {}).get("rest_id")
-        gh_username = entity.get("github", {}).get("id")
-        github_user_info = None
-        if gh_id or gh_username:
-            github_user_info = _get_github_user(username=gh_username, user_id=gh_id)
+        new_cache_items: dict[tuple[str, str], Any] = {}
+        github_user_infos = self._get_github_users(
+            identities=[entity.get("github", {}) for entity in entities],
+            new_cache_items=new_cache_items,
+        )
+        for entity, github_user_info in zip(entities, github_user_infos):
+            if not github_user_info:
+                continue
             for key_self, key_gh in (
                 ("id", "login"),
                 ("rest_id", "id"),
@@ -307,12 +269,219 @@ def make_name(user: dict):
                     and social_name not in entity
                 ):
                     entity[social_name] = social_data
-        if "orcid" in entity and entity["orcid"].get("get_pubs"):
-            entity["orcid"]["pubs"] = get_orcid_publications(orcid_id=entity["orcid"]["user"])
-        _validator.validate(data=entity, schema="entity", before_substitution=True)
-        entity_ = pyserials.NestedDict(entity)
-        entity_.fill()
-        return entity_(), github_user_info
+        entities_with_pubs = [
+            entity for entity in entities if "orcid" in entity and entity["orcid"].get("get_pubs")
+        ]
+        publications = self._get_orcid_publications(
+            orcid_ids=[entity["orcid"]["user"] for entity in entities_with_pubs],
+            new_cache_items=new_cache_items,
+        )
+        for entity in entities_with_pubs:
+            entity["orcid"]["pubs"] = publications[entity["orcid"]["user"]]
+        if self._manager.cache:
+            for (typ, key), value in new_cache_items.items():
+                self._manager.cache.set(typ, key, value)
+        out = []
+        for entity, github_user_info in zip(entities, github_user_infos):
+            _validator.validate(data=entity, schema="entity", before_substitution=True)
+            entity_ = pyserials.NestedDict(entity)
+            entity_.fill()
+            out.append((entity_(), github_user_info))
+        return out
+
+    def _get_github_users(
+        self,
+        identities: Sequence[dict],
+        new_cache_items: dict[tuple[str, str], Any],
+    ) -> list[dict | None]:
+        """Get GitHub user information for a list of GitHub identities.
+
+        Users identified by a REST ID are first looked up in the cache.
+        Users identified by a username are queried together via GraphQL,
+        while the rest (and all users, if the GraphQL API is not available)
+        are queried concurrently via the REST API.
+        """
+        out: list[dict | None] = [None] * len(identities)
+        pending: dict[tuple[str, str | int], list[int]] = {}
+        for idx, identity in enumerate(identities):
+            user_id = identity.get("rest_id")
+            username = identity.get("id")
+            if not (user_id or username):
+                continue
+            if user_id and self._manager.cache:
+                user_info = self._manager.cache.get("user", user_id)
+                if user_info:
+                    out[idx] = user_info
+                    continue
+            key = ("rest_id", user_id) if user_id else ("id", username)
+            pending.setdefault(key, []).append(idx)
+        if not pending:
+            return out
+        fetched = self._get_github_users_graphql(
+            usernames=[value for typ, value in pending if typ == "id"]
+        )
+        missing = [key for key in pending if key not in fetched]
+        for key, user_info in zip(
+            missing,
+            _map_concurrently(
+                lambda key: self._get_github_user_rest(**{"user_id" if key[0] == "rest_id" else "username": key[1]}),
+                missing,
+                min_interval=0,
+            ),
+        ):
+            fetched[key] = user_info
+        for key, indices in pending.items():
+            user_info = fetched[key]
+            new_cache_items[("user", user_info["id"])] = user_info
+            for idx in indices:
+                out[idx] = user_info
+        return out
+
+    def _get_github_users_graphql(self, usernames: Sequence[str]) -> dict[tuple[str, str], dict]:
+        """Query GitHub users and organizations by username in batched GraphQL queries.
+
+        Queries are added to the GraphQL batcher of the repository API,
+        and are thus sent together with any other pending queries.
+
+        Returns
+        -------
+        Mapping of `("id", username)` to user information
+        in the same format as the REST API, for all found users.
+        An empty dictionary is returned when the GraphQL API is not available
+        (e.g., without an access token).
+        """
+        batcher = self._manager.gh_api_actions.batcher
+        if not usernames or not batcher.available:
+            return {}
+        requests = {
+            username: batcher.add(
+                f"repositoryOwner(login: {json.dumps(username)}) {{{_GITHUB_GRAPHQL_OWNER_FIELDS}}}"
+            )
+            for username in usernames
+        }
+        out = {}
+        failed = []
+        for username, request in requests.items():
+            owner = request.result()
+            if request.errors:
+                failed.append(username)
+            if owner:
+                out[("id", username)] = self._process_github_user(
+                    user_info={
+                        "login": owner["login"],
+                        "id": owner["databaseId"],
+                        "node_id": owner["id"],
+                        "html_url": owner["url"],
+                        "type": owner["__typename"],
+                        "name": owner.get("name"),
+                        "company": owner.get("company"),
+                        "bio": owner.get("bio"),
+                        "avatar_url": owner["avatarUrl"],
+                        "blog": owner.get("websiteUrl") or "",
+                        "location": owner.get("location"),
+                        "email": owner.get("email") or None,
+                    },
+                    social_accounts=[
+                        {"provider": account["provider"].lower(), "url": account["url"]}
+                        for account in owner.get("socialAccounts", {}).get("nodes", [])
+                    ],
+                )
+        if failed:
+            logger.warning(
+                "GitHub GraphQL User Query",
+                "Failed to query some users via GraphQL; falling back to the REST API.",
+                logger.pretty(failed),
+            )
+        return out
+
+    def _get_github_user_rest(self, username: str | None = None, user_id: str | None = None) -> dict:
+        user = (
+            self._manager.gh_api_bare.user_from_id(user_id)
+            if user_id
+            else self._manager.gh_api_bare.user(username)
+        )
+        return self._process_github_user(user_info=user.info, social_accounts=user.social_accounts)
+
+    @staticmethod
+    def _process_github_user(user_info: dict, social_accounts: list[dict]) -> dict:
+        def add_social(name, user, url):
+            socials[name] = {"id": user, "url": url}
+            return
+
+        if user_info["blog"] and "://" not in user_info["blog"]:
+            user_info["blog"] = f"https://{user_info['blog']}"
+        socials = {}
+        user_info["socials"] = socials
+        for account in social_accounts:
+            for provider, base_pattern, id_pattern in (
+                ("orcid", r"orcid.org/", r"([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)"),
+                ("researchgate", r"researchgate.net/profile/", r"([a-zA-Z0-9_-]+)(.*)"),
+                ("linkedin", r"linkedin.com/in/", r"([a-zA-Z0-9_-]+)(.*)"),
+                ("twitter", r"twitter.com/", r"([a-zA-Z0-9_-]+)(.*)"),
+                ("twitter", r"x.com/", r"([a-zA-Z0-9_-]+)(.*)"),
+            ):
+                match = re.search(rf"{base_pattern}{id_pattern}", account["url"])
+                if match:
+                    add_social(
+                        provider,
+                        match.group(1),
+                        f"https://{base_pattern}{match.group(1)}{match.group(2)}",
+                    )
+                    break
+            else:
+                if account["provider"] != "generic":
+                    add_social(account["provider"], None, account["url"])
+                else:
+                    generics = socials.setdefault("generics", [])
+                    generics.append(account["url"])
+                    logger.info("Unknown account", account["url"])
+        return user_info
+
+    def _get_orcid_publications(
+        self,
+        orcid_ids: Sequence[str],
+        new_cache_items: dict[tuple[str, str], Any],
+    ) -> dict[str, list[dict]]:
+        """Get publications of ORCID users, sorted by date (newest first).
+
+        Uncached ORCID records, and then uncached DOI records of all users together,
+        are retrieved concurrently with a rate-limited pool.
+        """
+        def from_cache(typ: str, key: str):
+            if (typ, key) in new_cache_items:
+                return new_cache_items[(typ, key)]
+            return self._manager.cache.get(typ, key) if self._manager.cache else None
+
+        orcid_ids = list(dict.fromkeys(orcid_ids))
+        dois = {orcid_id: from_cache("orcid", orcid_id) for orcid_id in orcid_ids}
+        missing_orcids = [orcid_id for orcid_id, orcid_dois in dois.items() if not orcid_dois]
+        for orcid_id, orcid_dois in zip(
+            missing_orcids,
+            _map_concurrently(
+                lambda orcid_id: pylinks.api.orcid(orcid_id=orcid_id).doi,
+                missing_orcids,
+                min_interval=_ORCID_MIN_INTERVAL,
+            ),
+        ):
+            dois[orcid_id] = new_cache_items[("orcid", orcid_id)] = orcid_dois
+        all_dois = list(dict.fromkeys(doi for orcid_dois in dois.values() for doi in orcid_dois))
+        publications = {doi: from_cache("doi", doi) for doi in all_dois}
+        missing_dois = [doi for doi, publication in publications.items() if not publication]
+        for doi, publication in zip(
+            missing_dois,
+            _map_concurrently(
+                lambda doi: pylinks.api.doi(doi=doi).curated,
+                missing_dois,
+                min_interval=_DOI_MIN_INTERVAL,
+            ),
+        ):
+            publications[doi] = new_cache_items[("doi", doi)] = publication
+        return {
+            orcid_id: sorted(
+                [publications[doi] for doi in orcid_dois], key=lambda i: i["date_tuple"], reverse=True
+            )
+            for orcid_id, orcid_dois in dois.items()
+        }
 
     def members_with_role_types(
         self,
@@ -441,3 +610,45 @@ def members_with_role_ids(
             member_data
             for member_data, _, _ in sorted(out, key=lambda i: (i[1], i[2]), reverse=True)
         ]
+
+
+# Minimum seconds between requests, based on the public rate limits of ORCID and Crossref
+_ORCID_MIN_INTERVAL = 1 / 24
+_DOI_MIN_INTERVAL = 1 / 50
+# Fields not in the `RepositoryOwner` interface must be queried in fragments of its implementations;
+# otherwise GitHub rejects the whole batched document.
+_GITHUB_GRAPHQL_OWNER_FIELDS = (
+    "__typename login id url avatarUrl "
+    "... on User { databaseId name websiteUrl location email company bio "
+    "socialAccounts(first: 100) { nodes { provider url } } } "
+    "... on Organization { databaseId name websiteUrl location email }"
+)
+
+
+def _map_concurrently(
+    func: Callable[[Any], Any],
+    args: Sequence[Any],
+    max_workers: int = 8,
+    min_interval: float = 0,
+) -> list:
+    """Apply a function to a sequence of arguments concurrently.
+
+    Calls are started at most once every `min_interval` seconds,
+    to stay below the rate limits of web APIs;
+    responses with status code 429 are additionally retried by `pylinks`.
+    """
+    if len(args) < 2:
+        return [func(arg) for arg in args]
+    lock = threading.Lock()
+    next_start = [time.monotonic()]
+
+    def rate_limited(arg):
+        with lock:
+            wait = next_start[0] - time.monotonic()
+            next_start[0] = max(next_start[0], time.monotonic()) + min_interval
+        if wait > 0:
+            time.sleep(wait)
+        return func(arg)
+
+    with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as executor:
+        return list(executor.map(rate_limited, args))
@@ -1,11 +1,12 @@
 from __future__ import annotations as _annotations
 
-import copy
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 import pyserials as ps
 from loggerman import logger
 
+from proman.util import hash_tree
+
 if _TYPE_CHECKING:
     from proman.manager import Manager
 
@@ -16,7 +17,7 @@ def __init__(self, manager: Manager):
         log_title = "Variables Load"
         self._filepath = self._manager.git.repo_path / self._manager.data[f"control.variable.path"]
         var = self._manager.data["variable"]
-        self._read_var = copy.deepcopy(var)
+        self._read_var = hash_tree.digest(var)
         super().__init__(var)
         return
 
@@ -28,7 +29,7 @@ def commit_changes(self, amend: bool = False) -> str | None:
         return self._manager.git.commit(message=str(commit.conv_msg), amend=amend)
 
     def write_file(self) -> bool:
-        if self.as_dict == self._read_var:
+        if hash_tree.digest(self.as_dict) == self._read_var:
             return False
         self._filepath.write_text(
             ps.write.to_json_string(self.as_dict, sort_keys=True, indent=3).strip() + "\n",
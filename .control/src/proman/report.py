@@ -34,6 +34,7 @@ class Reporter:
         "file_change": "File Changes",
         "cca": "CCA",
         "hooks": "Hooks",
+        "wait": "Remote Sync",
     }
 
     def __init__(self, github_context: _gh_context.GitHubContext | None = None):
@@ -24,6 +24,8 @@ def run(
     control_center: str | None = None,
     clean_state: bool = False,
     branch_version: dict[str, str] | None = None,
+    incremental: bool = False,
+    offline: bool = False,
 ):
     """Run Continuous Configuration Automation on the repository.
 
@@ -39,6 +41,13 @@ def run(
         If True, changes are not applied.
     clean_state
         Ignore the metadata.json file and start from a clean state.
+    incremental
+        Skip data generation and reuse the metadata.json file
+        when the fingerprint of all control center inputs
+        matches the one stored from the last run.
+    offline
+        Do not download external data of extension tags in control center configurations;
+        only use cached data, regardless of their age.
     """
     try:
         with logger.sectioning("Initialization"):
@@ -46,6 +55,8 @@ def run(
                 future_versions=branch_version,
                 control_center_path=control_center,
                 clean_state=clean_state,
+                incremental=incremental,
+                offline=offline,
             )
         with logger.sectioning("Execution"):
             reporter = center_manager.report()
@@ -143,5 +154,7 @@ def run_cli(kwargs: dict) -> None:
         control_center=kwargs["control_center"],
         action=kwargs["action"],
         clean_state=kwargs["clean_state"],
+        incremental=kwargs["incremental"],
+        offline=kwargs["offline"],
     )
     return
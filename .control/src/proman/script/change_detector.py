@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import os
 import re
+import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import htmp
 import mdit
+from loggerman import logger
 
 from proman import const
 from proman.dtype import FileChangeType, RepoFileType
+from proman.script import test_impact
 
 if TYPE_CHECKING:
+    from typing import IO, Callable, Container, Iterable, Iterator
+
     from pyserials import NestedDict
 
+    from proman.dtype import InitCheckAction
+    from proman.manager import Manager
     from proman.report import Reporter
 
 
+# Change type of each status letter of `git diff --name-status`.
+_GIT_CHANGE_TYPE = {
+    "A": "added",
+    "D": "deleted",
+    "M": "modified",
+    "U": "unmerged",
+    "X": "unknown",
+    "B": "broken",
+    "C": "copied",
+    "R": "renamed",
+}
+
+
 def run_sync_fix(
     self,
     branch_manager: Manager,
@@ -49,7 +70,12 @@ def run_sync_fix(
     job_runs = {
         "cca": any(filetype in changes for filetype in (RepoFileType.CC, RepoFileType.DYNAMIC)),
         "web_build": changes["web"],
-        "package_test": changes["pkg"] or changes["test"],
+        "package_test": (
+            changes["pkg"] or changes["test"]
+            if changes["test_pyargs"] is None
+            else bool(changes["test_pyargs"])
+        ),
+        "package_test_pyargs": changes["test_pyargs"],
         "package_build": changes["pkg"],
         "package_lint": changes["pkg"],
         "test_lint": changes["test"],
@@ -67,14 +93,36 @@ def run_change_detection(
     self,
     branch_manager: Manager,
     ref_range: tuple[str, str] | None = None,
+    report: bool = True,
 ) -> dict[str, bool]:
     if not ref_range:
         ref_range = (self.gh_context.hash_before, self.gh_context.hash_after)
-    changes = self._git_head.changed_files(ref_start=ref_range[0], ref_end=ref_range[1])
-    changed_components = runner.change_detector.run(
+    repo_path = self._git_head.repo_path
+    changes = iter_changed_files(repo_path=repo_path, ref_start=ref_range[0], ref_end=ref_range[1])
+    cache_dir = branch_manager.data.get("control.cache.dir")
+    import_paths = test_impact.get_import_paths(branch_manager.data)
+
+    def test_selector(changed_files):
+        return test_impact.select_tests(
+            changes=changed_files,
+            data=branch_manager.data,
+            repo_path=repo_path,
+            ref_range=ref_range,
+            cache_path=Path(repo_path) / cache_dir / "import_graph.json" if cache_dir else None,
+        )
+
+    def test_fallback(filetype, path):
+        return "test" not in import_paths or bool(
+            test_impact.full_suite_reason(filetype=filetype, path=path, import_paths=import_paths)
+        )
+
+    changed_components = run(
         data=branch_manager.data,
         changes=changes,
         reporter=self.reporter,
+        report=report,
+        test_selector=test_selector,
+        test_fallback=test_fallback,
     )
     logger.info(
         "Changed Project Components",
@@ -83,7 +131,89 @@ def run_change_detection(
     return changed_components
 
 
-def run(data: NestedDict, changes: dict, reporter: Reporter) -> dict[str, bool]:
+def iter_changed_files(
+    repo_path: str | Path, ref_start: str, ref_end: str
+) -> Iterator[tuple[str, str]]:
+    """Stream all files that have changed between two commits, and the type of changes.
+
+    The output of `git diff --name-status -z` is parsed incrementally as it is produced,
+    so that consumers can stop early without waiting for (or holding) the full diff.
+    The git process is terminated when the iterator is closed.
+
+    Yields
+    ------
+    Pairs of change type and path, with change types as in `gittidy.Git.changed_files`.
+    Renames and copies yield the source path (e.g., `renamed_from`)
+    followed by the destination path (e.g., `renamed_to`).
+    """
+    process = subprocess.Popen(
+        ["git", "diff", "--name-status", "-z", ref_start, ref_end],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    fields = _iter_nul_separated(process.stdout)
+    try:
+        for status in fields:
+            key = _GIT_CHANGE_TYPE.get(status[0])
+            if not key:
+                raise ValueError(f"Unknown file change type: {status}")
+            if status[0] not in ("C", "R"):
+                yield key, next(fields)
+                continue
+            if status[1:] != "100":
+                key += "_modified"
+            yield f"{key}_from", next(fields)
+            yield f"{key}_to", next(fields)
+    finally:
+        if process.poll() is None:
+            process.terminate()
+        process.stdout.close()
+        stderr = process.stderr.read().decode(errors="replace")
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode:
+        raise RuntimeError(f"Git diff failed with exit code {returncode}: {stderr}")
+    return
+
+
+def run(
+    data: NestedDict,
+    changes: dict[str, list[str]] | Iterable[tuple[str, str]],
+    reporter: Reporter,
+    report: bool = True,
+    test_selector: Callable[[list[tuple[str, RepoFileType, str]]], list[str] | None] | None = None,
+    test_fallback: Callable[[RepoFileType, str], bool] | None = None,
+) -> dict:
+    """Determine the changed project components from changed files.
+
+    Parameters
+    ----------
+    changes
+        Changed files, either as a mapping of change types to lists of paths
+        (as returned by `gittidy.Git.changed_files`),
+        or as an iterable of change type and path pairs (as yielded by `iter_changed_files`),
+        which is consumed incrementally.
+    report
+        Whether to generate a detailed report of all changed files.
+        If not, the changes are only consumed until all project components are found changed
+        (and, if `test_selector` is given, a change requiring the full test suite is found).
+    test_selector
+        Function selecting the affected test modules from the change type, file type, and path
+        of all changed files (e.g., `test_impact.select_tests`),
+        returning `None` if the full test suite must run.
+        It is only called when the package or the test suite has changed.
+    test_fallback
+        Function checking whether a changed file, given its file type and path,
+        requires the full test suite to run (e.g., using `test_impact.full_suite_reason`).
+        Without it, all changes are consumed when `test_selector` is given.
+
+    Returns
+    -------
+    Whether each project component has changed, under `dynamic`, `pkg`, `test`, and `web` keys,
+    along with the affected test modules under the `test_pyargs` key,
+    which is `None` if the full test suite must run.
+    """
     change_type_map = {
         "added": FileChangeType.ADDED,
         "deleted": FileChangeType.REMOVED,
@@ -98,24 +228,91 @@ def run(data: NestedDict, changes: dict, reporter: Reporter) -> dict[str, bool]:
         "renamed_modified_from": FileChangeType.REMOVED,
         "renamed_modified_to": FileChangeType.ADDED,
     }
+    if isinstance(changes, dict):
+        changes = (
+            (change_type, path)
+            for change_type, changed_paths in changes.items()
+            for path in changed_paths
+        )
     full_info: list = []
-    paths_abs, paths_start, paths_regex = _make_filetype_patterns(data)
+    changed_files: list[tuple[str, RepoFileType, str]] = []
+    changed_filetypes: set[RepoFileType] = set()
+    classifier = _FiletypeClassifier(*_make_filetype_patterns(data))
     dynamic_files = _get_dynamic_file_paths(data)
-    for change_type, changed_paths in changes.items():
+    full_suite = not test_selector
+    count_files = 0
+    for change_type, path in changes:
         if change_type.startswith("copied") and change_type.endswith("from"):
             continue
-        for path in changed_paths:
-            typ, subtype = _determine_filetype(path, paths_abs, paths_start, paths_regex)
-            is_dynamic = path in dynamic_files
+        count_files += 1
+        typ, subtype = classifier(path)
+        is_dynamic = path in dynamic_files
+        if test_selector:
+            changed_files.append((change_type, typ, path))
+        if report:
             full_info.append((typ, subtype, change_type_map[change_type], is_dynamic, path))
-    changed_filetypes, oneliner, body = _generate_report(full_info)
-    reporter.add(
-        name="file_change",
-        status="pass",
-        summary=oneliner,
-        body=body,
+            continue
+        count_filetypes = len(changed_filetypes)
+        changed_filetypes.add(typ)
+        if is_dynamic:
+            changed_filetypes.add(RepoFileType.DYNAMIC)
+        found_full_suite = not full_suite and bool(test_fallback and test_fallback(typ, path))
+        full_suite = full_suite or found_full_suite
+        # Test selection cannot narrow the tests anymore once a change requires the full suite.
+        if (
+            full_suite
+            and (found_full_suite or len(changed_filetypes) > count_filetypes)
+            and all(_get_changed_project_components(changed_filetypes).values())
+        ):
+            if hasattr(changes, "close"):
+                changes.close()
+            reporter.add(
+                name="file_change",
+                status="pass",
+                summary=(
+                    f"All project components were changed; "
+                    f"stopped file change detection after {count_files} files."
+                ),
+            )
+            return _get_changed_project_components(changed_filetypes) | {"test_pyargs": None}
+    if not report:
+        changed_types = ", ".join(sorted(typ.value for typ in changed_filetypes))
+        reporter.add(
+            name="file_change",
+            status="pass",
+            summary=(
+                f"Following filetypes were changed: {changed_types}"
+                if changed_filetypes
+                else "No files were changed in this event."
+            ),
+        )
+    else:
+        changed_filetypes, oneliner, body = _generate_report(full_info)
+        reporter.add(
+            name="file_change",
+            status="pass",
+            summary=oneliner,
+            body=body,
+        )
+    components = _get_changed_project_components(changed_filetypes)
+    test_pyargs = (
+        test_selector(changed_files)
+        if test_selector and (components["pkg"] or components["test"])
+        else None
     )
-    return _get_changed_project_components(full_info)
+    return components | {"test_pyargs": test_pyargs}
+
+
+def _iter_nul_separated(stream: IO[bytes], chunk_size: int = 65536) -> Iterator[str]:
+    """Iterate over the NUL-separated fields of a binary stream, reading it in chunks."""
+    remainder = b""
+    while chunk := stream.read(chunk_size):
+        *fields, remainder = (remainder + chunk).split(b"\0")
+        for field in fields:
+            yield os.fsdecode(field)
+    if remainder:
+        yield os.fsdecode(remainder)
+    return
 
 
 def _make_filetype_patterns(data: NestedDict):
@@ -218,28 +415,77 @@ def _make_filetype_patterns(data: NestedDict):
     return paths_abs, paths_start, paths_regex
 
 
-def _determine_filetype(
-    path: str,
-    paths_abs: list[tuple[RepoFileType, str, str]],
-    paths_start: list[tuple[RepoFileType, str, str]],
-    paths_regex: list[tuple[RepoFileType, str, re.Pattern]],
-) -> tuple[RepoFileType, str | None]:
-    for filetype, subtype, abs_path in paths_abs:
-        if path == abs_path:
-            return filetype, subtype
-    for filetype, subtype, pattern in paths_regex:
-        if pattern.search(path):
-            return filetype, subtype
-    for filetype, subtype, start_path in paths_start:
-        if path.startswith(start_path):
-            return filetype, subtype
-    return RepoFileType.OTHER, "–"
-
-
-def _get_dynamic_file_paths(data: NestedDict) -> list[str]:
-    dynamic_files = []
+class _FiletypeClassifier:
+    """Classifier of file paths into file types, compiled from filetype patterns.
+
+    A path is classified by the first matching absolute path,
+    else by the first matching regex pattern,
+    else by the first matching start path (in the order of each list),
+    else as `RepoFileType.OTHER`.
+    Absolute paths are looked up in a hash map,
+    all regex patterns are combined into a single regex,
+    and start paths (which are directory paths ending with `/`)
+    are looked up in a trie of their path segments,
+    so that the cost of classifying a path is independent of the number of patterns.
+    """
+
+    def __init__(
+        self,
+        paths_abs: list[tuple[RepoFileType, str, str]],
+        paths_start: list[tuple[RepoFileType, str, str]],
+        paths_regex: list[tuple[RepoFileType, str, re.Pattern]],
+    ):
+        self._abs: dict[str, tuple[RepoFileType, str | None]] = {}
+        for filetype, subtype, abs_path in paths_abs:
+            self._abs.setdefault(abs_path, (filetype, subtype))
+        # Unanchored patterns are prefixed by a lazy wildcard, so that matching the combined regex
+        # at the start of a path finds the first pattern that would be found by `re.search`,
+        # instead of the one with the leftmost match.
+        self._regex = re.compile(
+            "|".join(
+                f"(?P<p{idx}>{'' if pattern.pattern.startswith('^') else '(?s:.*?)'}(?:{pattern.pattern}))"
+                for idx, (_, _, pattern) in enumerate(paths_regex)
+            )
+        ) if paths_regex else None
+        self._regex_types = {
+            f"p{idx}": (filetype, subtype) for idx, (filetype, subtype, _) in enumerate(paths_regex)
+        }
+        # Trie of path segments; the value of each node (under the `None` key)
+        # is the index and file type of the first start path ending at that node.
+        self._trie: dict = {}
+        for idx, (filetype, subtype, start_path) in enumerate(paths_start):
+            node = self._trie
+            for segment in start_path.removesuffix("/").split("/"):
+                node = node.setdefault(segment, {})
+            node.setdefault(None, (idx, filetype, subtype))
+        return
+
+    def __call__(self, path: str) -> tuple[RepoFileType, str | None]:
+        filetype = self._abs.get(path)
+        if filetype:
+            return filetype
+        if self._regex:
+            match = self._regex.match(path)
+            if match:
+                return self._regex_types[match.lastgroup]
+        best = None
+        node = self._trie
+        for segment in path.split("/")[:-1]:
+            node = node.get(segment)
+            if node is None:
+                break
+            value = node.get(None)
+            if value and (not best or value[0] < best[0]):
+                best = value
+        if best:
+            return best[1], best[2]
+        return RepoFileType.OTHER, "–"
+
+
+def _get_dynamic_file_paths(data: NestedDict) -> set[str]:
+    dynamic_files = set()
     for file_group in data.get("project.file", {}).values():
-        dynamic_files.extend(list(file_group.values()))
+        dynamic_files.update(file_group.values())
     return dynamic_files
 
 
@@ -291,7 +537,7 @@ def _generate_report(full_info: list):
     return changed_filetypes, oneliner, body
 
 
-def _get_changed_project_components(changed_filetypes):
+def _get_changed_project_components(changed_filetypes: Container[RepoFileType]):
     def decide(filetypes: list[RepoFileType]):
         return any(filetype in changed_filetypes for filetype in filetypes)
 
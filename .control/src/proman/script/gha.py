@@ -15,6 +15,8 @@
 @logger.sectioner("Continuous Pipeline")
 def run(manager: Manager):
     _set_git_api(manager=manager)
+    # Queried by most event handlers; fetched together in one GraphQL request on first use.
+    manager.gh_api_actions.prefetch("branches", "labels")
     event_to_handler = {
         EventType.ISSUES: handler.IssuesEventHandler,
         EventType.ISSUE_COMMENT: handler.IssueCommentEventHandler,
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import json
+import os
 import re
+import shlex
+import shutil
+import tempfile
+import time
+from concurrent import futures
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import ansi_sgr
 import htmp
 import mdit
+import pyserials as ps
 import pyshellman
 from loggerman import logger
 
+from proman.file_gen.digest import FileStatCache
+
 if TYPE_CHECKING:
-    from typing import Literal
+    from typing import Iterable, Literal
 
     from proman.manager import Manager
 
-_CMD_PREFIX = ["conda", "run", "--name", "pre_commit", "--live-stream", "-vv"]
+_CONDA_ENV_NAME = "pre_commit"
+_CMD_PREFIX = ["conda", "run", "--name", _CONDA_ENV_NAME, "--live-stream", "-vv"]
+
+# Script printing the environment variables of the Python process as JSON.
+_PRINT_ENV_SCRIPT = "import json, os; print(json.dumps(dict(os.environ)))"
+
+# Version of the hook result cache format; caches with other versions are discarded.
+_CACHE_VERSION = 1
 
 
 @logger.sectioner("Continuous Refactoring")
@@ -29,6 +50,9 @@ def run(
     files: list[str] | None = None,
     all_files: bool = False,
     ref_range: tuple[str, str] | None = None,
+    max_workers: int = 1,
+    isolated: bool = True,
+    direct_env: bool = True,
     process_id: str = "hooks",
 ) -> tuple[dict, str | None]:
     """Run pre-commit hooks and generate report."""
@@ -46,6 +70,9 @@ def run(
         files=files,
         all_files=all_files,
         ref_range=ref_range,
+        max_workers=max_workers,
+        isolated=isolated,
+        direct_env=direct_env,
     ).run()
     summary = result["summary"]
 
@@ -105,7 +132,28 @@ def run(
 
 
 class PreCommitHooks:
-    """Run pre-commit hooks and generate report."""
+    """Run pre-commit hooks and generate report.
+
+    When the files to check are known (i.e., with `files`, `all_files`, or `ref_range`),
+    hooks are run one by one, each only on the files it has not already passed
+    in their current content; passing results are cached by the hook's configuration
+    and the content digest of each file (see `HookResultCache`).
+    Hooks previously observed not to modify any files run last,
+    concurrently with up to `max_workers` threads,
+    after all other hooks have run in the order of the pre-commit configuration.
+
+    With the `report` action and `isolated` enabled,
+    hooks run in a temporary git worktree of the current commit,
+    so the main working tree is never modified (or locked by stashing),
+    and other processes can use it in the meantime.
+    Otherwise, uncommitted changes are stashed, and all changes made by the hooks are discarded
+    after the run.
+
+    With `direct_env` enabled, the activation variables of the pre-commit conda environment
+    are resolved once per process (see `conda_env_command_prefix`),
+    and `pre-commit` is executed directly with them,
+    instead of activating the environment with `conda run` on every call.
+    """
 
     def __init__(
         self,
@@ -117,6 +165,9 @@ def __init__(
         files: list[str] | None = None,
         all_files: bool = False,
         ref_range: tuple[str, str] | None = None,
+        max_workers: int = 1,
+        isolated: bool = True,
+        direct_env: bool = True,
     ):
         logger.info(
             "Pre-Commit",
@@ -142,17 +193,37 @@ def __init__(
                 f"Argument 'ref_range' must be a list or tuple of two strings, but got {ref_range}."
             )
             raise ValueError(err_msg)
+        if max_workers < 1:
+            err_msg = f"Argument 'max_workers' must be a positive integer, but got {max_workers}."
+            raise ValueError(err_msg)
+        self._cmd_prefix = _CMD_PREFIX
+        self._startup = {}
+        if direct_env:
+            env_prefix, env_duration = conda_env_command_prefix(_CONDA_ENV_NAME)
+            self._startup["Environment Resolution (conda run, once per process)"] = env_duration
+            if env_prefix:
+                self._cmd_prefix = env_prefix
+            else:
+                logger.warning(
+                    "Pre-Commit: Resolve Environment",
+                    f"Failed to resolve the '{_CONDA_ENV_NAME}' conda environment; "
+                    "falling back to 'conda run'.",
+                )
+        start = time.perf_counter()
         version_result = pyshellman.run(
-            command=[*_CMD_PREFIX, "pre-commit", "--version"],
+            command=[*self._cmd_prefix, "pre-commit", "--version"],
             raise_execution=False,
             raise_exit_code=False,
             raise_stderr=False,
             text_output=True,
         )
+        mode = "direct" if self._cmd_prefix is not _CMD_PREFIX else "conda run"
+        self._startup[f"Version Check ({mode})"] = time.perf_counter() - start
         logger.log(
             "success" if version_result.succeeded else "critical",
             "Pre-Commit: Check Version",
             version_result.report(),
+            f"Startup durations: {self._startup}",
         )
         self._manager = manager
         self._action = action
@@ -173,39 +244,52 @@ def __init__(
             self._files = None
         self._hook_id = hook_id
         self._hook_stage = hook_stage
-        config_path = (
-            self._manager.git.repo_path
-            / self._manager.data[
-                "devcontainer_main.environment.pre_commit.file.pre_commit_config.path"
-            ]
-        )
-        self._command = _CMD_PREFIX + [
+        self._max_workers = max_workers
+        self._isolated = isolated
+        self._pre_commit_version = version_result.out
+        self._config_path = self._manager.data[
+            "devcontainer_main.environment.pre_commit.file.pre_commit_config.path"
+        ]
+        # Other files of the pre-commit environment (e.g., the Ruff configuration),
+        # which hooks may read without being given their paths.
+        self._config_files = [
+            file["path"]
+            for file in self._manager.data.get(
+                "devcontainer_main.environment.pre_commit.file", {}
+            ).values()
+            if file.get("path") and file["path"] != self._config_path
+        ]
+        self._all_files = all_files
+        self._command = [
             part
             for part in [
-                "pre-commit",
-                "run",
                 hook_id,
-                "--config",
-                str(config_path),
-                "--color=always",
-                "--show-diff-on-failure",
-                "--verbose",
-                "--hook-stage" if hook_stage else None,
-                hook_stage,
                 "--all-files" if all_files else None,
                 "--files" if self._files else None,
                 *(self._files or []),
             ]
             if part
         ]
-
-        self._shell_runner = pyshellman.Runner(
-            pre_command=self._command,
-            cwd=self._manager.git.repo_path,
-            raise_exit_code=False,
-            logger=logger,
-            stack_up=1,
-        )
+        self._target_files = None
+        self._cache = None
+        if self._files is not None or all_files:
+            self._target_files = (
+                self._files
+                if self._files is not None
+                else self._manager.git.run_command(["ls-files"]).out.splitlines()
+            )
+            cache_dir = self._manager.data.get("control.cache.dir")
+            cache_path = self._manager.git.repo_path / cache_dir if cache_dir else None
+            # Digests of files in temporary worktrees are not persisted,
+            # since their paths are never reused.
+            stat_cache_persisted = cache_path and not (action == "report" and isolated)
+            self._cache = HookResultCache(
+                path=cache_path / "pre_commit.json" if cache_path else None,
+                stat_cache=FileStatCache(
+                    path=cache_path / "pre_commit_stat.json" if stat_cache_persisted else None
+                ),
+            )
+        self._set_work_path(self._manager.git.repo_path)
         self._emoji = {"Passed": "✅", "Failed": "❌", "Skipped": "⏭️", "Modified": "✏️️"}
         self._dropdown_color = {
             "Passed": "success",
@@ -219,27 +303,211 @@ def run(self) -> dict:
         """Run pre-commit hooks and generate report."""
         logger.info("Run Mode", self._action)
         if self._action == "report":
-            self._manager.git.stash(include="all")
-        output_first = self._run_hooks(validation_run=False)
-        if self._action == "report":
-            self._manager.git.discard_changes()
-            self._manager.git.stash_pop()
+            if self._isolated:
+                with self._worktree():
+                    output_first = self._run_hooks(validation_run=False)
+            else:
+                self._manager.git.stash(include="all")
+                output_first = self._run_hooks(validation_run=False)
+                self._manager.git.discard_changes()
+                self._manager.git.stash_pop()
+            self._save_cache()
             return self._create_summary(output_validation=output_first)
+        output_first = self._run_hooks(validation_run=False)
         if output_first["passed"] or not output_first["modified"]:
+            self._save_cache()
             return self._create_summary(output_fix=output_first)
         output_validate = self._run_hooks(validation_run=True)
+        self._save_cache()
         return self._create_summary(output_validation=output_validate, output_fix=output_first)
 
+    def _set_work_path(self, work_path: Path) -> None:
+        """Set the working tree to run hooks in, and read the hooks in its configuration."""
+        self._work_path = work_path
+        command_base = self._cmd_prefix + [
+            part
+            for part in [
+                "pre-commit",
+                "run",
+                "--config",
+                str(work_path / self._config_path),
+                "--color=always",
+                "--show-diff-on-failure",
+                "--verbose",
+                "--hook-stage" if self._hook_stage else None,
+                self._hook_stage,
+            ]
+            if part
+        ]
+        self._shell_runner = pyshellman.Runner(
+            pre_command=command_base,
+            cwd=work_path,
+            raise_exit_code=False,
+            logger=logger,
+            stack_up=1,
+        )
+        # Runner for concurrent hook runs, which are logged after they finish.
+        self._shell_runner_silent = pyshellman.Runner(
+            pre_command=command_base,
+            cwd=work_path,
+            raise_exit_code=False,
+        )
+        self._hooks = (
+            _read_hook_configs(
+                work_path / self._config_path,
+                hook_id=self._hook_id,
+                pre_commit_version=self._pre_commit_version,
+                work_path=work_path,
+                stat_cache=self._cache.stat_cache,
+                config_files=self._config_files,
+            )
+            if self._cache is not None
+            else None
+        )
+        return
+
+    @contextlib.contextmanager
+    def _worktree(self):
+        """Run hooks in a temporary detached worktree of the current commit,
+        which is removed afterwards.
+        """
+        git = self._manager.git
+        repo_path = git.repo_path
+        worktree_path = Path(tempfile.mkdtemp(prefix="proman-pre-commit-"))
+        git.run_command(
+            ["worktree", "add", "--detach", str(worktree_path), "HEAD"],
+            log_title="Pre-Commit: Create Worktree",
+        )
+        self._set_work_path(worktree_path)
+        try:
+            yield worktree_path
+        finally:
+            self._set_work_path(repo_path)
+            git.run_command(
+                ["worktree", "remove", "--force", str(worktree_path)],
+                log_title="Pre-Commit: Remove Worktree",
+                raise_exit_code=False,
+            )
+            shutil.rmtree(worktree_path, ignore_errors=True)
+            git.run_command(["worktree", "prune"], raise_exit_code=False)
+        return
+
     def _run_hooks(self, *, validation_run: bool) -> dict:
+        log_title = f"{'Validation' if validation_run else 'Fix'} Run"
+        if self._cache is None:
+            result = self._shell_runner.run(
+                command=self._command,
+                log_title=log_title,
+                log_level_exit_code="error" if validation_run else "notice",
+            )
+            results = self._process_shell_output(self._check_shell_output(result))
+        else:
+            results = self._run_hooks_cached(log_title=log_title, validation_run=validation_run)
+        return self._process_results(results, validation_run=validation_run)
+
+    def _run_hooks_cached(
+        self, *, log_title: str, validation_run: bool
+    ) -> tuple[dict[str, dict], str]:
+        """Run each hook only on the files it has not passed in their current content.
+
+        In the validation run, this only re-executes the hooks that modified files
+        in the fix run, and the other hooks on the files modified by them,
+        since all other results are cached by the fix run.
+        """
+        cache = self._cache
+        stat_cache = cache.stat_cache
+        repo_path = self._work_path
+        target_files = [file for file in self._target_files if (repo_path / file).is_file()]
+
+        def file_digests() -> dict[str, str]:
+            return {file: stat_cache.file(repo_path / file) for file in target_files}
+
+        def uncached_files(hook_key: str) -> dict[str, str]:
+            return {
+                file: digest
+                for file, digest in digests.items()
+                if not cache.passed(hook_key, file, digest)
+            }
+
+        def run_hook(hook_id: str, files: list[str], runner: pyshellman.Runner):
+            # Hooks that have not passed any file run with `--all-files`,
+            # since listing all files of large repositories may exceed the maximum command length.
+            file_args = (
+                ["--all-files"]
+                if self._all_files and len(files) == len(target_files)
+                else ["--files", *files]
+            )
+            return runner.run(
+                command=[hook_id, *file_args],
+                log_title=f"{log_title}: {hook_id}",
+                log_level_exit_code="error" if validation_run else "notice",
+            )
+
+        digests = file_digests()
+        results = {}
+        git_diff = ""
+
+        def add_result(hook_id: str, files: dict[str, str], result: pyshellman.ShellOutput):
+            nonlocal digests, git_diff
+            hook_results, hook_git_diff = self._process_shell_output(
+                self._check_shell_output(result)
+            )
+            git_diff = hook_git_diff or git_diff
+            for result_hook_id, hook_result in hook_results.items():
+                results[result_hook_id] = hook_result
+            hook_result = hook_results.get(hook_id)
+            if hook_result:
+                cache.add(
+                    self._hooks[hook_id],
+                    files=files,
+                    passed=hook_result["result"] != "Failed",
+                    modified=hook_result["modified"],
+                )
+                if hook_result["modified"]:
+                    digests = file_digests()
+            return
+
+        concurrent = []
+        for hook_id, hook_key in self._hooks.items():
+            files = uncached_files(hook_key)
+            if not files:
+                results[hook_id] = _cached_result(hook_id, no_files=not target_files)
+            elif cache.modifies(hook_key) is False:
+                concurrent.append((hook_id, files))
+            else:
+                add_result(hook_id, files, run_hook(hook_id, list(files), self._shell_runner))
+        if concurrent:
+            with futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="proman-pre-commit"
+            ) as executor:
+                shell_results = list(
+                    executor.map(
+                        lambda hook: run_hook(hook[0], list(hook[1]), self._shell_runner_silent),
+                        concurrent,
+                    )
+                )
+            for (hook_id, files), result in zip(concurrent, shell_results):
+                logger.log(
+                    "success" if result.succeeded else "notice",
+                    f"{log_title}: {hook_id}",
+                    result.report(),
+                )
+                add_result(hook_id, files, result)
+        # Report results in the order of the pre-commit configuration.
+        ordered_results = {
+            hook_id: results[hook_id] for hook_id in self._hooks if hook_id in results
+        }
+        return ordered_results, git_diff
+
+    def _check_shell_output(self, result: pyshellman.ShellOutput) -> str:
+        """Raise an error if the pre-commit run failed unexpectedly,
+        otherwise return its output with ANSI sequences removed.
+        """
+
         def raise_error(error: str):
             logger.critical("Unexpected Pre-Commit Error", error)
             raise ValueError(error)
 
-        result = self._shell_runner.run(
-            command=[],
-            log_title=f"{'Validation' if validation_run else 'Fix'} Run",
-            log_level_exit_code="error" if validation_run else "notice",
-        )
         if result.err:
             err_lines = [
                 line
@@ -253,8 +521,12 @@ def raise_error(error: str):
             for prefix in ("An error has occurred", "An unexpected error has occurred", "[ERROR]"):
                 if line.startswith(prefix):
                     raise_error(out_plain)
-        results = self._process_shell_output(out_plain)
-        return self._process_results(results, validation_run=validation_run)
+        return out_plain
+
+    def _save_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.save(hook_keys=self._hooks.values())
+        return
 
     def _process_results(
         self, results: tuple[dict[str, dict], str], *, validation_run: bool
@@ -355,6 +627,12 @@ def _create_summary(
                 ("Result", summary_result),
                 ("Action", f"{action_emoji} {action_title}"),  # noqa: RUF001
                 ("Scope", scope),
+                (
+                    "Startup",
+                    ", ".join(
+                        f"{title}: {duration:.2f} s" for title, duration in self._startup.items()
+                    ),
+                ),
             ]
         )
         return {
@@ -452,6 +730,229 @@ def process_last_entry(details: str) -> tuple[str, str]:
         return results, git_diff
 
 
+@functools.cache
+def conda_env_command_prefix(env_name: str) -> tuple[list[str] | None, float]:
+    """Get a command prefix for running commands in a conda environment without `conda run`.
+
+    The environment is activated once with `conda run`, to read its environment variables.
+    The prefix uses the `env` utility to set the variables that differ from
+    the current environment (e.g., `PATH` and `CONDA_PREFIX`) and unset the removed ones,
+    and then executes the command directly.
+    The result is cached for the lifetime of the process.
+
+    Returns
+    -------
+    The command prefix (or `None` if the environment could not be activated),
+    and the duration of the activation in seconds.
+    """
+    start = time.perf_counter()
+    result = pyshellman.run(
+        command=["conda", "run", "--name", env_name, "python", "-c", _PRINT_ENV_SCRIPT],
+        raise_execution=False,
+        raise_exit_code=False,
+        raise_stderr=False,
+        text_output=True,
+    )
+    duration = time.perf_counter() - start
+    if not (result.succeeded and result.out):
+        return None, duration
+    try:
+        env = json.loads(result.out.strip().splitlines()[-1])
+    except json.JSONDecodeError:
+        return None, duration
+    unset = [arg for name in os.environ if name not in env for arg in ("-u", name)]
+    changed = [f"{name}={value}" for name, value in env.items() if os.environ.get(name) != value]
+    return ["env", *unset, *changed], duration
+
+
+class HookResultCache:
+    """Cache of pre-commit hook results on individual files.
+
+    A hook is identified by a key derived from its configuration
+    (including the repository revision and the pre-commit version)
+    and the contents of other files it reads (see `_read_hook_configs`),
+    so that any change to the hook invalidates all its results.
+    For each hook, the cache records the files it has passed, along with their content digests,
+    and whether it has ever modified files.
+    Hooks that do not operate on individual files
+    (i.e., with `always_run` or without `pass_filenames`) never pass from the cache.
+
+    Parameters
+    ----------
+    path
+        Path to the cache file.
+        If not provided, the cache is only kept in memory.
+    stat_cache
+        Cache of file digests.
+    """
+
+    def __init__(self, path: str | Path | None, stat_cache: FileStatCache):
+        self._path = Path(path) if path else None
+        self._stat_cache = stat_cache
+        self._hooks: dict[str, dict] = {}
+        if self._path and self._path.is_file():
+            try:
+                cache = ps.read.json_from_file(path=self._path)
+            except ps.exception.read.PySerialsReadException:
+                logger.warning(
+                    "Pre-Commit Cache",
+                    f"Failed to read the cache file at '{self._path}'; initialized a new cache.",
+                )
+            else:
+                if isinstance(cache, dict) and cache.get("version") == _CACHE_VERSION:
+                    self._hooks = cache["hooks"]
+        return
+
+    @property
+    def stat_cache(self) -> FileStatCache:
+        """Cache of file digests."""
+        return self._stat_cache
+
+    def passed(self, hook_key: str, file: str, digest: str) -> bool:
+        """Whether a hook has passed a file with the given content digest."""
+        entry = self._hooks.get(hook_key)
+        return bool(entry) and entry["files"].get(file) == digest
+
+    def modifies(self, hook_key: str) -> bool | None:
+        """Whether a hook has ever modified files, or `None` if it has never run."""
+        entry = self._hooks.get(hook_key)
+        return entry["modifies"] if entry else None
+
+    def add(self, hook_key: str, files: dict[str, str], passed: bool, modified: bool) -> None:
+        """Record the result of running a hook on files, given with their content digests."""
+        entry = self._hooks.setdefault(hook_key, {"modifies": False, "files": {}})
+        entry["modifies"] = entry["modifies"] or modified
+        if passed and not modified and not hook_key.startswith("!"):
+            entry["files"].update(files)
+        return
+
+    def save(self, hook_keys) -> None:
+        """Write the cache file, keeping only the entries of the given hooks."""
+        self._stat_cache.save()
+        if not self._path:
+            return
+        hook_keys = set(hook_keys)
+        cache = {
+            "version": _CACHE_VERSION,
+            "hooks": {key: entry for key, entry in self._hooks.items() if key in hook_keys},
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(ps.write.to_json_string(data=cache, sort_keys=True))
+        return
+
+
+def _read_hook_configs(
+    config_path: Path,
+    hook_id: str | None,
+    pre_commit_version: str,
+    work_path: Path,
+    stat_cache: FileStatCache,
+    config_files: Iterable[str] = (),
+) -> dict[str, str]:
+    """Get the cache keys of all hooks in a pre-commit configuration file.
+
+    Since hooks may read other files than those they check
+    (e.g., a configuration file given with `--config`, or the script of a local hook),
+    keys include the content digests of all files in the working tree
+    that are named in the `args` or `entry` of each hook, and of `config_files`.
+
+    Parameters
+    ----------
+    config_path
+        Path to the pre-commit configuration file.
+    hook_id
+        ID of the only hook to read.
+    pre_commit_version
+        Version of pre-commit.
+    work_path
+        Path to the working tree, against which relative file paths are resolved.
+    stat_cache
+        Cache of file digests.
+    config_files
+        Paths of files that hooks may read without being given their paths
+        (e.g., tool configuration files), relative to the working tree.
+
+    Returns
+    -------
+    Mapping of hook IDs to their cache keys, in the order of the configuration.
+    Hooks with the same ID (which are always run together) share one key.
+    Keys of hooks whose results cannot be cached start with `!`.
+    """
+    config = ps.read.yaml_from_file(path=config_path)
+    hooks: dict[str, list] = {}
+    for repo in config.get("repos", []):
+        for hook in repo.get("hooks", []):
+            if hook_id and hook["id"] != hook_id:
+                continue
+            hooks.setdefault(hook["id"], []).append(
+                {"repo": repo["repo"], "rev": repo.get("rev"), "hook": hook}
+            )
+
+    def file_digests(paths: Iterable[str]) -> dict[str, str]:
+        return {
+            path: stat_cache.file(work_path / path)
+            for path in sorted(set(paths))
+            if (work_path / path).is_file()
+        }
+
+    config_digests = file_digests(config_files)
+    out = {}
+    for hook_id_, hook_configs in hooks.items():
+        key_data = {
+            "pre_commit": pre_commit_version,
+            "hooks": hook_configs,
+            "files": config_digests
+            | file_digests(
+                path for config in hook_configs for path in _hook_path_args(config["hook"])
+            ),
+        }
+        serialized = json.dumps(key_data, sort_keys=True, default=str)
+        key = hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+        cacheable = all(
+            config["hook"].get("pass_filenames", True) and not config["hook"].get("always_run")
+            for config in hook_configs
+        )
+        out[hook_id_] = key if cacheable else f"!{key}"
+    return out
+
+
+def _hook_path_args(hook: dict) -> list[str]:
+    """Get all relative paths among the arguments in the `entry` and `args` of a hook,
+    including values of options given as `--option=value`.
+
+    These are all arguments that may be file paths; they are not checked to exist.
+    """
+    entry = hook.get("entry", "")
+    try:
+        args = shlex.split(entry)
+    except ValueError:
+        args = entry.split()
+    args.extend(str(arg) for arg in hook.get("args", []))
+    paths = []
+    for arg in args:
+        if arg.startswith("-"):
+            arg = arg.partition("=")[2]
+        if arg and not Path(arg).is_absolute():
+            paths.append(arg)
+    return paths
+
+
+def _cached_result(hook_id: str, no_files: bool = False) -> dict[str, str | bool]:
+    """Hook result for a hook that passed all files according to the cache,
+    or that was not run since there are no files to check.
+    """
+    return {
+        "description": hook_id,
+        "message": "(no files to check)" if no_files else "(cached)",
+        "result": "Skipped" if no_files else "Passed",
+        "hook_id": hook_id,
+        "exit_code": "0",
+        "duration": "0",
+        "modified": False,
+        "details": "",
+    }
+
+
 def run_cli(args: dict) -> None:
     """Run from CLI."""
     run(
@@ -462,5 +963,6 @@ def run_cli(args: dict) -> None:
         files=args["files"],
         all_files=args["all_files"],
         ref_range=(args["from_ref"], args["to_ref"]) if args["from_ref"] else None,
+        max_workers=args["max_workers"],
     )
     return
@@ -0,0 +1,411 @@
+"""Test impact analysis based on the static import graph of the package and its test suite."""
+
+from __future__ import annotations
+
+import ast
+import fnmatch
+import json
+import subprocess
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+from loggerman import logger
+
+from proman.dtype import RepoFileType
+from proman.util import git_objects
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from pyserials import NestedDict
+
+
+# Version of the import graph cache format; caches with other versions are discarded.
+_CACHE_VERSION = 1
+
+# Key of the `python_files` option (file name patterns of test modules)
+# of the test suite's PyTest configuration in the project metadata.
+_PYTEST_PYTHON_FILES_KEY = "test.file.pytest_config.content.tool.pytest.ini_options.python_files"
+
+# Default value of the `python_files` option of PyTest.
+_PYTEST_PYTHON_FILES_DEFAULT = ("test_*.py", "*_test.py")
+
+# Change types (as yielded by `change_detector.iter_changed_files`) of paths that no longer exist.
+_REMOVED_CHANGE_TYPES = ("deleted", "renamed_from", "renamed_modified_from")
+
+
+class ImportGraph:
+    """Static import graph of the Python modules in a set of import packages.
+
+    Imports are found by parsing the modules, without importing them,
+    and include all import statements anywhere in a module
+    (e.g., inside functions and `if TYPE_CHECKING:` blocks).
+    Importing a module also imports all its parent packages,
+    so each module depends on its parent packages as well.
+
+    Parameters
+    ----------
+    paths
+        Mapping of module names (e.g., `pkg.sub.mod`)
+        to their file paths, relative to the repository root.
+    imports
+        Mapping of module names to fully qualified names of imported objects,
+        or `None` for modules that could not be parsed.
+    """
+
+    def __init__(self, paths: dict[str, str], imports: dict[str, list[str] | None]):
+        self._paths = paths
+        self._modules = {path: name for name, path in paths.items()}
+        self._unparsed = {name for name, names in imports.items() if names is None}
+        self._dependents: dict[str, set[str]] = {name: set() for name in paths}
+        for name, imported_names in imports.items():
+            for dependency in self._resolve([name.rpartition(".")[0], *(imported_names or [])]):
+                if dependency != name:
+                    self._dependents[dependency].add(name)
+        return
+
+    @classmethod
+    def from_commit(
+        cls,
+        repo_path: str | Path,
+        ref: str,
+        import_paths: Iterable[str],
+        cache_path: str | Path | None = None,
+    ) -> ImportGraph:
+        """Build the import graph of import packages at a commit.
+
+        Modules are read from the git object database, so the working tree is not used.
+        Imports of each module are cached by the blob hash of the module,
+        so only modules changed since the cached commit are parsed.
+
+        Parameters
+        ----------
+        repo_path
+            Path to the git repository.
+        ref
+            Git reference of the commit.
+        import_paths
+            Paths of the top-level import packages, relative to the repository root.
+        cache_path
+            Path to the cache file.
+            If not provided, all modules are parsed.
+        """
+        import_paths = sorted(import_paths)
+        commit = _git(repo_path, "rev-parse", "--verify", f"{ref}^{{commit}}").decode().strip()
+        cache = _read_cache(cache_path)
+        if cache.get("import_paths") != import_paths:
+            cache = {}
+        cached_files = cache.get("files", {})
+        if cache.get("commit") == commit:
+            files = cached_files
+        else:
+            files = {}
+            listing = _git(repo_path, "ls-tree", "-r", "-z", commit, "--", *import_paths)
+            uncached = {}
+            for entry in listing.split(b"\0"):
+                if not entry:
+                    continue
+                info, path = entry.split(b"\t", 1)
+                _, obj_type, blob = info.decode().split()
+                path = path.decode()
+                if obj_type != "blob" or not path.endswith(".py"):
+                    continue
+                cached = cached_files.get(path)
+                if cached and cached["blob"] == blob:
+                    files[path] = cached
+                else:
+                    uncached[path] = blob
+            contents = _read_blobs(repo_path, list(uncached.values()))
+            for path, blob in uncached.items():
+                name, is_package = _module_name(path, import_paths)
+                files[path] = {
+                    "blob": blob,
+                    "imports": _parse_imports(contents[blob], name, is_package),
+                }
+            logger.info(
+                "Import Graph",
+                f"Parsed {len(uncached)} of {len(files)} modules at commit '{commit}'.",
+            )
+            _write_cache(
+                cache_path,
+                {
+                    "version": _CACHE_VERSION,
+                    "commit": commit,
+                    "import_paths": import_paths,
+                    "files": files,
+                },
+            )
+        paths = {}
+        imports = {}
+        for path, info in files.items():
+            name, _ = _module_name(path, import_paths)
+            paths[name] = path
+            imports[name] = info["imports"]
+        return cls(paths=paths, imports=imports)
+
+    @property
+    def paths(self) -> dict[str, str]:
+        """Mapping of module names to their file paths, relative to the repository root."""
+        return self._paths
+
+    def module(self, path: str) -> str | None:
+        """Get the name of the module at a path, or `None` if it is not in the graph."""
+        return self._modules.get(path)
+
+    def parsed(self, name: str) -> bool:
+        """Whether the imports of a module are known, i.e., it could be parsed."""
+        return name not in self._unparsed
+
+    def dependents(self, names: Iterable[str]) -> set[str]:
+        """Get all modules that directly or indirectly import the given modules,
+        including the given modules themselves.
+        """
+        out = set()
+        stack = [name for name in names if name in self._dependents]
+        while stack:
+            name = stack.pop()
+            if name in out:
+                continue
+            out.add(name)
+            stack.extend(self._dependents[name] - out)
+        return out
+
+    def _resolve(self, imported_names: Iterable[str]) -> set[str]:
+        """Get the modules in the graph that are executed by importing the given names.
+
+        These are all prefixes of each name that are modules in the graph,
+        e.g., `a`, `a.b`, and `a.b.c` (if it is a module and not an object of `a.b`)
+        for the name `a.b.c` (imported either as `import a.b.c` or `from a.b import c`).
+        """
+        out = set()
+        for imported_name in imported_names:
+            parts = imported_name.split(".")
+            for idx in range(1, len(parts) + 1):
+                prefix = ".".join(parts[:idx])
+                if prefix in self._dependents:
+                    out.add(prefix)
+        return out
+
+
+def select_tests(
+    changes: Iterable[tuple[str, RepoFileType, str]],
+    data: NestedDict,
+    repo_path: str | Path,
+    ref_range: tuple[str, str],
+    cache_path: str | Path | None = None,
+) -> list[str] | None:
+    """Select the test modules affected by changes in the package and test suite.
+
+    Changed modules are mapped to all test modules that directly or indirectly import them,
+    according to the import graph at the end of the range.
+    For removed modules, the import graph at the start of the range is used.
+    Changes in a `conftest.py` file affect all test modules in its package.
+    The full test suite must run when configuration files (e.g., `pyproject.toml`)
+    or other source files of unknown impact (e.g., data files) are changed.
+
+    Parameters
+    ----------
+    changes
+        Change type, file type, and path of each changed file.
+        Files that are not package or test suite files are ignored.
+    data
+        Project metadata.
+    repo_path
+        Path to the git repository.
+    ref_range
+        Git references of the commits at the start and end of the changes.
+    cache_path
+        Path to the import graph cache file.
+
+    Returns
+    -------
+    Sorted fully qualified names of affected test modules, as `pyargs` for the test suite,
+    or `None` if the full test suite must run.
+    """
+    import_paths = get_import_paths(data)
+    if "test" not in import_paths:
+        return None
+    removed = []
+    changed = []
+    for change_type, filetype, path in changes:
+        reason = full_suite_reason(filetype=filetype, path=path, import_paths=import_paths)
+        if reason:
+            logger.info("Test Selection", f"{reason}; selected all tests.")
+            return None
+        if filetype not in (RepoFileType.PKG_SOURCE, RepoFileType.TEST_SOURCE):
+            continue
+        (removed if change_type in _REMOVED_CHANGE_TYPES else changed).append(path)
+    if not (removed or changed):
+        return []
+    affected = set()
+    # The graph at the start is only needed for removed modules, and is built first,
+    # so that the cache is left at the end commit; the graph at the end is always built.
+    for ref, paths, required in ((ref_range[0], removed, False), (ref_range[1], changed, True)):
+        if not (paths or required):
+            continue
+        try:
+            graph = ImportGraph.from_commit(
+                repo_path=repo_path,
+                ref=ref,
+                import_paths=import_paths.values(),
+                cache_path=cache_path,
+            )
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            logger.warning(
+                "Test Selection", f"Failed to build the import graph; selected all tests: {e}"
+            )
+            return None
+        names = [graph.module(path) for path in paths]
+        if not all(name and graph.parsed(name) for name in names):
+            logger.info(
+                "Test Selection", "Some changed modules could not be parsed; selected all tests."
+            )
+            return None
+        affected |= graph.dependents(names)
+    # Test modules are selected from the graph at the end,
+    # so that removed test modules are not selected.
+    test_package = PurePosixPath(import_paths["test"]).name
+    test_file_patterns = _get_test_file_patterns(data)
+    conftest_packages = tuple(
+        name.removesuffix("conftest") for name in affected if name.rpartition(".")[2] == "conftest"
+    )
+    pyargs = sorted(
+        name
+        for name, path in graph.paths.items()
+        if name.startswith(f"{test_package}.")
+        and _is_test_file(path, test_file_patterns)
+        and (name in affected or name.startswith(conftest_packages))
+    )
+    logger.info("Test Selection", f"Selected test modules: {pyargs}")
+    return pyargs
+
+
+def get_import_paths(data: NestedDict) -> dict[str, str]:
+    """Get the paths of the import packages of the package and the test suite,
+    under `pkg` and `test` keys, for those that exist.
+    """
+    return {key: data[f"{key}.path.import"] for key in ("pkg", "test") if data[key]}
+
+
+def full_suite_reason(
+    filetype: RepoFileType, path: str, import_paths: dict[str, str]
+) -> str | None:
+    """Get the reason why a changed file requires the full test suite to run, if any.
+
+    Parameters
+    ----------
+    filetype
+        File type of the changed file.
+    path
+        Path of the changed file, relative to the repository root.
+    import_paths
+        Paths of the import packages, as returned by `get_import_paths`.
+    """
+    if filetype in (RepoFileType.PKG_CONFIG, RepoFileType.TEST_CONFIG):
+        return f"Configuration file '{path}' changed"
+    if filetype in (RepoFileType.PKG_SOURCE, RepoFileType.TEST_SOURCE) and not (
+        path.endswith(".py") and _module_name(path, import_paths.values())[0]
+    ):
+        return f"Non-module file '{path}' changed"
+    return None
+
+
+def _module_name(path: str, import_paths: Iterable[str]) -> tuple[str | None, bool]:
+    """Get the fully qualified name of the module at a path, and whether it is a package."""
+    posix_path = PurePosixPath(path)
+    for import_path in import_paths:
+        import_path = PurePosixPath(import_path)
+        if posix_path.is_relative_to(import_path):
+            parts = [import_path.name, *posix_path.relative_to(import_path).with_suffix("").parts]
+            is_package = parts[-1] == "__init__"
+            if is_package:
+                parts.pop()
+            return ".".join(parts), is_package
+    return None, False
+
+
+def _get_test_file_patterns(data: NestedDict) -> list[str]:
+    """Get the file name patterns of test modules from the test suite's PyTest configuration."""
+    patterns = data.get(_PYTEST_PYTHON_FILES_KEY)
+    if not patterns:
+        return list(_PYTEST_PYTHON_FILES_DEFAULT)
+    # Like other PyTest `args` options, it can also be given as a whitespace-separated string.
+    return patterns.split() if isinstance(patterns, str) else list(patterns)
+
+
+def _is_test_file(path: str, patterns: Iterable[str]) -> bool:
+    filename = PurePosixPath(path).name
+    return any(fnmatch.fnmatchcase(filename, pattern) for pattern in patterns)
+
+
+def _parse_imports(source: bytes, name: str, is_package: bool) -> list[str] | None:
+    """Get the fully qualified names of all objects imported by a module.
+
+    For `from a import b`, both `a` and `a.b` are included,
+    since `b` may be either a submodule or an object of `a`.
+    Relative imports are resolved against the module's package.
+    Returns `None` if the module cannot be parsed.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    package = name if is_package else name.rpartition(".")[0]
+    out = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            out.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".")
+                if node.level > 1:
+                    base_parts = base_parts[: 1 - node.level]
+                base = ".".join([*base_parts, *([node.module] if node.module else [])])
+            else:
+                base = node.module
+            out.add(base)
+            out.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+    return sorted(out)
+
+
+def _git(repo_path: str | Path, *args: str) -> bytes:
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def _read_blobs(repo_path: str | Path, blobs: list[str]) -> dict[str, bytes]:
+    """Read the contents of blobs with the shared `git cat-file --batch` process."""
+    object_reader = git_objects.reader(repo_path)
+    out = {}
+    for blob in blobs:
+        content = object_reader.blob(blob)
+        if content is None:
+            raise ValueError(f"Object '{blob}' is not a blob.")
+        out[blob] = content
+    return out
+
+
+def _read_cache(cache_path: str | Path | None) -> dict:
+    if not cache_path or not Path(cache_path).is_file():
+        return {}
+    try:
+        cache = json.loads(Path(cache_path).read_text())
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Import Graph", f"Failed to read the cache file at '{cache_path}'.")
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache
+
+
+def _write_cache(cache_path: str | Path | None, cache: dict) -> None:
+    if not cache_path:
+        return
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(cache, sort_keys=True))
+    return
@@ -1,3 +1,3 @@
-from proman.util import date
+from proman.util import cow, date, git_objects, hash_tree, jsonpath, remote_ref, transaction
 
-__all__ = ["date"]
+__all__ = ["cow", "date", "git_objects", "hash_tree", "jsonpath", "remote_ref", "transaction"]
@@ -0,0 +1,78 @@
+"""Copy-on-write nested dictionaries with structural sharing."""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import pyserials as _ps
+
+if _TYPE_CHECKING:
+    from typing import Any
+
+
+class CopyOnWriteDict(_ps.NestedDict):
+    """Nested dictionary layered over a base, sharing all unmodified subtrees with it.
+
+    Creating the dictionary only copies the top level of the base data.
+    On each write (item assignment, `setdefault`, `pop`),
+    only the containers along the path of the written key are copied (if not already),
+    so the cost of creating and modifying the dictionary is proportional to the modified keys,
+    and the base data is never modified.
+    `update` only sets top-level keys, so it needs no copies.
+
+    Values returned by reads may be shared with the base
+    and must not be modified in place; they must be replaced by assignment instead.
+    For the same reason, `fill` must not be called, since it modifies the data in place.
+
+    Parameters
+    ----------
+    base
+        Base data to layer over.
+    kwargs
+        Keyword arguments passed to `pyserials.NestedDict`.
+    """
+
+    def __init__(self, base: _ps.NestedDict | dict | None = None, **kwargs):
+        base_data = base() if isinstance(base, _ps.NestedDict) else base
+        super().__init__(dict(base_data or {}), **kwargs)
+        # Containers copied by this dictionary, by their ID;
+        # they are also referenced here so their IDs cannot be reused.
+        self._owned: dict[int, dict | list] = {id(self._data): self._data}
+        return
+
+    def __setitem__(self, key: str, value: Any):
+        *parents, last = key.split(".")
+        self._writable(parents)[last] = value
+        return
+
+    def setdefault(self, key: str, value: Any):
+        *parents, last = key.split(".")
+        return self._writable(parents).setdefault(last, value)
+
+    def pop(self, key: str, default: Any = None):
+        if key not in self:
+            return default
+        *parents, last = key.split(".")
+        return self._writable(parents).pop(last)
+
+    def _writable(self, keys: list[str]) -> dict:
+        """Get the container at a path, after copying all shared containers along it."""
+        data = self._data
+        for key in keys:
+            child = data.get(key)
+            if child is None and key not in data:
+                child = {}
+                self._owned[id(child)] = child
+            else:
+                child = self._own(child)
+            data[key] = child
+            data = child
+        return data
+
+    def _own(self, container: dict | list) -> dict | list:
+        if id(container) in self._owned or not isinstance(container, dict | list):
+            return container
+        copied = dict(container) if isinstance(container, dict) else list(container)
+        self._owned[id(copied)] = copied
+        return copied
+
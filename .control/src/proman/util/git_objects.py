@@ -0,0 +1,131 @@
+"""Reading files at git references through a long-lived `git cat-file --batch` process."""
+
+from __future__ import annotations as _annotations
+
+import atexit as _atexit
+import re as _re
+import subprocess as _subprocess
+import threading as _threading
+from pathlib import Path as _Path
+
+# Full (SHA-1 or SHA-256) object names, which need not be resolved to commits.
+_COMMIT_HASH_PATTERN = _re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+# Header of an object in the output of `git cat-file --batch`;
+# missing objects have a different header, e.g., "<object> missing".
+_HEADER_PATTERN = _re.compile(r"([0-9a-f]+) (\w+) (\d+)")
+
+# Shared readers of all repositories, by their resolved paths.
+_READERS: dict[_Path, GitObjectReader] = {}
+
+
+class GitObjectReader:
+    """Reader of files at git references, sharing a single git process for all reads.
+
+    Objects are requested from a `git cat-file --batch` process,
+    which is started on the first read and kept alive until `close` is called,
+    so each read costs a round trip over a pipe, instead of spawning a `git show` process.
+    References are resolved to commit hashes on each read (since branches may move),
+    and file contents are memoized by commit hash and path,
+    so the same file at the same commit is never read twice.
+
+    Parameters
+    ----------
+    repo_path
+        Path to the git repository.
+    """
+
+    def __init__(self, repo_path: str | _Path):
+        self._repo_path = _Path(repo_path).resolve()
+        self._process: _subprocess.Popen | None = None
+        self._lock = _threading.Lock()
+        self._files: dict[tuple[str, str], bytes | None] = {}
+        return
+
+    def commit(self, ref: str) -> str | None:
+        """Resolve a reference to its commit hash, or `None` if it does not exist."""
+        if _COMMIT_HASH_PATTERN.fullmatch(ref):
+            return ref
+        with self._lock:
+            header, _ = self._request(f"{ref}^{{commit}}")
+        return header[0] if header else None
+
+    def file(self, ref: str, path: str | _Path) -> bytes | None:
+        """Get the content of a file at a reference, or `None` if it does not exist.
+
+        Parameters
+        ----------
+        ref
+            Git reference, e.g., a branch name, tag name, or commit hash.
+        path
+            Path to the file, either relative to the repository root, or absolute.
+        """
+        commit = self.commit(ref)
+        if not commit:
+            return None
+        path = _Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self._repo_path)
+        key = (commit, path.as_posix())
+        if key not in self._files:
+            with self._lock:
+                header, content = self._request(f"{commit}:{key[1]}")
+            self._files[key] = content if header and header[1] == "blob" else None
+        return self._files[key]
+
+    def blob(self, name: str) -> bytes | None:
+        """Get the content of a blob by its object name (i.e., hash),
+        or `None` if it does not exist or is not a blob.
+
+        Blob contents are not memoized, since each blob is usually only read once.
+        """
+        with self._lock:
+            header, content = self._request(name)
+        return content if header and header[1] == "blob" else None
+
+    def text(self, ref: str, path: str | _Path) -> str | None:
+        """Get the decoded content of a text file at a reference, or `None` if it does not exist."""
+        content = self.file(ref=ref, path=path)
+        return content.decode() if content is not None else None
+
+    def close(self) -> None:
+        """Terminate the git process, if running; it is restarted by the next read."""
+        process, self._process = self._process, None
+        if process and process.poll() is None:
+            process.stdin.close()
+            process.wait()
+        return
+
+    def _request(self, object_name: str) -> tuple[list[str] | None, bytes | None]:
+        """Request an object, returning its name, type, and size, and its content."""
+        if "\n" in object_name:
+            raise ValueError(f"Object names cannot contain newlines: {object_name!r}")
+        if not self._process or self._process.poll() is not None:
+            self._process = _subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self._repo_path,
+                stdin=_subprocess.PIPE,
+                stdout=_subprocess.PIPE,
+            )
+        self._process.stdin.write(f"{object_name}\n".encode())
+        self._process.stdin.flush()
+        header = _HEADER_PATTERN.fullmatch(self._process.stdout.readline().decode().rstrip("\n"))
+        if not header:
+            return None, None
+        content = self._process.stdout.read(int(header[3]) + 1)[:-1]
+        return list(header.groups()), content
+
+
+def reader(repo_path: str | _Path) -> GitObjectReader:
+    """Get the shared reader of a repository, which is closed when the process exits."""
+    repo_path = _Path(repo_path).resolve()
+    if repo_path not in _READERS:
+        _READERS[repo_path] = GitObjectReader(repo_path)
+    return _READERS[repo_path]
+
+
+@_atexit.register
+def _close_readers() -> None:
+    for object_reader in _READERS.values():
+        object_reader.close()
+    return
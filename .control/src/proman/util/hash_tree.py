@@ -0,0 +1,188 @@
+"""Structural (Merkle) hashes of nested data, for comparing data by changed subtrees only."""
+
+from __future__ import annotations as _annotations
+
+import hashlib as _hashlib
+import json as _json
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from typing import Any
+
+
+class HashTree:
+    """Digests of all subtrees (mappings and arrays) of nested data.
+
+    Each subtree is identified by its path,
+    using the same format as `pyserials.compare.items` with an empty root path,
+    e.g., `.pkg.entry.cli[0]`, with the empty string being the root.
+    The digest of a subtree is computed from the digests of its children,
+    so two subtrees are equal if and only if their digests are equal,
+    independent of the order of mapping keys.
+    Scalar values are not stored, but included in the digest of their parent.
+
+    Parameters
+    ----------
+    hashes
+        Mapping of subtree paths to their digests.
+    """
+
+    def __init__(self, hashes: dict[str, str] | None = None):
+        self._hashes = hashes or {}
+        return
+
+    @classmethod
+    def from_data(cls, data: Any, known: dict[str, str] | None = None) -> HashTree:
+        """Compute the digests of all subtrees of data.
+
+        Parameters
+        ----------
+        data
+            JSON-serializable nested data.
+        known
+            Previously computed digests of some subtrees (e.g., from a persisted tree),
+            which are trusted to match the data, along with the digests of all
+            their descendants. These subtrees are not traversed.
+        """
+        known = known or {}
+        hashes = dict(known)
+        if isinstance(data, dict | list | tuple):
+            _subtree_digest(data, "", hashes, known)
+        return cls(hashes)
+
+    @property
+    def hashes(self) -> dict[str, str]:
+        """Mapping of subtree paths to their digests."""
+        return self._hashes
+
+    def get(self, path: str = "") -> str | None:
+        """Get the digest of a subtree, or `None` if it does not exist."""
+        return self._hashes.get(path)
+
+    def changed(self, other: HashTree, path: str = "") -> bool | None:
+        """Check whether a subtree differs from the same subtree in another tree.
+
+        Returns
+        -------
+        `True` if the subtree differs or only exists in one tree,
+        `False` if it is equal in both trees,
+        and `None` if the path is not a subtree in either tree (e.g., a scalar value),
+        in which case the values must be compared directly.
+        """
+        digest = self._hashes.get(path)
+        digest_other = other._hashes.get(path)
+        if digest is None and digest_other is None:
+            return None
+        return digest != digest_other
+
+    def subset(self, exclude: tuple[str, ...] = ()) -> dict[str, str]:
+        """Get the digests of all subtrees except the root and the given top-level keys."""
+        prefixes = tuple(f".{key}{sep}" for key in exclude for sep in (".", "["))
+        excluded = {f".{key}" for key in exclude}
+        return {
+            path: digest
+            for path, digest in self._hashes.items()
+            if path and path not in excluded and not path.startswith(prefixes)
+        }
+
+
+def digest(data: Any) -> str:
+    """Compute a digest of data, e.g., to later check whether it was modified in place.
+
+    Unlike a deep copy of the data, the digest takes constant memory.
+    It is computed from the canonical JSON serialization of the data,
+    which is faster than computing the digests of all subtrees,
+    but is not comparable to the digests of a `HashTree`.
+    """
+    serialized = _json.dumps(data, sort_keys=True, default=repr)
+    return _hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+
+def compare(
+    source: Any,
+    target: Any,
+    source_tree: HashTree,
+    target_tree: HashTree,
+) -> dict[str, list[str]]:
+    """Compare two nested data, descending only into subtrees whose digests differ.
+
+    This gives the same result as `pyserials.compare.items(source, target, path="")`,
+    except that unchanged paths are not listed.
+
+    Returns
+    -------
+    Sorted paths of added, removed, and modified values,
+    under `added`, `removed`, and `modified` keys.
+    """
+    out = {"added": [], "removed": [], "modified": []}
+    source_hashes = source_tree.hashes
+    target_hashes = target_tree.hashes
+
+    def recursive_compare(src, trg, curr_path: str):
+        if type(src) is not type(trg):
+            out["modified"].append(curr_path)
+            return
+        if isinstance(src, dict | list | tuple):
+            digest = source_hashes.get(curr_path)
+            if digest is not None and digest == target_hashes.get(curr_path):
+                return
+        if isinstance(src, dict):
+            for key in src:
+                if key not in trg:
+                    out["added"].append(f"{curr_path}.{key}")
+                    continue
+                recursive_compare(src[key], trg[key], f"{curr_path}.{key}")
+            for key in trg:
+                if key not in src:
+                    out["removed"].append(f"{curr_path}.{key}")
+            return
+        if isinstance(src, list | tuple):
+            len_src = len(src)
+            len_trg = len(trg)
+            min_len = min(len_src, len_trg)
+            for i in range(min_len):
+                recursive_compare(src[i], trg[i], f"{curr_path}[{i}]")
+            for i in range(min_len, max(len_src, len_trg)):
+                out["added" if len_src > len_trg else "removed"].append(f"{curr_path}[{i}]")
+            return
+        if src != trg:
+            out["modified"].append(curr_path)
+        return
+
+    recursive_compare(source, target, "")
+    return {key: sorted(paths) for key, paths in out.items()}
+
+
+def _subtree_digest(
+    value: dict | list | tuple,
+    path: str,
+    hashes: dict[str, str],
+    known: dict[str, str],
+) -> str:
+    """Compute the digest of a subtree, and add it and the digests of all its descendants to `hashes`.
+
+    Digests of subtrees in `known` are used as is.
+    """
+    if path in known:
+        return known[path]
+    # Scalars are represented with their type (e.g., `1`, `1.0`, `True`, and `'1'` differ),
+    # and can never start with `#`, which marks a subtree digest.
+    if isinstance(value, dict):
+        parts = ["{"]
+        for key in sorted(value, key=str):
+            elem = value[key]
+            parts.append(repr(key))
+            if isinstance(elem, dict | list | tuple):
+                parts.append(f"#{_subtree_digest(elem, f'{path}.{key}', hashes, known)}")
+            else:
+                parts.append(repr(elem))
+    else:
+        parts = ["["]
+        for idx, elem in enumerate(value):
+            if isinstance(elem, dict | list | tuple):
+                parts.append(f"#{_subtree_digest(elem, f'{path}[{idx}]', hashes, known)}")
+            else:
+                parts.append(repr(elem))
+    digest = _hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+    hashes[path] = digest
+    return digest
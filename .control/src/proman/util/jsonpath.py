@@ -0,0 +1,68 @@
+"""Helpers for working with JSONPath expressions."""
+
+import contextlib as _contextlib
+import functools as _functools
+import threading as _threading
+from collections.abc import Iterator as _Iterator
+
+import jsonpath_ng as _jsonpath
+import ply.lex as _lex
+from jsonpath_ng import exceptions as _jsonpath_exceptions
+from jsonpath_ng import lexer as _jsonpath_lexer
+from jsonpath_ng import parser as _jsonpath_parser
+
+
+@_contextlib.contextmanager
+def memoized_parser() -> _Iterator[None]:
+    """Memoize JSONPath parsing within the context.
+
+    `jsonpath_ng.parse`, which is used by `pyserials` for every
+    template reference and recursive update, builds a new parser and lexer,
+    including their LALR tables and master regex, on every call.
+    Within this context, a single parser and lexer are reused,
+    and parsed expressions are cached, since they are never mutated.
+    """
+    original = _jsonpath.parse
+    parser = _jsonpath_parser.JsonPathParser()
+    lexer = _ReusableLexer()
+    lock = _threading.Lock()
+
+    @_functools.lru_cache(maxsize=None)
+    def parse(string: str):
+        with lock:
+            return parser.parse(string, lexer=lexer)
+
+    _jsonpath.parse = parse
+    try:
+        yield
+    finally:
+        _jsonpath.parse = original
+    return
+
+
+class _ReusableLexer(_jsonpath_lexer.JsonPathLexer):
+    """JSONPath lexer that builds its PLY lexer only once.
+
+    The original lexer builds a new PLY lexer for each string;
+    here, a prebuilt one is cloned instead.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lexer = _lex.lex(module=self, errorlog=_jsonpath_lexer.logger)
+        return
+
+    def tokenize(self, string):
+        new_lexer = self._lexer.clone()
+        new_lexer.latest_newline = 0
+        new_lexer.string_value = None
+        new_lexer.input(string)
+        while True:
+            t = new_lexer.token()
+            if t is None:
+                break
+            t.col = t.lexpos - new_lexer.latest_newline
+            yield t
+        if new_lexer.string_value is not None:
+            raise _jsonpath_exceptions.JsonPathLexerError("Unexpected EOF in string literal or identifier")
+        return
@@ -0,0 +1,165 @@
+"""Waiting for references on a git remote to point to expected commits."""
+
+from __future__ import annotations as _annotations
+
+import random as _random
+import subprocess as _subprocess
+import time as _time
+from pathlib import Path as _Path
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class RemoteRefWaiter:
+    """Waiter for references on a remote, polling `git ls-remote` with exponential backoff.
+
+    References whose commit is given by other sources
+    (e.g., the head commit of a pull request on GitHub)
+    can be waited for with `wait_for`.
+
+    Each wait checks the remote immediately, and then after increasing delays
+    (multiplied by `multiplier` after each attempt, up to `max_interval`,
+    and randomized by a factor of `1 ± jitter` to avoid synchronized polling),
+    returning as soon as the reference points to the expected commit,
+    or when `timeout` seconds have passed.
+    All waits are recorded, so the total time spent waiting can be reported.
+
+    Parameters
+    ----------
+    timeout
+        Maximum time of each wait, in seconds.
+    initial_interval
+        Delay after the first attempt, in seconds.
+    max_interval
+        Maximum delay between attempts, in seconds.
+    multiplier
+        Factor by which the delay is multiplied after each attempt.
+    jitter
+        Maximum relative random deviation of each delay.
+    sleep
+        Function to sleep for a number of seconds.
+    clock
+        Function returning a monotonic time in seconds.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 300,
+        initial_interval: float = 1,
+        max_interval: float = 30,
+        multiplier: float = 2,
+        jitter: float = 0.2,
+        sleep: Callable[[float], None] = _time.sleep,
+        clock: Callable[[], float] = _time.monotonic,
+    ):
+        self._timeout = timeout
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._sleep = sleep
+        self._clock = clock
+        self._waits: list[dict] = []
+        return
+
+    @property
+    def waits(self) -> list[dict]:
+        """Records of all waits, with the reference, commit hash, outcome, duration, and attempts."""
+        return self._waits
+
+    @property
+    def total_time(self) -> float:
+        """Total time spent in all waits, in seconds."""
+        return sum(wait["elapsed"] for wait in self._waits)
+
+    def wait(
+        self,
+        repo_path: str | _Path,
+        ref: str,
+        sha: str,
+        remote: str = "origin",
+    ) -> bool:
+        """Wait until a reference on a remote points to a commit.
+
+        Parameters
+        ----------
+        repo_path
+            Path to a local git repository with the remote.
+        ref
+            Full name of the reference, e.g., `refs/heads/main`.
+        sha
+            Full hash of the expected commit.
+        remote
+            Name or URL of the remote.
+
+        Returns
+        -------
+        Whether the reference pointed to the commit before the timeout.
+        """
+        return self.wait_for(
+            ref=ref,
+            sha=sha,
+            get_hash=lambda: self.remote_hash(repo_path=repo_path, ref=ref, remote=remote),
+        )
+
+    def wait_for(self, ref: str, sha: str, get_hash: Callable[[], str | None]) -> bool:
+        """Wait until a function returns the hash of a commit.
+
+        Parameters
+        ----------
+        ref
+            Name of the reference, used in the wait records.
+        sha
+            Full hash of the expected commit.
+        get_hash
+            Function returning the current commit hash of the reference,
+            or `None` if it is not available.
+
+        Returns
+        -------
+        Whether the function returned the commit hash before the timeout.
+        """
+        start = self._clock()
+        attempts = 0
+        interval = self._initial_interval
+        while True:
+            attempts += 1
+            found = get_hash() == sha
+            remaining = self._timeout - (self._clock() - start)
+            if found or remaining <= 0:
+                break
+            delay = interval * (1 + _random.uniform(-self._jitter, self._jitter))
+            self._sleep(max(0, min(delay, remaining)))
+            interval = min(interval * self._multiplier, self._max_interval)
+        self._waits.append(
+            {
+                "ref": ref,
+                "sha": sha,
+                "found": found,
+                "elapsed": self._clock() - start,
+                "attempts": attempts,
+            }
+        )
+        return found
+
+    @staticmethod
+    def remote_hash(repo_path: str | _Path, ref: str, remote: str = "origin") -> str | None:
+        """Get the commit hash of a reference on a remote,
+        or `None` if it does not exist or the remote cannot be reached.
+        """
+        process = _subprocess.run(
+            ["git", "ls-remote", "--", remote, ref],
+            cwd=_Path(repo_path),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if process.returncode != 0:
+            return None
+        for line in process.stdout.splitlines():
+            sha, name = line.split("\t", 1)
+            if name == ref:
+                return sha
+        return None
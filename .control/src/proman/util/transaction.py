@@ -0,0 +1,229 @@
+"""Transactional filesystem changes with a rollback journal."""
+
+from __future__ import annotations as _annotations
+
+import json as _json
+import os as _os
+import shutil as _shutil
+import stat as _stat
+from concurrent import futures as _futures
+from pathlib import Path as _Path
+
+from loggerman import logger as _logger
+
+_EXECUTABLE_BITS = _stat.S_IXUSR | _stat.S_IXGRP | _stat.S_IXOTH
+
+
+class FileTransaction:
+    """A set of filesystem changes that are applied all together, or not at all.
+
+    Changes are queued, and applied by `commit`.
+    Queued removals, moves, and directory creations are applied first, in order;
+    all file writes are applied afterwards.
+    New file contents are first written to temporary files in the journal directory,
+    which are then renamed into place; files whose content and mode would not change
+    are not touched.
+    Every step is recorded in a journal before it is applied,
+    and if any step fails, all applied steps are reverted in reverse order.
+    If the process is interrupted during a commit, the leftover journal
+    is rolled back at the beginning of the next commit (or by calling `recover`).
+
+    Parameters
+    ----------
+    journal_dir
+        Directory to store the journal, temporary files, and backups in.
+        It must be on the same filesystem as the changed files,
+        and is removed after each commit.
+    max_workers
+        Maximum number of threads for reading and writing files.
+    """
+
+    def __init__(self, journal_dir: str | _Path, max_workers: int = 8):
+        self._dir = _Path(journal_dir).resolve()
+        self._max_workers = max_workers
+        self._ops: list[tuple] = []
+        self._writes: list[tuple[_Path, bytes, bool]] = []
+        self._journal = None
+        self._backup_count = 0
+        return
+
+    def remove(self, path: str | _Path) -> None:
+        """Queue removal of a file or directory."""
+        self._ops.append(("remove", _Path(path)))
+        return
+
+    def move(self, source: str | _Path, destination: str | _Path) -> None:
+        """Queue moving a file or directory."""
+        self._ops.append(("move", _Path(source), _Path(destination)))
+        return
+
+    def mkdir(self, path: str | _Path) -> None:
+        """Queue creation of a directory and its missing parents."""
+        self._ops.append(("mkdir", _Path(path)))
+        return
+
+    def write(self, path: str | _Path, content: str | bytes, executable: bool = False) -> None:
+        """Queue writing a file, creating its parent directories as needed."""
+        if isinstance(content, str):
+            content = content.encode()
+        self._writes.append((_Path(path), content, executable))
+        return
+
+    def commit(self) -> dict[str, list[_Path]]:
+        """Apply all queued changes.
+
+        Returns
+        -------
+        Paths of written and unchanged files, under `written` and `unchanged` keys.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while applying the changes,
+            after all applied changes have been rolled back.
+        """
+        self.recover()
+        ops, writes = self._ops, self._writes
+        self._ops, self._writes = [], []
+        self._dir.mkdir(parents=True)
+        (self._dir / "staged").mkdir()
+        (self._dir / "backup").mkdir()
+        self._journal = open(self._dir / "journal.jsonl", "w")
+        try:
+            for op in ops:
+                getattr(self, f"_apply_{op[0]}")(*op[1:])
+            for directory in sorted({path.parent for path, _, _ in writes}):
+                self._apply_mkdir(directory)
+            with _futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="proman-file-write"
+            ) as executor:
+                staged = list(executor.map(self._stage, range(len(writes)), writes))
+            out = {"written": [], "unchanged": []}
+            for (path, _, _), staged_path in zip(writes, staged):
+                if staged_path:
+                    self._place(staged_path, path)
+                    out["written"].append(path)
+                else:
+                    out["unchanged"].append(path)
+        except BaseException:
+            self._journal.close()
+            self.recover()
+            raise
+        self._journal.close()
+        _shutil.rmtree(self._dir)
+        return out
+
+    def recover(self) -> bool:
+        """Roll back the changes of an unfinished commit, if any.
+
+        Returns
+        -------
+        Whether a journal was found and rolled back.
+        """
+        journal_path = self._dir / "journal.jsonl"
+        if not journal_path.is_file():
+            if self._dir.exists():
+                _shutil.rmtree(self._dir)
+            return False
+        entries = []
+        for line in journal_path.read_text().splitlines():
+            try:
+                entries.append(_json.loads(line))
+            except _json.JSONDecodeError:
+                # Incomplete last line of an interrupted write; its step was not yet applied.
+                break
+        for action, *args in reversed(entries):
+            paths = [_Path(arg) for arg in args]
+            if action == "backup":
+                path, backup_path = paths
+                if backup_path.exists() or backup_path.is_symlink():
+                    if path.is_dir() and not path.is_symlink():
+                        _shutil.rmtree(path)
+                    _os.replace(backup_path, path)
+            elif action == "create":
+                paths[0].unlink(missing_ok=True)
+            elif action == "mkdir":
+                try:
+                    paths[0].rmdir()
+                except OSError:
+                    pass
+            elif action == "move":
+                source, destination = paths
+                if destination.exists() and not source.exists():
+                    _os.replace(destination, source)
+        _shutil.rmtree(self._dir)
+        _logger.warning(
+            "File Transaction Rollback",
+            f"Rolled back {len(entries)} steps of an unfinished file transaction.",
+        )
+        return True
+
+    def _record(self, action: str, *paths: _Path) -> None:
+        self._journal.write(_json.dumps([action, *(str(path) for path in paths)]) + "\n")
+        self._journal.flush()
+        return
+
+    def _backup(self, path: _Path, keep: bool) -> None:
+        """Back up an existing path before it is replaced (`keep=True`) or removed."""
+        self._backup_count += 1
+        backup_path = self._dir / "backup" / str(self._backup_count)
+        self._record("backup", path, backup_path)
+        if not keep:
+            _os.replace(path, backup_path)
+            return
+        try:
+            _os.link(path, backup_path)
+        except OSError:
+            _shutil.copy2(path, backup_path)
+        return
+
+    def _apply_remove(self, path: _Path) -> None:
+        if path.exists() or path.is_symlink():
+            self._backup(path, keep=False)
+        return
+
+    def _apply_move(self, source: _Path, destination: _Path) -> None:
+        self._apply_mkdir(destination.parent)
+        if destination.exists():
+            self._apply_remove(destination)
+        self._record("move", source, destination)
+        _os.replace(source, destination)
+        return
+
+    def _apply_mkdir(self, path: _Path) -> None:
+        missing = []
+        while not path.exists():
+            missing.append(path)
+            path = path.parent
+        for directory in reversed(missing):
+            self._record("mkdir", directory)
+            directory.mkdir()
+        return
+
+    def _stage(self, idx: int, write: tuple[_Path, bytes, bool]) -> _Path | None:
+        """Write new content to a temporary file, unless the target already has it.
+
+        This is run on worker threads, and thus must not log or write to the journal.
+        """
+        path, content, executable = write
+        mode = None
+        if path.is_file():
+            mode = path.stat().st_mode
+            mode_unchanged = not executable or mode & _EXECUTABLE_BITS == _EXECUTABLE_BITS
+            if mode_unchanged and path.read_bytes() == content:
+                return None
+        staged_path = self._dir / "staged" / str(idx)
+        staged_path.write_bytes(content)
+        if mode is not None:
+            staged_path.chmod(_stat.S_IMODE(mode))
+        if executable:
+            staged_path.chmod(staged_path.stat().st_mode | _EXECUTABLE_BITS)
+        return staged_path
+
+    def _place(self, staged_path: _Path, path: _Path) -> None:
+        if path.exists() or path.is_symlink():
+            self._backup(path, keep=True)
+        else:
+            self._record("create", path)
+        _os.replace(staged_path, path)
+        return
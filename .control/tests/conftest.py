@@ -0,0 +1,8 @@
+import sys
+
+import actionman  # noqa: F401
+
+# On import, `actionman` replaces `sys.stdout` with a new wrapper of the buffer of pytest's capture file.
+# That wrapper must be kept alive, since it closes the shared buffer when garbage-collected
+# (i.e., when pytest restores `sys.stdout`), before pytest reads the captured output.
+_ACTIONMAN_STDOUT = sys.stdout
@@ -0,0 +1,139 @@
+"""Helpers for testing proman."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import Any
+
+
+class LocalGraphQLTransport:
+    """Local stand-in for the GitHub GraphQL endpoint, to be used as a batcher transport.
+
+    Each top-level field of a received document is answered
+    by the response registered for that field,
+    so that batching can be exercised without network access.
+
+    Parameters
+    ----------
+    responses
+        Mapping of top-level fields (as passed to `GraphQLBatcher.add`)
+        to their response data. Fields without a registered response
+        are answered with a GraphQL error.
+    interfaces
+        Mapping of top-level field names (e.g., `repositoryOwner`)
+        to the fields of the interface type they return.
+        Like GitHub, a document selecting any other field of these
+        outside an inline fragment (i.e., `... on Type { ... }`)
+        is rejected as a whole, with an `undefinedField` error and no data.
+    """
+
+    def __init__(
+        self,
+        responses: Mapping[str, Any] | None = None,
+        interfaces: Mapping[str, Iterable[str]] | None = None,
+    ):
+        self.responses = dict(responses or {})
+        self.interfaces = {name: set(fields) for name, fields in (interfaces or {}).items()}
+        self.documents: list[str] = []
+        return
+
+    def __call__(self, document: str) -> dict:
+        self.documents.append(document)
+        fields = self._split(document)
+        errors = [error for alias, field in fields for error in self._validate(alias, field)]
+        if errors:
+            return {"errors": errors}
+        data = {}
+        for alias, field in fields:
+            if field in self.responses:
+                data[alias] = self.responses[field]
+            else:
+                data[alias] = None
+                errors.append(
+                    {"path": [alias], "message": f"No local response registered for '{field}'."}
+                )
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    def _validate(self, alias: str, field: str) -> list[dict]:
+        name = re.match(r"\w+", field).group()
+        interface_fields = self.interfaces.get(name)
+        if interface_fields is None:
+            return []
+        selection = "".join(char for char, depth in self._scan(field) if depth == 1)
+        selection = re.sub(r"\.\.\.\s*on\s+\w+", "", selection)
+        return [
+            {
+                "path": ["query", alias, name, selected],
+                "extensions": {"code": "undefinedField", "fieldName": selected},
+                "message": f"Field '{selected}' doesn't exist on the interface of '{name}'",
+            }
+            for selected in re.findall(r"\w+", selection)
+            if selected not in interface_fields
+        ]
+
+    @staticmethod
+    def _scan(text: str) -> Iterator[tuple[str, int]]:
+        """Yield each character outside strings and arguments, along with its nesting depth of braces."""
+        depth = 0
+        args_depth = 0
+        in_string = False
+        for idx, char in enumerate(text):
+            if char == '"' and text[idx - 1] != "\\":
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif char in "()":
+                args_depth += 1 if char == "(" else -1
+            elif args_depth:
+                continue
+            elif char in "{}":
+                depth += 1 if char == "{" else -1
+            else:
+                yield char, depth
+        return
+
+    @staticmethod
+    def _split(document: str) -> list[tuple[str, str]]:
+        body = document.strip().removeprefix("query").strip()[1:-1]
+        fields = []
+        depth = 0
+        in_string = False
+        start = 0
+        for idx, char in enumerate(body):
+            if char == '"' and body[idx - 1] != "\\":
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif char in "({":
+                depth += 1
+            elif char in ")}":
+                depth -= 1
+                if depth == 0 and char == "}":
+                    alias, field = body[start : idx + 1].split(":", 1)
+                    fields.append((alias.strip(), field.strip()))
+                    start = idx + 1
+        return fields
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleeping, running a callback on each sleep."""
+
+    def __init__(self, on_sleep=None):
+        self.now = 0.0
+        self.sleeps = []
+        self._on_sleep = on_sleep
+        return
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self._on_sleep:
+            self._on_sleep(len(self.sleeps))
+        return
@@ -0,0 +1,96 @@
+from helpers import LocalGraphQLTransport
+
+from proman.github_api import BatchedRepoAPI, GraphQLBatcher
+
+
+class FakeRepoAPI:
+    """REST repository API stand-in, recording the called methods."""
+
+    username = "owner"
+    name = "repo"
+
+    def __init__(self):
+        self.calls = []
+        return
+
+    @property
+    def labels(self):
+        self.calls.append("labels")
+        return [{"id": 1, "name": "rest-label"}]
+
+    def label_create(self, **kwargs):
+        self.calls.append("label_create")
+        return kwargs
+
+
+def _field(payload: str) -> str:
+    return f'repository(owner: "owner", name: "repo") {{{payload}}}'
+
+
+def test_batcher_sends_pending_queries_in_one_document():
+    transport = LocalGraphQLTransport({"a {id}": {"id": 1}, "b {id}": {"id": 2}})
+    batcher = GraphQLBatcher(transport=transport)
+    request_a = batcher.add("a {id}")
+    request_b = batcher.add("b {id}")
+    assert batcher.add("a {id}") is request_a
+    assert request_a.result() == {"id": 1}
+    assert request_b.result() == {"id": 2}
+    assert len(transport.documents) == 1
+    assert batcher.stats == {"queries": 2, "requests": 1}
+
+
+def test_batcher_splits_documents_and_reports_errors_per_query():
+    transport = LocalGraphQLTransport({f"f{idx} {{id}}": {"id": idx} for idx in range(4)})
+    batcher = GraphQLBatcher(transport=transport, max_fields=3)
+    requests = [batcher.add(f"f{idx} {{id}}") for idx in range(5)]
+    batcher.flush()
+    assert len(transport.documents) == 2
+    assert [request.data for request in requests[:4]] == [{"id": idx} for idx in range(4)]
+    assert requests[4].data is None
+    assert requests[4].errors[0]["path"] == ["q1"]
+
+
+def test_batcher_reports_rejected_documents_to_all_queries():
+    transport = LocalGraphQLTransport(
+        {"owner {login}": {"login": "a"}, "owner {login name}": {"login": "a", "name": "A"}},
+        interfaces={"owner": ["login"]},
+    )
+    batcher = GraphQLBatcher(transport=transport)
+    requests = [batcher.add("owner {login}"), batcher.add("owner {login name}")]
+    batcher.flush()
+    assert [request.data for request in requests] == [None, None]
+    for request in requests:
+        assert request.errors[0]["extensions"]["code"] == "undefinedField"
+        assert request.errors[0]["path"] == ["query", "q1", "owner", "name"]
+
+
+def test_unavailable_batcher_fails_without_requests():
+    transport = LocalGraphQLTransport()
+    request = GraphQLBatcher(transport=transport, available=False).add("a {id}")
+    assert request.done and request.data is None and request.errors
+    assert transport.documents == []
+
+
+def test_repo_api_labels_via_graphql_and_rest_fallback():
+    label = {"id": "LA_1", "name": "bug", "color": "d73a4a", "description": "", "isDefault": True}
+    fields = "pageInfo {hasNextPage} nodes {id name color description isDefault}"
+    transport = LocalGraphQLTransport(
+        {
+            _field(f"labels(first: 100) {{{fields}}}"): {
+                "labels": {"pageInfo": {"hasNextPage": False}, "nodes": [label]}
+            }
+        }
+    )
+    rest_api = FakeRepoAPI()
+    api = BatchedRepoAPI(rest_api, GraphQLBatcher(transport=transport))
+    labels = api.labels
+    assert labels[0]["node_id"] == "LA_1" and labels[0]["default"] is True
+    assert "id" not in labels[0]
+    assert api.labels == labels
+    assert len(transport.documents) == 1 and rest_api.calls == []
+    # Writes invalidate memoized results.
+    api.label_create(name="new")
+    assert rest_api.calls == ["label_create"]
+    transport.responses.clear()
+    assert api.labels == [{"id": 1, "name": "rest-label"}]
+    assert rest_api.calls == ["label_create", "labels"]
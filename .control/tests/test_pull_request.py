@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+from helpers import FakeClock, LocalGraphQLTransport
+
+from proman.event_handler.pull_request import PullRequestEventHandler
+from proman.github_api import BatchedRepoAPI, GraphQLBatcher
+from proman.util.remote_ref import RemoteRefWaiter
+
+
+class FakePullAPI:
+    """REST repository API stand-in, where each read of a pull request returns the next head commit."""
+
+    username = "owner"
+    name = "repo"
+
+    def __init__(self, heads: list[str]):
+        self.heads = heads
+        self.reads = 0
+        return
+
+    def pull(self, number: int) -> dict:
+        self.reads += 1
+        return {"number": number, "head": {"sha": self.heads[min(self.reads, len(self.heads)) - 1]}}
+
+
+def _handler(api: BatchedRepoAPI, clock: FakeClock) -> SimpleNamespace:
+    return SimpleNamespace(
+        _gh_api=api,
+        pull=SimpleNamespace(number=1),
+        _ref_waiter=RemoteRefWaiter(timeout=10, jitter=0, sleep=clock.sleep, clock=clock),
+        _report_wait=lambda **kwargs: None,
+    )
+
+
+def test_wait_for_pull_head_polls_past_memoized_pull():
+    rest_api = FakePullAPI(heads=["old", "old", "new"])
+    api = BatchedRepoAPI(rest_api, GraphQLBatcher(transport=LocalGraphQLTransport()))
+    # The pull request is read (and memoized) before the push.
+    assert api.pull(1)["head"]["sha"] == "old"
+    clock = FakeClock()
+    handler = _handler(api, clock)
+    assert PullRequestEventHandler._wait_for_pull_head(handler, sha="new")
+    assert rest_api.reads == 3
+    assert handler._ref_waiter.waits[0]["attempts"] == 2
+
+
+def test_wait_for_pull_head_times_out():
+    rest_api = FakePullAPI(heads=["old"])
+    api = BatchedRepoAPI(rest_api, GraphQLBatcher(transport=LocalGraphQLTransport()))
+    clock = FakeClock()
+    handler = _handler(api, clock)
+    assert not PullRequestEventHandler._wait_for_pull_head(handler, sha="new")
+    assert clock.now == 10
@@ -0,0 +1,87 @@
+import subprocess
+
+import pytest
+from helpers import FakeClock
+
+from proman.util.remote_ref import RemoteRefWaiter
+
+
+def _git(path, *args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=path, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Local repository with a bare remote, and two commits on `main` that are not pushed."""
+    remote = tmp_path / "remote.git"
+    local = tmp_path / "local"
+    _git(tmp_path, "init", "--bare", "--quiet", str(remote))
+    _git(tmp_path, "init", "--quiet", "--initial-branch=main", str(local))
+    _git(local, "remote", "add", "origin", str(remote))
+    _git(local, "config", "user.name", "Test")
+    _git(local, "config", "user.email", "test@example.com")
+    for message in ("first", "second"):
+        _git(local, "commit", "--quiet", "--allow-empty", "--message", message)
+    return local
+
+
+def _waiter(clock: FakeClock, **kwargs) -> RemoteRefWaiter:
+    return RemoteRefWaiter(jitter=0, sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def test_wait_returns_immediately_when_ref_is_up_to_date(repo):
+    _git(repo, "push", "--quiet", "origin", "main")
+    clock = FakeClock()
+    waiter = _waiter(clock)
+    assert waiter.wait(repo_path=repo, ref="refs/heads/main", sha=_git(repo, "rev-parse", "HEAD"))
+    assert clock.sleeps == []
+    assert waiter.waits[0]["attempts"] == 1
+
+
+def test_wait_polls_with_backoff_until_pushed(repo):
+    _git(repo, "push", "--quiet", "origin", "HEAD~1:refs/heads/main")
+    head = _git(repo, "rev-parse", "HEAD")
+
+    def push_on_third_sleep(count):
+        if count == 3:
+            _git(repo, "push", "--quiet", "origin", "main")
+        return
+
+    clock = FakeClock(on_sleep=push_on_third_sleep)
+    waiter = _waiter(clock, initial_interval=1, multiplier=2, max_interval=3)
+    assert waiter.wait(repo_path=repo, ref="refs/heads/main", sha=head)
+    assert clock.sleeps == [1, 2, 3]
+    assert waiter.waits == [
+        {"ref": "refs/heads/main", "sha": head, "found": True, "elapsed": 6, "attempts": 4}
+    ]
+
+
+def test_wait_times_out(repo):
+    _git(repo, "push", "--quiet", "origin", "HEAD~1:refs/heads/main")
+    clock = FakeClock()
+    waiter = _waiter(clock, timeout=10, initial_interval=4, multiplier=2)
+    head = _git(repo, "rev-parse", "HEAD")
+    assert not waiter.wait(repo_path=repo, ref="refs/heads/main", sha=head)
+    # The last delay is cut to the remaining time.
+    assert clock.sleeps == [4, 6]
+    assert waiter.waits[0]["found"] is False
+    assert waiter.total_time == 10
+
+
+def test_missing_ref_and_remote(repo):
+    assert RemoteRefWaiter.remote_hash(repo_path=repo, ref="refs/heads/missing") is None
+    assert RemoteRefWaiter.remote_hash(repo_path=repo, ref="refs/heads/main", remote="none") is None
+    clock = FakeClock()
+    waiter = _waiter(clock, timeout=1)
+    assert not waiter.wait(repo_path=repo, ref="refs/heads/missing", sha="0" * 40)
+    assert waiter.waits[0]["attempts"] == 2
+
+
+def test_wait_for_custom_source():
+    hashes = iter([None, "a" * 40, "b" * 40])
+    clock = FakeClock()
+    waiter = _waiter(clock)
+    assert waiter.wait_for(ref="refs/pull/1/head", sha="b" * 40, get_hash=lambda: next(hashes))
+    assert waiter.waits[0]["attempts"] == 3
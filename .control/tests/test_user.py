@@ -0,0 +1,80 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pyserials as ps
+from helpers import LocalGraphQLTransport
+
+from proman.github_api import GraphQLBatcher
+from proman.manager.user import _GITHUB_GRAPHQL_OWNER_FIELDS, UserManager
+
+# Fields of GitHub's `RepositoryOwner` interface
+_OWNER_INTERFACE_FIELDS = (
+    "__typename", "avatarUrl", "id", "login", "repositories", "repository", "resourcePath", "url"
+)
+
+
+def _user_manager(batcher: GraphQLBatcher) -> UserManager:
+    manager = SimpleNamespace(
+        git=SimpleNamespace(repo_path=Path()),
+        data=ps.NestedDict(
+            {"control": {"contributor": {"path": "contributors.json"}}, "contributor": {}}
+        ),
+        gh_api_actions=SimpleNamespace(batcher=batcher),
+    )
+    return UserManager(manager=manager)
+
+
+def _owner_field(login: str) -> str:
+    return f'repositoryOwner(login: "{login}") {{{_GITHUB_GRAPHQL_OWNER_FIELDS}}}'
+
+
+def test_github_users_via_graphql():
+    user = {
+        "__typename": "User",
+        "login": "octocat",
+        "id": "MDQ6VXNlcjU4MzIzMQ==",
+        "url": "https://github.com/octocat",
+        "avatarUrl": "https://avatars.githubusercontent.com/u/583231?v=4",
+        "databaseId": 583231,
+        "name": "The Octocat",
+        "websiteUrl": "github.blog",
+        "location": "San Francisco",
+        "email": "",
+        "company": "@github",
+        "bio": None,
+        "socialAccounts": {
+            "nodes": [{"provider": "LINKEDIN", "url": "https://www.linkedin.com/in/octocat"}]
+        },
+    }
+    org = {
+        "__typename": "Organization",
+        "login": "github",
+        "id": "MDEyOk9yZ2FuaXphdGlvbjk5MTk=",
+        "url": "https://github.com/github",
+        "avatarUrl": "https://avatars.githubusercontent.com/u/9919?v=4",
+        "databaseId": 9919,
+        "name": "GitHub",
+        "websiteUrl": "https://github.com/about",
+        "location": "San Francisco, CA",
+        "email": None,
+    }
+    # Selecting fields of `User` or `Organization` outside their fragments
+    # makes the transport reject the whole document, and the query return nothing.
+    transport = LocalGraphQLTransport(
+        {_owner_field("octocat"): user, _owner_field("github"): org},
+        interfaces={"repositoryOwner": _OWNER_INTERFACE_FIELDS},
+    )
+    users = _user_manager(GraphQLBatcher(transport=transport))._get_github_users_graphql(
+        ["octocat", "github"]
+    )
+    assert len(transport.documents) == 1
+    octocat = users[("id", "octocat")]
+    assert octocat["id"] == 583231 and octocat["type"] == "User"
+    assert octocat["avatar_url"] == user["avatarUrl"]
+    assert octocat["blog"] == "https://github.blog" and octocat["email"] is None
+    assert octocat["socials"] == {
+        "linkedin": {"id": "octocat", "url": "https://linkedin.com/in/octocat"}
+    }
+    github = users[("id", "github")]
+    assert github["id"] == 9919 and github["type"] == "Organization"
+    assert github["avatar_url"] == org["avatarUrl"] and github["socials"] == {}
@@ -7,6 +7,7 @@
 
 import argparse
 import json
+import os
 import sys
 from typing import TYPE_CHECKING
 
@@ -61,7 +62,11 @@ def main() -> int:
     cli_logo: str = ""
     # AUTOCODE END: cli
     parser = argparse.ArgumentParser(description=cli_description)
-    parser.add_argument("--pyargs", help="Pyargs argument")
+    parser.add_argument(
+        "--pyargs",
+        default=os.environ.get("TESTSUITE_PYARGS") or None,
+        help="Pyargs argument; defaults to the 'TESTSUITE_PYARGS' environment variable",
+    )
     parser.add_argument("--args", help="Args argument")
     parser.add_argument("--overrides", help="Overrides argument")
     parser.add_argument("--cache", help="Cache argument")